@@ -0,0 +1 @@
+"""Benchmarks for the MCP client and server"""
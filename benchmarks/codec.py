@@ -0,0 +1,140 @@
+"""
+JSON codec microbenchmark: encode/decode cost per JSON-RPC message
+
+Usage:
+    python -m benchmarks.codec
+    python -m benchmarks.codec --number 20000 --output codec.json
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mcp import types
+
+from src.common.codec import available_codecs, get_codec
+
+# What mcp's HTTP/SSE client POST and HTTP server body parsing do today
+STDLIB_BASELINE = "stdlib+pydantic"
+
+
+def sample_messages() -> Dict[str, types.JSONRPCMessage]:
+    """Typical frames of a high-rate `add` workload, plus a catalog listing"""
+    add_schema = {
+        "type": "object",
+        "properties": {"a": {"type": "integer"}, "b": {"type": "integer"}},
+        "required": ["a", "b"],
+    }
+    result = types.CallToolResult(
+        content=[types.TextContent(type="text", text="3")], structuredContent={"result": 3}
+    )
+    tools = types.ListToolsResult(
+        tools=[
+            types.Tool(name=name, description=f"{name.title()} two numbers", inputSchema=add_schema)
+            for name in ("add", "multiply", "subtract", "divide", "power", "modulo")
+        ]
+    )
+    dump = dict(by_alias=True, mode="json", exclude_none=True)
+    return {
+        "tools/call request": types.JSONRPCMessage(
+            types.JSONRPCRequest(
+                jsonrpc="2.0",
+                id=42,
+                method="tools/call",
+                params={"name": "add", "arguments": {"a": 1, "b": 2}, "_meta": {"progressToken": 42}},
+            )
+        ),
+        "tools/call result": types.JSONRPCMessage(
+            types.JSONRPCResponse(jsonrpc="2.0", id=42, result=result.model_dump(**dump))
+        ),
+        "tools/list result": types.JSONRPCMessage(
+            types.JSONRPCResponse(jsonrpc="2.0", id=1, result=tools.model_dump(**dump))
+        ),
+    }
+
+
+def per_call_us(fn: Callable[[], object], number: int, repeat: int) -> float:
+    """Best-of-`repeat` mean time of `fn` in microseconds, as timeit reports"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - started)
+    return best / number * 1e6
+
+
+def _codecs() -> Dict[str, Dict[str, Callable]]:
+    dump = dict(by_alias=True, mode="json", exclude_none=True)
+    codecs = {
+        STDLIB_BASELINE: {
+            "encode": lambda message: json.dumps(message.model_dump(**dump), separators=(",", ":")).encode(),
+            "decode": lambda data: types.JSONRPCMessage.model_validate(json.loads(data)),
+        }
+    }
+    for name in available_codecs():
+        codec = get_codec(name)
+        codecs[name] = {"encode": codec.encode_message, "decode": codec.decode_message}
+    return codecs
+
+
+def run_codec_benchmark(number: int = 20000, repeat: int = 5) -> Dict[str, object]:
+    """Encode/decode time per message kind for every installed codec"""
+    codecs = _codecs()
+    report: Dict[str, object] = {
+        "python": sys.version.split()[0],
+        "number": number,
+        "codecs": list(codecs),
+        "messages": {},
+    }
+    for kind, message in sample_messages().items():
+        data = codecs["json"]["encode"](message)
+        rows = {}
+        for name, codec in codecs.items():
+            rows[name] = {
+                "encode_us": per_call_us(lambda: codec["encode"](message), number, repeat),
+                "decode_us": per_call_us(lambda: codec["decode"](data), number, repeat),
+            }
+        for name, row in rows.items():
+            for base in (STDLIB_BASELINE, "json"):
+                row[f"saved_vs_{base}_us"] = (
+                    rows[base]["encode_us"] + rows[base]["decode_us"] - row["encode_us"] - row["decode_us"]
+                )
+        report["messages"][kind] = {"bytes": len(data), "codecs": rows}
+    return report
+
+
+def print_report(report: Dict[str, object]):
+    """One table per message kind; savings are encode+decode per message"""
+    for kind, entry in report["messages"].items():
+        print(f"✉️  {kind} ({entry['bytes']} bytes)")
+        print(f"  {'codec':<16} {'encode':>9} {'decode':>9} {'saved vs stdlib':>16} {'saved vs json':>14}")
+        for name, row in entry["codecs"].items():
+            print(
+                f"  {name:<16} {row['encode_us']:7.2f}us {row['decode_us']:7.2f}us "
+                f"{row[f'saved_vs_{STDLIB_BASELINE}_us']:14.2f}us {row['saved_vs_json_us']:12.2f}us"
+            )
+    print(f"\n'json' is the pydantic-core path mcp's stdio transport uses; '{STDLIB_BASELINE}' is its HTTP path")
+
+
+def main(argv: Optional[List[str]] = None):
+    """mcp-codec-bench entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark JSON codecs on JSON-RPC messages")
+    parser.add_argument("--number", type=int, default=20000, help="Calls per timing loop")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing loops; the fastest is kept")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_codec_benchmark(args.number, args.repeat)
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Response compression benchmark: bytes saved against CPU spent, per payload size
+
+Every payload is a JSON-RPC reply framed as the SSE event the HTTP
+transports send. For each link speed the net gain is the transfer time
+saved minus the time to compress and decompress; negative means the body
+is better sent as is.
+
+Usage:
+    python -m benchmarks.compression
+    python -m benchmarks.compression --links 10,100,1000 --output compression.json
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.common.compression import DEFAULT_LEVELS, available_encodings, compress
+from src.server.compression import CompressionPolicy
+
+# Mbit/s: a slow WAN link, a typical cross-region link, a LAN
+DEFAULT_LINKS = (10.0, 100.0, 1000.0)
+
+
+def _records(n: int, seed: int = 0) -> List[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": i,
+            "name": f"item-{rng.randrange(10**6):06d}",
+            "status": rng.choice(["active", "pending", "archived"]),
+            "price": round(rng.uniform(1, 500), 2),
+            "tags": rng.sample(["red", "green", "blue", "small", "large", "new", "sale"], 2),
+            "updated": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z",
+        }
+        for i in range(n)
+    ]
+
+
+def _sse(result: dict) -> bytes:
+    message = {"jsonrpc": "2.0", "id": 7, "result": result}
+    return b"event: message\r\ndata: " + json.dumps(message, separators=(",", ":")).encode() + b"\r\n\r\n"
+
+
+def _text_result(text: str) -> dict:
+    return {"content": [{"type": "text", "text": text}], "isError": False}
+
+
+def sample_payloads() -> Dict[str, bytes]:
+    """Replies from an `add` result up to a 1 MB resource"""
+    schema = {"type": "object", "properties": {"a": {"type": "integer"}, "b": {"type": "integer"}}, "required": ["a", "b"]}
+    tools = [{"name": f"tool_{i}", "description": f"Tool number {i} of the catalog", "inputSchema": schema} for i in range(40)]
+    return {
+        "add result": _sse({**_text_result("3"), "structuredContent": {"result": 3}}),
+        "tools/list (40 tools)": _sse({"tools": tools}),
+        "tool output (100 rows)": _sse(_text_result(json.dumps(_records(100)))),
+        "resource (1k rows)": _sse({"contents": [{"uri": "data://rows", "text": json.dumps(_records(1000))}]}),
+        "resource (8k rows)": _sse({"contents": [{"uri": "data://rows", "text": json.dumps(_records(8000))}]}),
+    }
+
+
+def _decoders() -> Dict[str, Callable[[bytes], bytes]]:
+    decoders = {"gzip": lambda data: zlib.decompress(data, 16 + zlib.MAX_WBITS)}
+    if "br" in available_encodings():
+        try:
+            import brotli
+        except ImportError:
+            import brotlicffi as brotli
+        decoders["br"] = brotli.decompress
+    if "zstd" in available_encodings():
+        import zstandard
+
+        decoders["zstd"] = lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return decoders
+
+
+def per_call_us(fn: Callable[[], object], budget: float = 0.2, repeat: int = 3) -> float:
+    """Best-of-`repeat` mean time of `fn` in microseconds over about `budget` seconds each"""
+    started = time.perf_counter()
+    fn()
+    number = max(int(budget / max(time.perf_counter() - started, 1e-7)), 1)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - started)
+    return best / number * 1e6
+
+
+def _variants(levels: bool) -> List[Tuple[str, int]]:
+    variants = []
+    for encoding in available_encodings():
+        default = DEFAULT_LEVELS[encoding]
+        extra = {"gzip": (6, 9), "br": (1, 9), "zstd": (1, 10)}[encoding] if levels else ()
+        variants += [(encoding, level) for level in sorted({default, *extra})]
+    return variants
+
+
+def run_compression_benchmark(links: Tuple[float, ...] = DEFAULT_LINKS, levels: bool = True) -> Dict[str, object]:
+    """Size, CPU time and net gain per link speed for every payload and coding"""
+    decoders = _decoders()
+    report: Dict[str, object] = {
+        "python": sys.version.split()[0],
+        "encodings": list(available_encodings()),
+        "minimum_size": CompressionPolicy().minimum_size,
+        "links_mbit": list(links),
+        "payloads": {},
+    }
+    for kind, body in sample_payloads().items():
+        rows = {}
+        for encoding, level in _variants(levels):
+            data = compress(body, encoding, level)
+            decode = decoders[encoding]
+            assert decode(data) == body
+            row = {
+                "bytes": len(data),
+                "ratio": len(body) / len(data),
+                "compress_us": per_call_us(lambda: compress(body, encoding, level)),
+                "decompress_us": per_call_us(lambda: decode(data)),
+            }
+            cpu = row["compress_us"] + row["decompress_us"]
+            for mbit in links:
+                saved_us = (len(body) - len(data)) * 8 / mbit
+                row[f"net_gain_us@{mbit:g}"] = saved_us - cpu
+            rows[f"{encoding}-{level}"] = row
+        report["payloads"][kind] = {"bytes": len(body), "codings": rows}
+    return report
+
+
+def print_report(report: Dict[str, object]):
+    """One table per payload; net gain is transfer time saved minus CPU, per link speed"""
+    links = report["links_mbit"]
+    gain_headers = " ".join(f"{f'gain@{mbit:g}Mb':>12}" for mbit in links)
+    for kind, entry in report["payloads"].items():
+        skipped = " (below threshold: sent as is)" if entry["bytes"] < report["minimum_size"] else ""
+        print(f"📦 {kind}: {entry['bytes']} bytes{skipped}")
+        print(f"  {'coding':<9} {'bytes':>9} {'ratio':>6} {'compress':>11} {'decompress':>11} {gain_headers}")
+        for name, row in entry["codings"].items():
+            gains = " ".join(f"{row[f'net_gain_us@{mbit:g}']:10.0f}us" for mbit in links)
+            print(
+                f"  {name:<9} {row['bytes']:9d} {row['ratio']:5.1f}x "
+                f"{row['compress_us']:9.1f}us {row['decompress_us']:9.1f}us {gains}"
+            )
+    missing = [e for e in ("zstd", "br") if e not in report["encodings"]]
+    if missing:
+        print(f"\n💡 {', '.join(missing)} not installed (pip install zstandard brotli)")
+
+
+def main(argv: Optional[List[str]] = None):
+    """mcp-compression-bench entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark response compression on MCP payloads")
+    parser.add_argument("--links", default=",".join(f"{mbit:g}" for mbit in DEFAULT_LINKS),
+                        help="Comma-separated link speeds in Mbit/s to compute the net gain for")
+    parser.add_argument("--default-levels", action="store_true", help="Only time each coding's default level")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    links = tuple(float(mbit) for mbit in args.links.split(","))
+    report = run_compression_benchmark(links, levels=not args.default_levels)
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
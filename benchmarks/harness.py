@@ -0,0 +1,374 @@
+"""
+Load-generation and latency benchmark for MCPClient across transports
+
+Usage:
+    python -m benchmarks.harness --transports stdio,sse,http --concurrency 8 --requests 2000
+    python -m benchmarks.harness --mix add=5,greet=3,config://app=2 --output results.json
+    python -m benchmarks.harness --baseline benchmarks/baseline.json --tolerance 0.15
+    python -m benchmarks.harness --transports inproc,unix,stdio,sse --concurrency 1   # sidecar latency
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.client.pool import PooledSession
+from src.client.unified_client import MCPClient
+from src.server.base_server import create_server
+
+TRANSPORTS = ("stdio", "sse", "http", "inproc", "unix")
+
+# Server transport started for each client transport
+SERVER_TRANSPORTS = {"sse": "sse", "http": "http"}
+
+# Arguments for the n-th call of each tool create_server registers. They differ
+# per call: the demo tools are @cached_tool, and repeated arguments would only
+# time memo hits
+DEFAULT_ARGUMENTS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "add": lambda n: {"a": n, "b": 5},
+    "multiply": lambda n: {"a": n, "b": 5},
+    "greet": lambda n: {"name": f"bench-{n}"},
+}
+
+# Numbers calls across warmups and runs, so no call repeats an earlier one's arguments
+_calls = itertools.count()
+
+# What memory_per_session_kb covers
+MEMORY_SCOPE = "client-side Python heap (tracemalloc) per open session; excludes the server and OS buffers"
+
+
+@dataclass
+class BenchConfig:
+    """What to run: transports, load shape and call mix"""
+
+    transports: List[str] = field(default_factory=lambda: ["stdio"])
+    concurrency: int = 8
+    requests: int = 1000
+    duration: Optional[float] = None
+    warmup: int = 50
+    setup_samples: int = 5
+    mix: Dict[str, float] = field(default_factory=lambda: {"add": 1.0, "multiply": 1.0, "greet": 1.0})
+    url: Optional[str] = None
+    port: int = 8765
+    socket_path: str = str(Path(tempfile.gettempdir()) / "mcp-bench.sock")
+    seed: int = 0
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse "add=5,greet=3,config://app=2" into operation weights"""
+    mix = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, sep, weight = part.rpartition("=")
+        mix[name if sep else weight] = float(weight) if sep else 1.0
+    if not mix:
+        raise ValueError("Call mix is empty")
+    return mix
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Linearly interpolated percentile of pre-sorted values (q in 0..100)"""
+    if not values:
+        return 0.0
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds"""
+    values = sorted(v * 1000 for v in latencies)
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": values[-1] if values else 0.0,
+    }
+
+
+def wait_for_port(host: str, port: int, timeout: float = 30.0):
+    """Block until something accepts connections on host:port"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Server did not start listening on {host}:{port}")
+
+
+@contextmanager
+def server_process(transport: str, port: int) -> Iterator[None]:
+    """Start an SSE/HTTP server subprocess for the duration of a run"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.server.launcher", "--transport", transport, "--port", str(port)],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port("127.0.0.1", port)
+        yield
+    finally:
+        process.terminate()
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def wait_for_socket(path: str, timeout: float = 30.0):
+    """Block until something accepts connections on a Unix socket"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.socket(socket.AF_UNIX) as sock:
+                sock.connect(path)
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Server did not start listening on {path}")
+
+
+@contextmanager
+def unix_server_process(path: str) -> Iterator[None]:
+    """Start a Unix socket server subprocess for the duration of a run"""
+    process = subprocess.Popen(
+        [sys.executable, str(ROOT / "run_unix_server.py"), "--path", path],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_socket(path)
+        yield
+    finally:
+        process.terminate()
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def client_options(transport: str, config: BenchConfig) -> Dict[str, object]:
+    """Connection options MCPClient needs to reach the benchmark server"""
+    if transport == "stdio":
+        return {"command": sys.executable, "args": [str(ROOT / "run_stdio_server.py")]}
+    if transport == "inproc":
+        # Built up front so its import and registration are not billed to a session
+        return {"server": create_server("MCP Server (in-process)")}
+    if transport == "unix":
+        return {"path": config.socket_path}
+    if config.url:
+        return {"url": config.url}
+    base = f"http://127.0.0.1:{config.port}"
+    return {"url": f"{base}/sse" if transport == "sse" else f"{base}/mcp"}
+
+
+async def measure_setup(client: MCPClient, samples: int) -> Tuple[List[float], float]:
+    """Time fresh connect + initialize, and client-side Python heap held per open session
+
+    Only allocations in this process are traced: server memory (or a stdio
+    child's) and kernel socket buffers are not included.
+    """
+    connect = client.connection_factory()
+    durations = []
+    sessions = []
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(samples):
+            started = time.perf_counter()
+            sessions.append(await PooledSession(connect).open())
+            durations.append(time.perf_counter() - started)
+        held = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+        for pooled in sessions:
+            await pooled.close()
+    return durations, held / max(samples, 1)
+
+
+async def run_operation(client: MCPClient, name: str, n: int = 0):
+    """Run the n-th operation of the call mix; resources are URIs, anything else a tool"""
+    if "://" in name:
+        return await client.read_resource(name, use_cache=False)
+    arguments = DEFAULT_ARGUMENTS.get(name)
+    result = await client.call_tool(name, arguments(n) if arguments else {})
+    if result.isError:
+        raise RuntimeError(result.content[0].text if result.content else "tool error")
+    return result
+
+
+async def run_load(client: MCPClient, config: BenchConfig) -> Dict[str, object]:
+    """Drive the call mix at the configured concurrency and collect latencies"""
+    rng = random.Random(config.seed)
+    names = list(config.mix)
+    weights = [config.mix[name] for name in names]
+    plan = iter(rng.choices(names, weights, k=config.requests)) if config.duration is None else None
+    deadline = time.perf_counter() + config.duration if config.duration else None
+    latencies: Dict[str, List[float]] = {name: [] for name in names}
+    errors: Dict[str, int] = {}
+
+    def next_operation() -> Optional[str]:
+        if deadline is not None:
+            return rng.choices(names, weights)[0] if time.perf_counter() < deadline else None
+        return next(plan, None)
+
+    async def worker():
+        while (name := next_operation()) is not None:
+            started = time.perf_counter()
+            try:
+                await run_operation(client, name, next(_calls))
+            except Exception as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                continue
+            latencies[name].append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(config.concurrency)))
+    elapsed = time.perf_counter() - started
+    completed = sum(len(v) for v in latencies.values())
+    return {
+        "requests": completed + sum(errors.values()),
+        "errors": errors,
+        "duration_s": elapsed,
+        "throughput_rps": completed / elapsed if elapsed else 0.0,
+        "latency_ms": summarize([v for values in latencies.values() for v in values]),
+        "per_operation": {name: summarize(values) for name, values in latencies.items() if values},
+    }
+
+
+async def bench_transport(transport: str, config: BenchConfig) -> Dict[str, object]:
+    """Benchmark one transport against an already running server"""
+    client = MCPClient(
+        transport,
+        min_sessions=config.concurrency,
+        max_sessions=config.concurrency,
+        cache_ttl=None,
+        **client_options(transport, config),
+    )
+    try:
+        setup, memory = await measure_setup(client, config.setup_samples)
+        await client.pool()
+        if config.warmup:
+            await run_load(client, BenchConfig(**{**asdict(config), "requests": config.warmup, "duration": None}))
+        report = await run_load(client, config)
+    finally:
+        await client.close()
+    return {
+        "transport": transport,
+        "concurrency": config.concurrency,
+        "mix": config.mix,
+        **report,
+        "connection_setup_ms": summarize(setup),
+        "memory_per_session_kb": memory / 1024,
+        "memory_scope": MEMORY_SCOPE,
+    }
+
+
+def run_benchmark(config: BenchConfig) -> Dict[str, object]:
+    """Benchmark every configured transport, starting servers as needed"""
+    results = {}
+    for transport in config.transports:
+        if transport in ("stdio", "inproc") or (config.url and transport in SERVER_TRANSPORTS):
+            results[transport] = asyncio.run(bench_transport(transport, config))
+        elif transport == "unix":
+            with unix_server_process(config.socket_path):
+                results[transport] = asyncio.run(bench_transport(transport, config))
+        else:
+            with server_process(SERVER_TRANSPORTS[transport], config.port):
+                results[transport] = asyncio.run(bench_transport(transport, config))
+    return {"python": sys.version.split()[0], "results": results}
+
+
+def compare(report: Dict[str, object], baseline: Dict[str, object], tolerance: float) -> List[str]:
+    """Regressions of throughput or tail latency beyond tolerance versus a baseline"""
+    regressions = []
+    for transport, current in report["results"].items():
+        previous = baseline.get("results", {}).get(transport)
+        if previous is None:
+            continue
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{transport}: throughput {current['throughput_rps']:.1f} rps "
+                f"< baseline {previous['throughput_rps']:.1f} rps"
+            )
+        for key in ("p95", "p99"):
+            now, then = current["latency_ms"][key], previous["latency_ms"][key]
+            if now > then * (1 + tolerance):
+                regressions.append(f"{transport}: {key} {now:.2f} ms > baseline {then:.2f} ms")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None):
+    """mcp-bench entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark MCPClient against create_server")
+    parser.add_argument("--transports", default="stdio", help="Comma separated: stdio,sse,http,inproc,unix")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--duration", type=float, help="Run for N seconds instead of --requests")
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--setup-samples", type=int, default=5)
+    parser.add_argument("--mix", default="add=1,multiply=1,greet=1", help="Weighted operations")
+    parser.add_argument("--url", help="Use an already running server instead of starting one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket-path", default=BenchConfig.socket_path, help="Unix socket for the unix transport")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Compare against a previous JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    transports = [t.strip() for t in args.transports.split(",") if t.strip()]
+    unknown = set(transports) - set(TRANSPORTS)
+    if unknown:
+        parser.error(f"Unknown transports: {', '.join(sorted(unknown))}")
+
+    config = BenchConfig(
+        transports=transports,
+        concurrency=args.concurrency,
+        requests=args.requests,
+        duration=args.duration,
+        warmup=args.warmup,
+        setup_samples=args.setup_samples,
+        mix=parse_mix(args.mix),
+        url=args.url,
+        port=args.port,
+        socket_path=args.socket_path,
+        seed=args.seed,
+    )
+    report = run_benchmark(config)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.tolerance)
+        for line in regressions:
+            print(f"❌ Regression: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
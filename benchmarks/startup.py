@@ -0,0 +1,164 @@
+"""
+Startup-time benchmark for the stdio server: import profile and time to first reply
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --samples 10 --top 20 --output startup.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from benchmarks.harness import summarize
+
+# Timed in a fresh interpreter: import the server package, then build the server
+CREATE_SERVER_SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+from src.server.base_server import create_server
+imported = time.perf_counter()
+create_server("startup-bench")
+created = time.perf_counter()
+print(json.dumps({"import_s": imported - started, "create_s": created - imported,
+                  "tools_imported": "src.server.tools" in sys.modules}))
+"""
+
+
+def import_profile(module: str = "src.server.base_server", top: int = 15) -> Dict[str, object]:
+    """Run `python -X importtime -c "import module"` and rank the slowest imports"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append(
+            {
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            }
+        )
+    return {
+        "module": module,
+        "total_ms": sum(row["cumulative_ms"] for row in rows if row["depth"] == 0),
+        "modules": len(rows),
+        "slowest_cumulative": sorted(rows, key=lambda row: -row["cumulative_ms"])[:top],
+        "slowest_self": sorted(rows, key=lambda row: -row["self_ms"])[:top],
+    }
+
+
+def create_server_time(env: Dict[str, str]) -> Dict[str, object]:
+    """Import and create_server cost in a fresh interpreter"""
+    completed = subprocess.run(
+        [sys.executable, "-c", CREATE_SERVER_SNIPPET],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+async def time_to_first_reply(env: Dict[str, str]) -> Dict[str, float]:
+    """Spawn run_stdio_server.py and time initialize, tools/list and the first call"""
+    params = StdioServerParameters(
+        command=sys.executable, args=[str(ROOT / "run_stdio_server.py")], env=env, cwd=str(ROOT)
+    )
+    with open(os.devnull, "w") as errlog:
+        started = time.perf_counter()
+        async with stdio_client(params, errlog=errlog) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                initialized = time.perf_counter()
+                await session.list_tools()
+                listed = time.perf_counter()
+                await session.call_tool("add", {"a": 1, "b": 2})
+                called = time.perf_counter()
+    return {
+        "initialize_s": initialized - started,
+        "list_tools_s": listed - started,
+        "first_call_s": called - started,
+    }
+
+
+def run_startup_benchmark(samples: int = 5, top: int = 15) -> Dict[str, object]:
+    """Cold (no schema cache) and warm startup timings plus an import profile"""
+    report: Dict[str, object] = {"python": sys.version.split()[0], "samples": samples}
+    with tempfile.TemporaryDirectory() as directory:
+        cache = Path(directory) / "tool-schemas.json"
+        env = {**os.environ, "MCP_SCHEMA_CACHE": str(cache), "PYTHONWARNINGS": "ignore"}
+        for label in ("cold", "warm"):
+            creates: List[Dict[str, object]] = []
+            replies: List[Dict[str, float]] = []
+            for _ in range(samples):
+                if label == "cold" and cache.exists():
+                    cache.unlink()
+                creates.append(create_server_time(env))
+                if label == "cold" and cache.exists():
+                    cache.unlink()
+                replies.append(asyncio.run(time_to_first_reply(env)))
+            report[label] = {
+                "import_ms": summarize([c["import_s"] for c in creates]),
+                "create_server_ms": summarize([c["create_s"] for c in creates]),
+                "tools_imported_at_startup": any(c["tools_imported"] for c in creates),
+                **{
+                    key.replace("_s", "_ms"): summarize([r[key] for r in replies])
+                    for key in ("initialize_s", "list_tools_s", "first_call_s")
+                },
+            }
+    report["imports"] = import_profile(top=top)
+    return report
+
+
+def print_report(report: Dict[str, object]):
+    """Human-readable summary, in the spirit of -X importtime"""
+    for label in ("cold", "warm"):
+        timings = report[label]
+        print(f"⏱️  {label} schema cache:")
+        for key in ("import_ms", "create_server_ms", "initialize_ms", "list_tools_ms", "first_call_ms"):
+            print(f"  {key:<18} p50 {timings[key]['p50']:8.1f} ms   max {timings[key]['max']:8.1f} ms")
+    imports = report["imports"]
+    print(f"\n📦 import {imports['module']}: {imports['total_ms']:.1f} ms over {imports['modules']} modules")
+    print(f"  {'cumulative':>10}  {'self':>8}  module")
+    for row in imports["slowest_cumulative"]:
+        print(f"  {row['cumulative_ms']:8.1f}ms  {row['self_ms']:6.1f}ms  {'  ' * row['depth']}{row['module']}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """mcp-startup-bench entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark stdio server startup")
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_startup_benchmark(args.samples, args.top)
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
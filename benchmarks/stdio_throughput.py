@@ -0,0 +1,129 @@
+"""
+Stdio throughput benchmark: pipelined calls over one session, line vs batched framing
+
+Usage:
+    python -m benchmarks.stdio_throughput
+    python -m benchmarks.stdio_throughput --requests 20000 --concurrency 1,16,64 --output stdio.json
+    python -m benchmarks.stdio_throughput --operation add
+
+`ping` isolates framing and dispatch. A tool call adds mcp's per-call
+JSON-schema validation, which costs more than the framing itself.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mcp import ClientSession, StdioServerParameters
+
+from benchmarks.harness import summarize
+from src.client.stdio_transport import stdio_client
+from src.common.framing import HIGH_THROUGHPUT, LINE_FRAMING, StdioFraming
+
+MODES: Dict[str, StdioFraming] = {"line": LINE_FRAMING, "batched": HIGH_THROUGHPUT}
+
+
+def server_parameters(framing: StdioFraming) -> StdioServerParameters:
+    args = [str(ROOT / "run_stdio_server.py")]
+    if framing.batched:
+        args += ["--batch-window", str(framing.batch_window), "--max-batch-bytes", str(framing.max_batch_bytes)]
+    env = {**os.environ, "PYTHONWARNINGS": "ignore"}
+    return StdioServerParameters(command=sys.executable, args=args, env=env, cwd=str(ROOT))
+
+
+async def pipelined_calls(
+    framing: StdioFraming, requests: int, concurrency: int, operation: str = "ping"
+) -> Dict[str, object]:
+    """Run `requests` pings or add calls with `concurrency` outstanding on one stdio session"""
+    latencies: List[float] = []
+    with open(os.devnull, "w") as errlog:
+        async with stdio_client(server_parameters(framing), errlog=errlog, framing=framing) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                for i in range(min(200, requests)):
+                    await session.call_tool("add", {"a": i, "b": 1})
+
+                remaining = requests
+
+                async def worker():
+                    nonlocal remaining
+                    while remaining > 0:
+                        remaining -= 1
+                        started = time.perf_counter()
+                        if operation == "ping":
+                            await session.send_ping()
+                        else:
+                            # Distinct arguments so the result cache does not short-circuit calls
+                            await session.call_tool("add", {"a": remaining, "b": concurrency})
+                        latencies.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
+                elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_ms": summarize(latencies),
+    }
+
+
+def run_stdio_benchmark(
+    requests: int = 5000, concurrency: List[int] = (1, 16, 64), operation: str = "ping"
+) -> Dict[str, object]:
+    """Line vs batched framing at every concurrency level"""
+    report: Dict[str, object] = {
+        "python": sys.version.split()[0],
+        "operation": operation,
+        "requests": requests,
+        "results": {},
+    }
+    for level in concurrency:
+        results = {
+            mode: asyncio.run(pipelined_calls(framing, requests, level, operation))
+            for mode, framing in MODES.items()
+        }
+        results["speedup"] = results["batched"]["throughput_rps"] / results["line"]["throughput_rps"]
+        report["results"][str(level)] = results
+    return report
+
+
+def print_report(report: Dict[str, object]):
+    """Throughput and latency per concurrency level"""
+    for level, results in report["results"].items():
+        print(f"🔀 {report['operation']}, concurrency {level}:")
+        for mode in MODES:
+            row = results[mode]
+            print(
+                f"  {mode:<8} {row['throughput_rps']:9.0f} req/s   "
+                f"p50 {row['latency_ms']['p50']:7.2f} ms   p99 {row['latency_ms']['p99']:7.2f} ms"
+            )
+        print(f"  speedup  {results['speedup']:.2f}x")
+
+
+def main(argv: Optional[List[str]] = None):
+    """mcp-stdio-bench entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark stdio framing throughput")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", default="1,16,64", help="Comma-separated outstanding-call levels")
+    parser.add_argument("--operation", choices=("ping", "add"), default="ping")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_stdio_benchmark(
+        args.requests, [int(level) for level in args.concurrency.split(",")], args.operation
+    )
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
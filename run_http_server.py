@@ -2,15 +2,52 @@
 Run MCP Server with Streamable HTTP transport
 """
 import sys
+import argparse
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.server.base_server import create_server
+from src.server.launcher import (
+    CrashLoopError,
+    add_server_arguments,
+    compression_from_args,
+    limits_from_args,
+    policy_from_args,
+    serve,
+)
+
+
+def main():
+    """Run the HTTP server, optionally across several workers"""
+    parser = add_server_arguments(argparse.ArgumentParser(description="Run the MCP server over HTTP"), "http")
+    args = parser.parse_args()
+
+    print(f"Starting HTTP server on http://{args.host}:{args.port}/mcp")
+    if args.workers > 1:
+        print(f"👷 Workers: {args.workers} (transport: {args.transport})")
+
+    try:
+        serve(
+            "MCP Server (HTTP)",
+            args.transport,
+            args.host,
+            args.port,
+            args.workers,
+            args.graceful_timeout,
+            limits=limits_from_args(args),
+            replay_buffer=args.replay_buffer,
+            retry_interval=args.retry_interval,
+            policy=policy_from_args(args),
+            compression=compression_from_args(args),
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+    except CrashLoopError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    mcp = create_server("MCP Server (HTTP)")
-    print("Starting HTTP server on http://127.0.0.1:8000")
-    mcp.run(transport="streamable-http", host="127.0.0.1", port=8000)
+    main()
@@ -3,27 +3,60 @@ Run MCP Server with MULTIPLE transports simultaneously
 Supports SSE and HTTP on the same server
 """
 import sys
+import argparse
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.server.base_server import create_server
+from src.server.launcher import (
+    CrashLoopError,
+    add_server_arguments,
+    compression_from_args,
+    limits_from_args,
+    policy_from_args,
+    serve,
+)
 
 
-if __name__ == "__main__":
-    mcp = create_server("MCP Multi-Transport Server")
+def main():
+    """Run the multi-transport server, optionally across several workers"""
+    parser = add_server_arguments(argparse.ArgumentParser(description="Run the MCP server"))
+    args = parser.parse_args()
     
     print("=" * 60)
     print("🚀 Starting MCP Server with MULTIPLE transports")
     print("=" * 60)
     print("\n📡 Available endpoints:")
-    print("  • SSE:  http://127.0.0.1:8000/sse")
-    print("  • HTTP: http://127.0.0.1:8000/mcp")
+    print(f"  • SSE:  http://{args.host}:{args.port}/sse")
+    print(f"  • HTTP: http://{args.host}:{args.port}/mcp")
+    if args.workers > 1:
+        print(f"\n👷 Workers: {args.workers} (transport: {args.transport})")
     print("\n💡 Clients can connect using either transport!")
     print("=" * 60)
     print()
     
-    # FastMCP automatically exposes both SSE and HTTP endpoints
-    # when using either transport
-    mcp.run(transport="sse", host="127.0.0.1", port=8000)
+    try:
+        serve(
+            "MCP Multi-Transport Server",
+            args.transport,
+            args.host,
+            args.port,
+            args.workers,
+            args.graceful_timeout,
+            limits=limits_from_args(args),
+            replay_buffer=args.replay_buffer,
+            retry_interval=args.retry_interval,
+            policy=policy_from_args(args),
+            compression=compression_from_args(args),
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+    except CrashLoopError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
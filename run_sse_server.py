@@ -8,9 +8,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.server.base_server import create_server
+from src.server.compression import compression_middleware
 
 
 if __name__ == "__main__":
     mcp = create_server("MCP Server (SSE)")
     print("Starting SSE server on http://127.0.0.1:8000/sse")
-    mcp.run(transport="sse", host="127.0.0.1", port=8000)
+    mcp.run(transport="sse", host="127.0.0.1", port=8000, middleware=compression_middleware())
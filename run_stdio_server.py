@@ -1,15 +1,33 @@
 """
 Run MCP Server with STDIO transport
+
+Usage:
+    python run_stdio_server.py
+    python run_stdio_server.py --batch-window 0.0005   # high-throughput batched framing
 """
+import argparse
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.common.framing import StdioFraming
 from src.server.base_server import create_server
+from src.server.stdio_transport import run_stdio
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the MCP server on stdin/stdout")
+    parser.add_argument(
+        "--batch-window",
+        type=float,
+        default=None,
+        help="Batch replies: write queued ones together, waiting up to this many seconds for more (0: no wait)",
+    )
+    parser.add_argument("--max-batch-bytes", type=int, default=64 * 1024, help="Byte budget of one batched write")
+    args = parser.parse_args()
+
     mcp = create_server("MCP Server (STDIO)")
-    mcp.run(transport="stdio")
+    # No banner (or its PyPI update check); JSON codec from MCP_JSON_CODEC, else the fastest installed
+    run_stdio(mcp, framing=StdioFraming(batch_window=args.batch_window, max_batch_bytes=args.max_batch_bytes))
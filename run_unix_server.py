@@ -0,0 +1,44 @@
+"""
+Run MCP Server on a Unix domain socket, for clients on the same host
+
+Usage:
+    python run_unix_server.py
+    python run_unix_server.py --path /run/mcp/mcp.sock
+"""
+import argparse
+import signal
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.common.framing import StdioFraming
+from src.server.base_server import create_server
+from src.server.unix_transport import run_unix
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the MCP server on a Unix domain socket")
+    parser.add_argument("--path", default="/tmp/mcp.sock", help="Socket file to listen on")
+    parser.add_argument(
+        "--batch-window",
+        type=float,
+        default=0.0,
+        help="Write queued replies together, waiting up to this many seconds for more",
+    )
+    parser.add_argument("--max-batch-bytes", type=int, default=64 * 1024, help="Byte budget of one batched write")
+    args = parser.parse_args()
+
+    mcp = create_server("MCP Server (Unix socket)")
+    print(f"🔌 Listening on {args.path}", file=sys.stderr)
+    # Shut down like Ctrl+C on SIGTERM, so the socket file is removed
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        framing = StdioFraming(batch_window=args.batch_window, max_batch_bytes=args.max_batch_bytes)
+        run_unix(mcp, args.path, framing=framing)
+    except KeyboardInterrupt:
+        pass
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
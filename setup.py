@@ -29,12 +29,23 @@ setup(
     ],
     python_requires=">=3.10",
     install_requires=[
-        "fastmcp>=2.0.0",
+        "fastmcp>=2.14.0,<3",
+        "mcp>=1.24.0,<2",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.9"],
+        "http2": ["h2>=3,<5"],
+        "compression": ["brotli", "zstandard"],
+    },
     entry_points={
         "console_scripts": [
             "mcp-client=run_client:main",
             "mcp-server=run_multi_server:main",
+            "mcp-bench=benchmarks.harness:main",
+            "mcp-startup-bench=benchmarks.startup:main",
+            "mcp-codec-bench=benchmarks.codec:main",
+            "mcp-compression-bench=benchmarks.compression:main",
+            "mcp-stdio-bench=benchmarks.stdio_throughput:main",
         ],
     },
 )
@@ -0,0 +1,102 @@
+"""
+Client-side cache for tool/resource listings and resource contents
+"""
+from typing import Any
+
+from mcp import types
+
+from ..common.ttl_cache import TTLCache
+
+
+class ResponseCache:
+    """Caches list_tools, list_resources and read_resource results per server
+
+    Entries are keyed by (server, kind[, uri]) and dropped when the server
+    announces a change through list-changed or resource-updated notifications.
+    """
+
+    TOOLS = "tools"
+    RESOURCES = "resources"
+    RESOURCE = "resource"
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Last etag-carrying read per resource, kept past ttl for conditional reads
+        self._validated = TTLCache(maxsize=maxsize, ttl=float("inf"))
+        # Last versioned tool/resource list per server, kept past ttl as the base for deltas
+        self._catalogs = TTLCache(maxsize=maxsize, ttl=float("inf"))
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    def get_tools(self, server: str):
+        return self._cache.get((server, self.TOOLS))
+
+    def set_tools(self, server: str, result: types.ListToolsResult):
+        self._cache.set((server, self.TOOLS), result)
+
+    def get_resources(self, server: str):
+        return self._cache.get((server, self.RESOURCES))
+
+    def set_resources(self, server: str, result: types.ListResourcesResult):
+        self._cache.set((server, self.RESOURCES), result)
+
+    def get_resource(self, server: str, uri: str):
+        return self._cache.get((server, self.RESOURCE, str(uri)))
+
+    def set_resource(self, server: str, uri: str, result: types.ReadResourceResult):
+        self._cache.set((server, self.RESOURCE, str(uri)), result)
+
+    def get_validated(self, server: str, uri: str):
+        return self._validated.get((server, str(uri)))
+
+    def set_validated(self, server: str, uri: str, result: types.ReadResourceResult):
+        self._validated.set((server, str(uri)), result)
+
+    def get_catalog(self, server: str, kind: str):
+        return self._catalogs.get((server, kind))
+
+    def set_catalog(self, server: str, kind: str, result):
+        self._catalogs.set((server, kind), result)
+
+    def invalidate_tools(self, server: str):
+        """Forget the cached tool list of a server"""
+        self._cache.pop((server, self.TOOLS))
+
+    def invalidate_resource(self, server: str, uri: str):
+        """Forget the cached contents of one resource"""
+        self._cache.pop((server, self.RESOURCE, str(uri)))
+
+    def invalidate_resources(self, server: str):
+        """Forget the resource list and every resource read from a server"""
+        self._cache.pop_where(
+            lambda key: key[0] == server and key[1] in (self.RESOURCES, self.RESOURCE)
+        )
+
+    def invalidate_server(self, server: str):
+        """Forget everything cached for a server"""
+        self._cache.pop_where(lambda key: key[0] == server)
+        self._validated.pop_where(lambda key: key[0] == server)
+        self._catalogs.pop_where(lambda key: key[0] == server)
+
+    def clear(self):
+        self._cache.clear()
+        self._validated.clear()
+        self._catalogs.clear()
+
+    def handle_notification(self, server: str, message: Any):
+        """Apply a server notification received by a ClientSession message handler"""
+        if not isinstance(message, types.ServerNotification):
+            return
+        notification = message.root
+        if isinstance(notification, types.ToolListChangedNotification):
+            self.invalidate_tools(server)
+        elif isinstance(notification, types.ResourceListChangedNotification):
+            self.invalidate_resources(server)
+        elif isinstance(notification, types.ResourceUpdatedNotification):
+            self.invalidate_resource(server, notification.params.uri)
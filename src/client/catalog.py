@@ -0,0 +1,60 @@
+"""
+Delta refresh of tool and resource lists from servers with a versioned catalog
+"""
+from typing import Optional, Union
+
+from mcp import ClientSession, types
+
+# _meta keys of tools/list and resources/list (see src.server.catalog)
+VERSION_KEY = "catalogVersion"
+SINCE_KEY = "catalogSince"
+DELTA_KEY = "delta"
+REMOVED_KEY = "removed"
+
+TOOLS = "tools"
+RESOURCES = "resources"
+
+ListResult = Union[types.ListToolsResult, types.ListResourcesResult]
+
+
+def catalog_version(result: Optional[ListResult]) -> Optional[str]:
+    """Version a list reply was served at, if the server versions its catalog"""
+    if result is None:
+        return None
+    return (result.meta or {}).get(VERSION_KEY)
+
+
+def _key(item) -> str:
+    return item.name if isinstance(item, types.Tool) else str(item.uri)
+
+
+def apply_delta(base: Optional[ListResult], result: ListResult) -> ListResult:
+    """The full list: ``result`` itself, or ``base`` with a delta reply applied
+
+    Changed entries keep their place, new ones are appended and removed
+    ones dropped.
+    """
+    meta = result.meta or {}
+    if not meta.get(DELTA_KEY) or base is None:
+        return result
+    kind = TOOLS if isinstance(result, types.ListToolsResult) else RESOURCES
+    removed = set(meta.get(REMOVED_KEY) or ())
+    changed = {_key(item): item for item in getattr(result, kind)}
+    merged = [changed.pop(_key(item), item) for item in getattr(base, kind) if _key(item) not in removed]
+    merged.extend(changed.values())
+    return type(result)(**{kind: merged}, _meta={VERSION_KEY: meta.get(VERSION_KEY)})
+
+
+async def list_since(session: ClientSession, kind: str, base: Optional[ListResult] = None) -> ListResult:
+    """List tools or resources, asking only for what changed since ``base``
+
+    Servers without a catalog ignore the request's ``_meta`` and send the
+    whole list, as do catalogs that no longer know ``base``'s version.
+    """
+    version = catalog_version(base)
+    params = types.PaginatedRequestParams(_meta={SINCE_KEY: version}) if version else None
+    if kind == TOOLS:
+        result = await session.list_tools(params=params)
+    else:
+        result = await session.list_resources(params=params)
+    return apply_delta(base, result)
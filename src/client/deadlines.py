@@ -0,0 +1,172 @@
+"""
+Per-call deadlines for tool calls and resource reads, and hedged tool calls
+"""
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+from mcp import ClientSession, types
+from mcp.shared.exceptions import McpError
+
+# Request _meta key with the remaining budget in milliseconds (see src.server.deadlines)
+DEADLINE_META = "timeoutMs"
+# The code mcp's ClientSession uses for requests that time out
+DEADLINE_EXCEEDED = 408
+
+T = TypeVar("T")
+
+
+def deadline_exceeded(timeout: Optional[float], what: str) -> McpError:
+    within = f"within {timeout:g}s" if timeout is not None else "in time"
+    return McpError(types.ErrorData(code=DEADLINE_EXCEEDED, message=f"Deadline exceeded: {what} did not finish {within}"))
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a ``time.monotonic()`` deadline"""
+    return None if deadline is None else deadline - time.monotonic()
+
+
+async def with_deadline(awaitable: Awaitable[T], timeout: Optional[float], what: str) -> T:
+    """Await with a time limit, cancelling the work and raising a 408 McpError when it runs out"""
+    if timeout is None:
+        return await awaitable
+    if timeout <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise deadline_exceeded(0, what)
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        raise deadline_exceeded(timeout, what) from None
+
+
+async def cancel_request(session: ClientSession, request_id: Any, reason: str):
+    """Tell the server to stop working on a request we no longer wait for"""
+    cancelled = types.CancelledNotification(params=types.CancelledNotificationParams(requestId=request_id, reason=reason))
+    try:
+        await session.send_notification(types.ClientNotification(cancelled))
+    except Exception:
+        pass
+
+
+def deadline_meta(timeout: Optional[float]) -> Dict[str, int]:
+    """Request ``_meta`` telling the server the remaining budget, if there is one"""
+    return {DEADLINE_META: max(int(timeout * 1000), 1)} if timeout is not None else {}
+
+
+async def call_tool_with_deadline(
+    session: ClientSession, name: str, arguments: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+) -> types.CallToolResult:
+    """``session.call_tool`` telling the server its budget, and cancelling it if abandoned
+
+    The time limit itself is enforced by the caller (``with_deadline``),
+    so that time spent waiting for a pooled session counts too.
+    """
+    meta = deadline_meta(timeout) or None
+    # send_request numbers the request synchronously with the session's counter
+    request_id = session._request_id
+    try:
+        return await session.call_tool(name, arguments or {}, meta=meta)
+    except asyncio.CancelledError:
+        await cancel_request(session, request_id, "Abandoned by the client")
+        raise
+
+
+@dataclass
+class HedgePolicy:
+    """When to send a second copy of a slow idempotent tool call
+
+    A call still unanswered after the ``percentile`` latency of recent calls
+    of the same tool (``delay`` until ``min_samples`` are known, never less
+    than ``min_delay``) is sent again on another session or replica. The
+    first answer wins and the other copies are cancelled.
+    """
+
+    percentile: float = 95.0
+    delay: float = 0.05
+    min_delay: float = 0.001
+    min_samples: int = 20
+    window: int = 256
+    max_hedges: int = 1
+
+
+class LatencyTracker:
+    """Recent successful latencies per key, for hedge delays"""
+
+    def __init__(self, window: int = 256):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, key: str, seconds: float):
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def percentile(self, key: str, q: float, min_samples: int = 1) -> Optional[float]:
+        samples = self._samples.get(key)
+        if not samples or len(samples) < min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+    def hedge_delay(self, key: str, policy: HedgePolicy) -> float:
+        observed = self.percentile(key, policy.percentile, policy.min_samples)
+        return max(observed if observed is not None else policy.delay, policy.min_delay)
+
+
+class HedgeStats:
+    """How often hedges were sent and how often they answered first"""
+
+    __slots__ = ("calls", "hedges", "wins")
+
+    def __init__(self):
+        self.calls = 0
+        self.hedges = 0
+        self.wins = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"calls": self.calls, "hedges": self.hedges, "wins": self.wins}
+
+
+async def hedged(
+    attempt: Callable[[int], Awaitable[T]], delay: float, max_hedges: int = 1, stats: Optional[HedgeStats] = None
+) -> T:
+    """Run ``attempt(0)``, adding ``attempt(1)``... each ``delay`` it stays unanswered
+
+    The first attempt to succeed wins and the others are cancelled. A
+    failure only counts once no other attempt is still running, so hedges
+    never turn into retries.
+    """
+    tasks: List[asyncio.Task] = [asyncio.ensure_future(attempt(0))]
+    pending = set(tasks)
+    first_error: Optional[BaseException] = None
+    if stats is not None:
+        stats.calls += 1
+    try:
+        while pending:
+            can_hedge = len(tasks) <= max_hedges
+            done, pending = await asyncio.wait(
+                pending, timeout=delay if can_hedge else None, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    if stats is not None and task is not tasks[0]:
+                        stats.wins += 1
+                    return task.result()
+                if first_error is None:
+                    first_error = task.exception()
+            if not done and can_hedge:
+                task = asyncio.ensure_future(attempt(len(tasks)))
+                tasks.append(task)
+                pending.add(task)
+                if stats is not None:
+                    stats.hedges += 1
+        raise first_error
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Let the losers send their cancellations before returning
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,72 @@
+"""
+Streamable-HTTP client transport on a shared keep-alive httpx client
+"""
+import importlib.util
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+import httpx
+from mcp.client.streamable_http import streamable_http_client
+
+from ..common.compression import accept_encoding
+
+# Same timeouts the MCP SDK uses: short connect/write, long reads for streamed replies
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, read=300.0)
+
+
+def http2_available() -> bool:
+    """Whether the optional h2 package (httpx[http2]) is installed"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def compression_headers(enabled: bool = True) -> Dict[str, str]:
+    """Accept-Encoding for every response coding httpx can decode here, or ``identity``"""
+    return {"Accept-Encoding": accept_encoding(enabled)}
+
+
+def create_http_client(
+    headers: Optional[Dict[str, str]] = None,
+    timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+    http2: Optional[bool] = None,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+    auth: Optional[httpx.Auth] = None,
+    compression: bool = True,
+) -> httpx.AsyncClient:
+    """HTTP client meant to be shared by every session to one or more servers
+
+    Connections are kept alive and reused between requests and sessions.
+    ``http2=None`` negotiates HTTP/2 when h2 is installed, so concurrent
+    requests multiplex over a single connection. ``compression`` asks
+    servers for gzip (br/zstd when installed) bodies, which httpx decodes
+    as they stream in.
+    """
+    if http2 is None:
+        http2 = http2_available()
+    headers = {**compression_headers(compression), **(headers or {})}
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        auth=auth,
+        follow_redirects=True,
+    )
+
+
+@asynccontextmanager
+async def streamable_http(url: str, http_client: httpx.AsyncClient, terminate_on_close: bool = True):
+    """Open an MCP session over streamable HTTP, yielding (read, write)
+
+    The session borrows ``http_client`` and leaves it open on exit, so the
+    caller owns it and can share it between many sessions.
+    """
+    async with streamable_http_client(
+        url, http_client=http_client, terminate_on_close=terminate_on_close
+    ) as (read, write, _get_session_id):
+        yield read, write
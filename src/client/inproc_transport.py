@@ -0,0 +1,86 @@
+"""
+In-process transport: a client session wired straight to a FastMCP server object
+"""
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import anyio
+from fastmcp import FastMCP
+from mcp.server.lowlevel import NotificationOptions
+from mcp.shared.memory import create_client_server_memory_streams
+
+
+class _SharedLifespan:
+    """Keeps a server's lifespan entered while any in-process session is open
+
+    FastMCP's own lifespan manager is a no-op when the lifespan is already
+    running, and exiting whichever entered first tears it down for every
+    session. Here the lifespan runs in its own task and ends with the last
+    session instead.
+    """
+
+    def __init__(self, mcp: FastMCP):
+        self.mcp = mcp
+        self.sessions = 0
+        self._started: Optional[asyncio.Event] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        async with self.mcp._lifespan_manager():
+            self._started.set()
+            await self._stop.wait()
+
+    async def enter(self):
+        self.sessions += 1
+        if self._task is None:
+            self._started, self._stop = asyncio.Event(), asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        started = asyncio.create_task(self._started.wait())
+        try:
+            await asyncio.wait({started, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            started.cancel()
+        if self._task.done():
+            task, self._task = self._task, None
+            self.sessions -= 1
+            task.result()
+
+    async def exit(self):
+        self.sessions -= 1
+        if self.sessions == 0 and self._task is not None:
+            task, self._task = self._task, None
+            self._stop.set()
+            await task
+
+
+_lifespans: "weakref.WeakKeyDictionary[FastMCP, _SharedLifespan]" = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def inproc_client(mcp: FastMCP):
+    """Session streams connected to ``mcp`` running on this event loop
+
+    Messages are handed over as objects through memory streams: no process,
+    socket or JSON encoding. Tools share the caller's event loop, so
+    blocking ones should use ``@offload``.
+    """
+    lifespan = _lifespans.get(mcp)
+    if lifespan is None:
+        lifespan = _lifespans[mcp] = _SharedLifespan(mcp)
+    server = mcp._mcp_server
+    options = server.create_initialization_options(notification_options=NotificationOptions(tools_changed=True))
+
+    await lifespan.enter()
+    try:
+        async with create_client_server_memory_streams() as (client_streams, (server_read, server_write)):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(server.run, server_read, server_write, options)
+                try:
+                    yield client_streams
+                finally:
+                    tg.cancel_scope.cancel()
+    finally:
+        await lifespan.exit()
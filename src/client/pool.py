@@ -0,0 +1,308 @@
+"""
+Session pool keeping warm, initialized MCP sessions per server
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncContextManager, Awaitable, Callable, Deque, Optional, Set
+
+from fastmcp.exceptions import ToolError
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+# Factory returning a transport context manager that yields (read, write, ...)
+ConnectionFactory = Callable[[], AsyncContextManager[tuple]]
+# ClientSession message_handler receiving server requests, notifications and errors
+MessageHandler = Callable[[Any], Awaitable[None]]
+
+
+class PooledSession:
+    """A ClientSession owned by its own background task
+
+    anyio transports must be entered and exited from the same task, so each
+    pooled session lives in a dedicated task that opens the transport, runs
+    initialize() and then parks until the pool closes it.
+    """
+
+    def __init__(self, connect: ConnectionFactory, message_handler: Optional[MessageHandler] = None):
+        self._connect = connect
+        self._message_handler = message_handler
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+        self.session: Optional[ClientSession] = None
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.checked_at = self.created_at
+        self.uses = 0
+
+    async def open(self) -> "PooledSession":
+        """Open the transport and initialize the session"""
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        return self
+
+    async def _run(self):
+        try:
+            async with self._connect() as streams:
+                read, write = streams[0], streams[1]
+                async with ClientSession(read, write, message_handler=self._message_handler) as session:
+                    await session.initialize()
+                    self.session = session
+                    self._ready.set()
+                    await self._closing.wait()
+        except Exception as e:
+            self._error = e
+        finally:
+            self.session = None
+            self._ready.set()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the session is open and its owner task still running"""
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    def idle_for(self) -> float:
+        """Seconds since the session was last returned to the pool"""
+        return time.monotonic() - self.last_used
+
+    def unchecked_for(self) -> float:
+        """Seconds since the session was last used or health checked"""
+        return time.monotonic() - max(self.last_used, self.checked_at)
+
+    async def ping(self, timeout: float) -> bool:
+        """Health check the session with an MCP ping"""
+        if not self.alive:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout)
+            self.checked_at = time.monotonic()
+            return True
+        except Exception:
+            return False
+
+    async def close(self):
+        """Close the session and its transport"""
+        self._closing.set()
+        if self._task is not None:
+            with suppress(Exception):
+                await self._task
+
+
+class SessionPool:
+    """Pool of warm MCP sessions with borrow/return semantics"""
+
+    def __init__(
+        self,
+        connect: ConnectionFactory,
+        min_size: int = 1,
+        max_size: int = 4,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        ping_timeout: float = 5.0,
+        message_handler: Optional[MessageHandler] = None,
+        max_uses: Optional[int] = None,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool bounds: min_size={min_size}, max_size={max_size}")
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.ping_timeout = ping_timeout
+        self.message_handler = message_handler
+        self.max_uses = max_uses
+        self._idle: Deque[PooledSession] = deque()
+        self._size = 0
+        self._cond = asyncio.Condition()
+        self._reaper: Optional[asyncio.Task] = None
+        self._refill: Optional[asyncio.Task] = None
+        self._closing: Set[asyncio.Task] = set()
+        self._closed = False
+        self.created = 0
+        self.evicted = 0
+        self.recycled = 0
+
+    @property
+    def size(self) -> int:
+        """Number of open (idle or borrowed) sessions"""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Number of sessions waiting in the pool"""
+        return len(self._idle)
+
+    async def start(self):
+        """Pre-warm min_size sessions and start idle eviction"""
+        await self._fill()
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def _fill(self):
+        while not self._closed:
+            async with self._cond:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                pooled = await self._open()
+            except Exception:
+                async with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            async with self._cond:
+                self._idle.append(pooled)
+                self._cond.notify()
+
+    async def _open(self) -> PooledSession:
+        pooled = await PooledSession(self.connect, self.message_handler).open()
+        self.created += 1
+        return pooled
+
+    async def _discard(self, pooled: PooledSession):
+        async with self._cond:
+            self._size -= 1
+            self.evicted += 1
+            self._cond.notify()
+        # Tear down in the background so callers never wait on a process exit
+        task = asyncio.create_task(pooled.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+        self._prewarm()
+
+    def _prewarm(self):
+        """Open replacements for discarded sessions in the background"""
+        if self._closed or self._size >= self.min_size:
+            return
+        if self._refill is None or self._refill.done():
+            self._refill = asyncio.create_task(self._fill_quietly())
+
+    async def _fill_quietly(self):
+        with suppress(Exception):
+            await self._fill()
+
+    async def _borrow(self) -> PooledSession:
+        if self._closed:
+            raise RuntimeError("Session pool is closed")
+        while True:
+            async with self._cond:
+                while not self._idle and self._size >= self.max_size:
+                    await self._cond.wait()
+                    if self._closed:
+                        raise RuntimeError("Session pool is closed")
+                if self._idle:
+                    pooled = self._idle.pop()
+                else:
+                    self._size += 1
+                    pooled = None
+
+            if pooled is None:
+                try:
+                    return await self._open()
+                except Exception:
+                    async with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+
+            # Only ping sessions that sat idle long enough to have gone stale
+            if pooled.alive and (
+                pooled.unchecked_for() < self.health_check_interval
+                or await pooled.ping(self.ping_timeout)
+            ):
+                return pooled
+            await self._discard(pooled)
+
+    async def _return(self, pooled: PooledSession, healthy: bool = True):
+        pooled.uses += 1
+        if not healthy or self._closed or not pooled.alive:
+            await self._discard(pooled)
+            return
+        if self.max_uses is not None and pooled.uses >= self.max_uses:
+            # Recycle long-lived sessions (e.g. stdio servers) before they grow stale
+            self.recycled += 1
+            await self._discard(pooled)
+            return
+        pooled.last_used = time.monotonic()
+        async with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow an initialized ClientSession, returning it on exit"""
+        pooled = await self._borrow()
+        healthy = True
+        try:
+            yield pooled.session
+        except McpError as e:
+            # JSON-RPC error responses leave the session usable, a dropped connection does not
+            healthy = e.error.code != CONNECTION_CLOSED
+            raise
+        except (GeneratorExit, ToolError, asyncio.CancelledError):
+            # A stream the caller stopped reading, a tool reporting failure or a call
+            # abandoned at its deadline (the server is told to cancel it): the session is fine
+            raise
+        except BaseException:
+            healthy = False
+            raise
+        finally:
+            await self._return(pooled, healthy)
+
+    async def _reap_loop(self):
+        interval = max(min(self.idle_timeout, self.health_check_interval) / 2, 0.5)
+        while not self._closed:
+            await asyncio.sleep(interval)
+            await self.evict_idle()
+            with suppress(Exception):
+                await self._fill()
+
+    async def evict_idle(self):
+        """Close sessions idle past idle_timeout or failing health checks"""
+        async with self._cond:
+            keep = self.min_size
+            candidates = list(self._idle)
+            self._idle.clear()
+
+        survivors = []
+        for pooled in candidates:
+            expired = pooled.idle_for() >= self.idle_timeout and len(survivors) >= keep
+            stale = pooled.unchecked_for() >= self.health_check_interval
+            if expired or not pooled.alive or (stale and not await pooled.ping(self.ping_timeout)):
+                await self._discard(pooled)
+            else:
+                survivors.append(pooled)
+
+        async with self._cond:
+            self._idle.extend(survivors)
+            self._cond.notify_all()
+
+    async def close(self):
+        """Close all idle sessions and stop the reaper"""
+        self._closed = True
+        if self._refill is not None:
+            self._refill.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._refill
+            self._refill = None
+        if self._reaper is not None:
+            self._reaper.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reaper
+            self._reaper = None
+        async with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for pooled in idle:
+            await self._discard(pooled)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
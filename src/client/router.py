@@ -0,0 +1,369 @@
+"""
+Router client balancing calls across several MCP server replicas
+"""
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Literal, Optional, Sequence, Set
+
+from fastmcp.exceptions import ToolError
+from mcp import types
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+from .deadlines import DEADLINE_EXCEEDED, HedgePolicy, HedgeStats, LatencyTracker, deadline_exceeded, hedged, remaining
+from .unified_client import MCPClient, Transport
+
+# "Server busy" error code sent by src.server.admission; the request was not run
+SERVER_BUSY = -32003
+
+Strategy = Literal["least_outstanding", "ewma"]
+
+
+@dataclass
+class Endpoint:
+    """One server replica: a transport plus its connection options"""
+
+    transport: Transport
+    options: Dict[str, Any] = field(default_factory=dict)
+    name: Optional[str] = None
+
+    @classmethod
+    def parse(cls, spec: str) -> "Endpoint":
+        """"http://host:8000/mcp", "http://host:8000/sse" or "stdio:python run_stdio_server.py" """
+        if spec.startswith("stdio:"):
+            command, *args = spec[len("stdio:"):].split()
+            return cls("stdio", {"command": command, "args": args}, name=spec)
+        transport = "sse" if spec.rstrip("/").endswith("/sse") else "http"
+        return cls(transport, {"url": spec}, name=spec)
+
+    def __post_init__(self):
+        if self.name is None:
+            self.name = f"{self.transport}:{self.options.get('url') or self.options.get('command', '')}"
+
+
+class EndpointState:
+    """Load, latency and health bookkeeping for one endpoint"""
+
+    def __init__(self, endpoint: Endpoint, client: MCPClient):
+        self.endpoint = endpoint
+        self.client = client
+        self.outstanding = 0
+        self.ewma: Optional[float] = None
+        self.failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.tools: Set[str] = set()
+        self.resources: Set[str] = set()
+
+    @property
+    def ejected(self) -> bool:
+        return time.monotonic() < self.ejected_until
+
+    def cost(self, strategy: Strategy) -> float:
+        if strategy == "ewma":
+            # Unmeasured endpoints cost nothing so they get tried
+            return (self.ewma or 0.0) * (self.outstanding + 1)
+        return float(self.outstanding)
+
+
+class MCPRouter:
+    """Spreads calls over N endpoints (any mix of stdio, SSE and HTTP)
+
+    Each endpoint gets its own pooled MCPClient. Calls go to the endpoint
+    with the fewest outstanding requests (``least_outstanding``) or the
+    lowest latency EWMA weighted by load (``ewma``). After ``max_failures``
+    consecutive connection failures (or one failed warm-up in ``start``) an
+    endpoint is ejected for ``eject_for`` seconds, doubling up to
+    ``max_eject_for`` while it keeps failing.
+
+    Reads, listings and idempotent tools are retried on another replica
+    after a connection failure. A "server busy" rejection means the request
+    never ran, so any call is retried. Tool and resource catalogs are merged,
+    and calls only go to endpoints that expose the tool.
+
+    Tool calls and resource reads share one ``timeout`` deadline across retries. With a
+    ``hedge`` policy, a slow idempotent call is also sent to a second
+    replica, and the first answer wins.
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[Any],
+        strategy: Strategy = "least_outstanding",
+        retries: int = 2,
+        max_failures: int = 3,
+        eject_for: float = 10.0,
+        max_eject_for: float = 120.0,
+        ewma_alpha: float = 0.3,
+        idempotent_tools: Iterable[str] = (),
+        catalog_ttl: float = 60.0,
+        timeout: Optional[float] = None,
+        hedge: Optional[HedgePolicy] = None,
+        **client_options,
+    ):
+        if strategy not in ("least_outstanding", "ewma"):
+            raise ValueError(f"Unknown balancing strategy: {strategy!r}")
+        self.strategy = strategy
+        self.retries = retries
+        self.max_failures = max_failures
+        self.eject_for = eject_for
+        self.max_eject_for = max_eject_for
+        self.ewma_alpha = ewma_alpha
+        self.idempotent_tools = set(idempotent_tools)
+        self.catalog_ttl = catalog_ttl
+        self.timeout = timeout
+        self.hedge = hedge
+        self.latencies = LatencyTracker(hedge.window if hedge else 256)
+        self.hedge_stats = HedgeStats()
+        self.endpoints: List[EndpointState] = []
+        for endpoint in endpoints:
+            if isinstance(endpoint, str):
+                endpoint = Endpoint.parse(endpoint)
+            client = MCPClient(endpoint.transport, **{**client_options, **endpoint.options})
+            self.endpoints.append(EndpointState(endpoint, client))
+        if not self.endpoints:
+            raise ValueError("MCPRouter needs at least one endpoint")
+        self._tools: Dict[str, types.Tool] = {}
+        self._resources: Dict[str, types.Resource] = {}
+        self._catalog_at: Optional[float] = None
+        self._catalog_lock = asyncio.Lock()
+
+    async def start(self):
+        """Warm every endpoint's pool; endpoints that fail to connect are ejected at once"""
+        results = await asyncio.gather(*(state.client.pool() for state in self.endpoints), return_exceptions=True)
+        for state, result in zip(self.endpoints, results):
+            if isinstance(result, BaseException):
+                self._record_failure(state, eject=True)
+        if all(isinstance(result, BaseException) for result in results):
+            raise ConnectionError("Could not connect to any endpoint") from results[0]
+        return self
+
+    # Balancing and health
+
+    def _pick(self, candidates: Sequence[EndpointState], exclude: Set[int]) -> Optional[EndpointState]:
+        available = [state for state in candidates if id(state) not in exclude]
+        if not available:
+            return None
+        healthy = [state for state in available if not state.ejected]
+        if not healthy:
+            # Everything is ejected: try whichever comes back soonest
+            return min(available, key=lambda state: state.ejected_until)
+        random.shuffle(healthy)
+        return min(healthy, key=lambda state: state.cost(self.strategy))
+
+    def _record_success(self, state: EndpointState, latency: float):
+        state.failures = 0
+        state.ejections = 0
+        state.ejected_until = 0.0
+        if state.ewma is None:
+            state.ewma = latency
+        else:
+            state.ewma += self.ewma_alpha * (latency - state.ewma)
+
+    def _record_failure(self, state: EndpointState, eject: bool = False):
+        state.errors += 1
+        state.failures += 1
+        if eject or state.failures >= self.max_failures or state.ejected_until:
+            duration = min(self.eject_for * 2 ** state.ejections, self.max_eject_for)
+            state.ejections += 1
+            state.ejected_until = time.monotonic() + duration
+
+    async def _execute(
+        self,
+        candidates: Sequence[EndpointState],
+        operation: Callable[[MCPClient], Awaitable[Any]],
+        idempotent: bool,
+        what: str,
+        tried: Optional[Set[int]] = None,
+        deadline: Optional[float] = None,
+    ):
+        # Shared by hedged attempts, so each goes to a different endpoint
+        tried = set() if tried is None else tried
+        last_error: Optional[BaseException] = None
+        for _ in range(self.retries + 1):
+            if deadline is not None and time.monotonic() >= deadline:
+                raise last_error or deadline_exceeded(None, what)
+            state = self._pick(candidates, tried)
+            if state is None:
+                break
+            tried.add(id(state))
+            state.outstanding += 1
+            state.requests += 1
+            started = time.perf_counter()
+            try:
+                result = await operation(state.client)
+            except McpError as e:
+                if e.error.code == SERVER_BUSY:
+                    last_error = e
+                    continue
+                if e.error.code == DEADLINE_EXCEEDED:
+                    # Slow, not broken: the latency steers load away without ejecting
+                    self._record_success(state, time.perf_counter() - started)
+                    raise
+                if e.error.code != CONNECTION_CLOSED:
+                    # An answer from a healthy server, such as invalid params
+                    self._record_success(state, time.perf_counter() - started)
+                    raise
+                self._record_failure(state)
+                last_error = e
+                if not idempotent:
+                    raise
+            except ToolError:
+                self._record_success(state, time.perf_counter() - started)
+                raise
+            except Exception as e:
+                self._record_failure(state)
+                last_error = e
+                if not idempotent:
+                    raise
+            else:
+                self._record_success(state, time.perf_counter() - started)
+                return result
+            finally:
+                state.outstanding -= 1
+        if last_error is not None:
+            raise last_error
+        raise ConnectionError(f"No endpoint available for {what}")
+
+    # Catalog
+
+    async def refresh_catalog(self):
+        """Fetch and merge tool and resource listings from every reachable endpoint"""
+        async def fetch(state: EndpointState):
+            try:
+                tools = await state.client.list_tools(use_cache=False)
+                resources = await state.client.list_resources(use_cache=False)
+            except Exception:
+                self._record_failure(state)
+                return None
+            return tools, resources
+
+        results = await asyncio.gather(*(fetch(state) for state in self.endpoints))
+        merged_tools: Dict[str, types.Tool] = {}
+        merged_resources: Dict[str, types.Resource] = {}
+        for state, result in zip(self.endpoints, results):
+            if result is None:
+                continue
+            tools, resources = result
+            state.tools = {tool.name for tool in tools.tools}
+            state.resources = {str(resource.uri) for resource in resources.resources}
+            for tool in tools.tools:
+                merged_tools.setdefault(tool.name, tool)
+            for resource in resources.resources:
+                merged_resources.setdefault(str(resource.uri), resource)
+        self._tools, self._resources = merged_tools, merged_resources
+        self._catalog_at = time.monotonic()
+
+    async def _ensure_catalog(self):
+        if self._catalog_at is not None and time.monotonic() - self._catalog_at < self.catalog_ttl:
+            return
+        async with self._catalog_lock:
+            if self._catalog_at is None or time.monotonic() - self._catalog_at >= self.catalog_ttl:
+                await self.refresh_catalog()
+
+    def _serving(self, name: str, attribute: str) -> List[EndpointState]:
+        serving = [state for state in self.endpoints if name in getattr(state, attribute)]
+        # Unknown to every catalog (not listed, or a resource template): let any endpoint try
+        return serving or list(self.endpoints)
+
+    def _is_idempotent(self, name: str) -> bool:
+        if name in self.idempotent_tools:
+            return True
+        annotations = self._tools[name].annotations if name in self._tools else None
+        return bool(annotations and (annotations.idempotentHint or annotations.readOnlyHint))
+
+    # Client API
+
+    async def list_tools(self) -> types.ListToolsResult:
+        """Union of every endpoint's tools (first definition of a name wins)"""
+        await self._ensure_catalog()
+        return types.ListToolsResult(tools=list(self._tools.values()))
+
+    async def list_resources(self) -> types.ListResourcesResult:
+        """Union of every endpoint's resources"""
+        await self._ensure_catalog()
+        return types.ListResourcesResult(resources=list(self._resources.values()))
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Call a tool on the best endpoint exposing it
+
+        Calls are retried elsewhere after a connection failure, or hedged,
+        only when idempotent: passed explicitly, listed in
+        ``idempotent_tools`` or annotated ``idempotentHint``/``readOnlyHint``
+        by the server. ``timeout`` (default: the router's) bounds the call
+        including retries.
+        """
+        await self._ensure_catalog()
+        if idempotent is None:
+            idempotent = self._is_idempotent(name)
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        candidates = self._serving(name, "tools")
+        what = f"tool '{name}'"
+        tried: Set[int] = set()
+
+        async def attempt(_: int):
+            started = time.perf_counter()
+            result = await self._execute(
+                candidates,
+                lambda client: client.call_tool(name, arguments, timeout=remaining(deadline)),
+                idempotent,
+                what,
+                tried,
+                deadline,
+            )
+            self.latencies.record(name, time.perf_counter() - started)
+            return result
+
+        if self.hedge is None or not idempotent:
+            return await attempt(0)
+        delay = self.latencies.hedge_delay(name, self.hedge)
+        return await hedged(attempt, delay, self.hedge.max_hedges, self.hedge_stats)
+
+    async def read_resource(self, uri: str, use_cache: bool = True, timeout: Optional[float] = None):
+        """Read a resource from the best endpoint exposing it, within ``timeout`` across retries"""
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        await self._ensure_catalog()
+        return await self._execute(
+            self._serving(uri, "resources"),
+            lambda client: client.read_resource(uri, use_cache=use_cache, timeout=remaining(deadline)),
+            True,
+            f"resource '{uri}'",
+            deadline=deadline,
+        )
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-endpoint load, latency and health"""
+        return [
+            {
+                "endpoint": state.endpoint.name,
+                "outstanding": state.outstanding,
+                "requests": state.requests,
+                "errors": state.errors,
+                "ewma_ms": state.ewma * 1000 if state.ewma is not None else None,
+                "ejected": state.ejected,
+                "tools": sorted(state.tools),
+            }
+            for state in self.endpoints
+        ]
+
+    async def close(self):
+        """Close every endpoint's sessions"""
+        await asyncio.gather(*(state.client.close() for state in self.endpoints), return_exceptions=True)
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -25,15 +25,15 @@ async def main():
             for tool in tools.tools:
                 print(f"  - {tool.name}: {tool.description}")
 
-            # Call tools
-            result = await session.call_tool("add", arguments={"a": 10, "b": 5})
-            print(f"\n🔢 add(10, 5) = {result.content[0].text}")
-
-            result = await session.call_tool("multiply", arguments={"a": 10, "b": 5})
-            print(f"🔢 multiply(10, 5) = {result.content[0].text}")
-
-            result = await session.call_tool("greet", arguments={"name": "FastMCP"})
-            print(f"👋 greet('FastMCP') = {result.content[0].text}")
+            # Call tools (sent together, answered in one round-trip)
+            added, multiplied, greeting = await asyncio.gather(
+                session.call_tool("add", arguments={"a": 10, "b": 5}),
+                session.call_tool("multiply", arguments={"a": 10, "b": 5}),
+                session.call_tool("greet", arguments={"name": "FastMCP"}),
+            )
+            print(f"\n🔢 add(10, 5) = {added.content[0].text}")
+            print(f"🔢 multiply(10, 5) = {multiplied.content[0].text}")
+            print(f"👋 greet('FastMCP') = {greeting.content[0].text}")
 
             # List resources
             resources = await session.list_resources()
@@ -0,0 +1,50 @@
+"""
+Pool of pre-spawned, initialized stdio server processes
+"""
+import sys
+from typing import Dict, List, Optional
+
+from mcp import StdioServerParameters
+
+from ..common.codec import JSONCodec
+from ..common.framing import LINE_FRAMING, StdioFraming
+from .pool import SessionPool
+from .stdio_transport import stdio_client
+
+
+class StdioServerPool(SessionPool):
+    """Keeps warm stdio server subprocesses and hands them out to callers
+
+    Spawning ``run_stdio_server.py`` pays the full interpreter and fastmcp
+    import cost, so processes are started ahead of time, initialized once and
+    reused across borrows. A process is recycled after ``max_uses`` borrows or
+    as soon as its connection drops, and a replacement is pre-warmed in the
+    background to keep ``min_size`` ready.
+    """
+
+    def __init__(
+        self,
+        command: str = sys.executable,
+        args: Optional[List[str]] = None,
+        env: Optional[Dict[str, str]] = None,
+        cwd: Optional[str] = None,
+        min_size: int = 2,
+        max_size: int = 8,
+        max_uses: Optional[int] = 1000,
+        codec: Optional[JSONCodec] = None,
+        framing: StdioFraming = LINE_FRAMING,
+        **kwargs,
+    ):
+        self.params = StdioServerParameters(
+            command=command,
+            args=args if args is not None else ["run_stdio_server.py"],
+            env=env,
+            cwd=cwd,
+        )
+        super().__init__(
+            lambda: stdio_client(self.params, codec, framing=framing),
+            min_size=min_size,
+            max_size=max_size,
+            max_uses=max_uses,
+            **kwargs,
+        )
@@ -0,0 +1,101 @@
+"""
+Stdio client transport framing JSON-RPC lines with a pluggable JSON codec
+"""
+import sys
+from contextlib import asynccontextmanager
+from typing import Optional, TextIO
+
+import anyio
+import anyio.lowlevel
+from mcp import StdioServerParameters
+from mcp.client.stdio import (
+    PROCESS_TERMINATION_TIMEOUT,
+    _create_platform_compatible_process,
+    _get_executable_command,
+    _terminate_process_tree,
+    get_default_environment,
+)
+from mcp.shared.message import SessionMessage
+
+from ..common.codec import JSONCodec, get_codec
+from ..common.framing import LINE_FRAMING, FrameSplitter, StdioFraming, encode_batches
+
+
+@asynccontextmanager
+async def stdio_client(
+    server: StdioServerParameters,
+    codec: Optional[JSONCodec] = None,
+    errlog: TextIO = sys.stderr,
+    framing: StdioFraming = LINE_FRAMING,
+):
+    """Drop-in for ``mcp.client.stdio.stdio_client`` that encodes with ``codec``
+
+    Spawning and shutting down the server process is left to mcp's helpers;
+    only the line framing and JSON encoding differ. Batched ``framing``
+    sends pipelined requests to the server in one write.
+    """
+    codec = codec or get_codec()
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+
+    env = {**get_default_environment(), **server.env} if server.env is not None else get_default_environment()
+    try:
+        process = await _create_platform_compatible_process(
+            command=_get_executable_command(server.command),
+            args=server.args,
+            env=env,
+            errlog=errlog,
+            cwd=server.cwd,
+        )
+    except OSError:
+        for stream in (read_stream, write_stream, read_stream_writer, write_stream_reader):
+            await stream.aclose()
+        raise
+
+    async def stdout_reader():
+        try:
+            async with read_stream_writer:
+                frames = FrameSplitter()
+                while True:
+                    try:
+                        chunk = await process.stdout.receive(framing.read_size)
+                    except anyio.EndOfStream:
+                        break
+                    for line in frames.feed(chunk):
+                        try:
+                            message = codec.decode_message(line)
+                        except Exception as exc:
+                            await read_stream_writer.send(exc)
+                            continue
+                        await read_stream_writer.send(SessionMessage(message))
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async def stdin_writer():
+        try:
+            async with write_stream_reader:
+                async for data in encode_batches(write_stream_reader, codec, framing):
+                    await process.stdin.send(data)
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async with anyio.create_task_group() as tg, process:
+        tg.start_soon(stdout_reader)
+        tg.start_soon(stdin_writer)
+        try:
+            yield read_stream, write_stream
+        finally:
+            # MCP shutdown: close the server's stdin, wait, then terminate
+            try:
+                await process.stdin.aclose()
+            except Exception:
+                pass
+            try:
+                with anyio.fail_after(PROCESS_TERMINATION_TIMEOUT):
+                    await process.wait()
+            except TimeoutError:
+                await _terminate_process_tree(process)
+            except ProcessLookupError:
+                pass
+            for stream in (read_stream, write_stream, read_stream_writer, write_stream_reader):
+                await stream.aclose()
@@ -2,65 +2,548 @@
 Unified MCP Client supporting multiple transports
 """
 import asyncio
-from typing import Literal
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, List, Literal, Optional, Tuple, Union
+from fastmcp.exceptions import ToolError
+from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.sse import sse_client
 import httpx
 
+from ..common.codec import JSONCodec, get_codec
+from ..common.framing import LINE_FRAMING, StdioFraming
+from .cache import ResponseCache
+from .catalog import catalog_version, list_since
+from .deadlines import (
+    HedgePolicy,
+    HedgeStats,
+    LatencyTracker,
+    call_tool_with_deadline,
+    cancel_request,
+    deadline_exceeded,
+    deadline_meta,
+    hedged,
+    remaining,
+    with_deadline,
+)
+from .http_transport import compression_headers, create_http_client, streamable_http
+from .inproc_transport import inproc_client
+from .pool import SessionPool
+from .stdio_pool import StdioServerPool
+from .stdio_transport import stdio_client
+from .unix_transport import unix_client
+
+TRANSPORTS = ("stdio", "sse", "http", "inproc", "unix")
+Transport = Literal["stdio", "sse", "http", "inproc", "unix"]
+
+DEFAULT_UNIX_PATH = "/tmp/mcp.sock"
+
+# A batched tool call: ("add", {"a": 1, "b": 2}) or {"name": "add", "arguments": {...}}
+ToolCall = Union[Tuple[str, Optional[Dict[str, Any]]], Dict[str, Any]]
+
+
+async def call_tools_concurrently(
+    session: ClientSession, calls: Iterable[ToolCall], max_in_flight: int = 16, deadline: Optional[float] = None
+) -> List[Any]:
+    """Pipeline tool calls on one session, returning results (or errors) in call order
+
+    With a ``time.monotonic()`` ``deadline``, calls still running when it
+    passes are cancelled on the server and yield a 408 McpError.
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def call(spec: ToolCall):
+        if isinstance(spec, dict):
+            name, arguments = spec["name"], spec.get("arguments")
+        else:
+            name, arguments = spec[0], spec[1] if len(spec) > 1 else None
+        async with semaphore:
+            if deadline is None:
+                return await session.call_tool(name, arguments=arguments or {})
+            timeout = remaining(deadline)
+            return await with_deadline(
+                call_tool_with_deadline(session, name, arguments, timeout), timeout, f"tool '{name}'"
+            )
+
+    return await asyncio.gather(*(call(spec) for spec in calls), return_exceptions=True)
+
+
+async def read_resource_if_modified(
+    session: ClientSession, uri: str, etag: Optional[str] = None, timeout: Optional[float] = None
+) -> types.ReadResourceResult:
+    """Read a resource, asking the server to skip the body if it still has etag
+
+    ``timeout`` is sent as the server's budget; like ``call_tool_with_deadline``
+    the read is cancelled on the server if the caller abandons it.
+    """
+    meta = {**({"ifNoneMatch": etag} if etag else {}), **deadline_meta(timeout)}
+    params = types.ReadResourceRequestParams(uri=uri, _meta=meta or None)
+    request_id = session._request_id
+    try:
+        return await session.send_request(
+            types.ClientRequest(types.ReadResourceRequest(params=params)),
+            types.ReadResourceResult,
+        )
+    except asyncio.CancelledError:
+        await cancel_request(session, request_id, "Abandoned by the client")
+        raise
+
+
+async def stream_request(
+    session: ClientSession,
+    request: types.ClientRequest,
+    result_type: type,
+    max_buffered: int = 16,
+    deadline: Optional[float] = None,
+    what: str = "stream",
+) -> AsyncIterator[str]:
+    """Send a request flagged _meta.stream and yield the chunks the server streams back
+
+    At most max_buffered chunks wait for the consumer; past that the session
+    stops reading, which in turn holds back the server. A stream still open
+    at the ``time.monotonic()`` ``deadline`` is cancelled with a 408 McpError.
+    """
+    chunks: asyncio.Queue = asyncio.Queue(max_buffered)
+    finished = object()
+    closed = False
+    request_id = None
+
+    async def on_progress(progress: float, total: Optional[float], message: Optional[str]):
+        if message is not None and not closed:
+            await chunks.put(message)
+
+    async def send():
+        nonlocal request_id
+        # send_request numbers the request synchronously with the session's counter
+        request_id = session._request_id
+        try:
+            result = await session.send_request(request, result_type, progress_callback=on_progress)
+        except Exception as e:
+            await chunks.put((finished, e))
+        else:
+            await chunks.put((finished, result))
+
+    sender = asyncio.create_task(send())
+    try:
+        while True:
+            if deadline is None:
+                chunk = await chunks.get()
+            else:
+                try:
+                    chunk = await asyncio.wait_for(chunks.get(), max(remaining(deadline), 0))
+                except asyncio.TimeoutError:
+                    raise deadline_exceeded(None, what) from None
+            if isinstance(chunk, tuple) and chunk[0] is finished:
+                outcome = chunk[1]
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                if getattr(outcome, "isError", False):
+                    raise ToolError(outcome.content[0].text if outcome.content else "Tool call failed")
+                # Servers that do not stream send everything in the reply
+                for item in getattr(outcome, "content", None) or getattr(outcome, "contents", None) or ():
+                    if getattr(item, "text", None):
+                        yield item.text
+                return
+            yield chunk
+    finally:
+        if not sender.done():
+            # Consumer stopped early: unblock the session's reader and stop the server
+            closed = True
+            sender.cancel()
+            while not chunks.empty():
+                chunks.get_nowait()
+            if request_id is not None:
+                await cancel_request(session, request_id, "Stream closed")
+
 
 class MCPClient:
     """Unified MCP Client that supports multiple transports"""
 
-    def __init__(self, transport: Literal["stdio", "sse", "http"] = "stdio"):
+    def __init__(
+        self,
+        transport: Transport = "stdio",
+        min_sessions: Optional[int] = None,
+        max_sessions: int = 4,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        max_in_flight: int = 16,
+        max_uses: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttl: Optional[float] = 60.0,
+        cache_size: int = 256,
+        cache_resources: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+        codec: Union[str, JSONCodec, None] = None,
+        stdio_framing: StdioFraming = LINE_FRAMING,
+        timeout: Optional[float] = None,
+        hedge: Optional[HedgePolicy] = None,
+        idempotent_tools: Iterable[str] = (),
+        compression: bool = True,
+        **connect_kwargs,
+    ):
         self.transport = transport
         self.session = None
+        # min_sessions/max_uses left as None keep the pool's own defaults: one warm
+        # session, or for stdio two warm processes recycled every 1000 borrows
+        self.min_sessions = min_sessions
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.max_in_flight = max_in_flight
+        self.max_uses = max_uses
+        # Pass cache_ttl=None to disable caching; share `cache` across clients if desired
+        if cache is None and cache_ttl:
+            cache = ResponseCache(maxsize=cache_size, ttl=cache_ttl)
+        self.cache = cache
+        # Resource contents are revalidated by etag on every read unless this is set:
+        # then reads within cache_ttl skip the server, even for dynamic resources
+        self.cache_resources = cache_resources
+        self.connect_kwargs = connect_kwargs
+        self._pools: Dict[str, SessionPool] = {}
+        # Pass http_client to share connections with other clients; it is then left open on close()
+        self._http_client = http_client
+        self._owns_http_client = False
+        # JSON codec for stdio framing: a name ("orjson", "msgspec", "json") or a JSONCodec
+        self.codec = codec if isinstance(codec, JSONCodec) else get_codec(codec)
+        # HIGH_THROUGHPUT batches pipelined requests into one write to the server
+        self.stdio_framing = stdio_framing
+        # Server for transport="inproc" when none is passed as server=...
+        self._inproc_server = None
+        # Default per-call deadline in seconds, sent to the server with each tool call
+        self.timeout = timeout
+        # Hedge slow calls of idempotent tools on a second pooled session
+        self.hedge = hedge
+        self.idempotent_tools = set(idempotent_tools)
+        self.latencies = LatencyTracker(hedge.window if hedge else 256)
+        self.hedge_stats = HedgeStats()
+        # Accept compressed HTTP/SSE responses (the server only compresses large ones)
+        self.compression = compression
 
-    async def connect_stdio(self, command: str = ".venv/Scripts/python.exe", args: list = None):
+    async def connect_stdio(
+        self,
+        command: str = ".venv/Scripts/python.exe",
+        args: list = None,
+        env: Optional[Dict[str, str]] = None,
+        cwd: Optional[str] = None,
+    ):
         """Connect using STDIO transport"""
         if args is None:
             args = ["run_stdio_server.py"]
 
-        server_params = StdioServerParameters(command=command, args=args)
-        return stdio_client(server_params)
+        server_params = StdioServerParameters(command=command, args=args, env=env, cwd=cwd)
+        return stdio_client(server_params, self.codec, framing=self.stdio_framing)
 
     async def connect_sse(self, url: str = "http://127.0.0.1:8000/sse"):
         """Connect using SSE transport"""
-        return sse_client(url)
+        return sse_client(url, headers=compression_headers(self.compression))
 
-    async def connect_http(self, url: str = "http://127.0.0.1:8000"):
+    async def connect_http(self, url: str = "http://127.0.0.1:8000/mcp"):
         """Connect using HTTP transport (streamable-http)"""
-        # For streamable-http, we use httpx directly
-        from contextlib import asynccontextmanager
-        
-        @asynccontextmanager
-        async def http_connection():
-            async with httpx.AsyncClient() as client:
-                # Create read/write streams for HTTP
-                from mcp.client.session import ClientSession
-                from mcp.shared.memory import create_connected_server_and_client_session
-                
-                # Use SSE client as fallback for now
-                # Full HTTP implementation would require custom stream handling
-                async with sse_client(f"{url}/sse") as streams:
-                    yield streams
-        
-        return http_connection()
+        return streamable_http(url, self.http_client())
 
-    async def run(self, **kwargs):
-        """Run the client with specified transport"""
-        # Select transport
+    async def connect_inproc(self, server=None):
+        """Connect to a FastMCP server object in this process (default: a create_server())"""
+        if server is None:
+            if self._inproc_server is None:
+                from ..server.base_server import create_server
+
+                self._inproc_server = create_server("MCP Server (in-process)")
+            server = self._inproc_server
+        return inproc_client(server)
+
+    async def connect_unix(self, path: str = DEFAULT_UNIX_PATH):
+        """Connect to a server listening on a Unix domain socket"""
+        return unix_client(path, self.codec)
+
+    def http_client(self) -> httpx.AsyncClient:
+        """The keep-alive HTTP client shared by every streamable-http session"""
+        if self._http_client is None:
+            self._http_client = create_http_client(compression=self.compression)
+            self._owns_http_client = True
+        return self._http_client
+
+    async def open_connection(self, **kwargs):
+        """Create the transport connection for the configured transport"""
         if self.transport == "stdio":
-            connection = await self.connect_stdio(**kwargs)
+            return await self.connect_stdio(**kwargs)
         elif self.transport == "sse":
             url = kwargs.get("url", "http://127.0.0.1:8000/sse")
-            connection = await self.connect_sse(url)
+            return await self.connect_sse(url)
         elif self.transport == "http":
-            url = kwargs.get("url", "http://127.0.0.1:8000")
-            connection = await self.connect_http(url)
+            url = kwargs.get("url", "http://127.0.0.1:8000/mcp")
+            return await self.connect_http(url)
+        elif self.transport == "inproc":
+            return await self.connect_inproc(kwargs.get("server"))
+        elif self.transport == "unix":
+            return await self.connect_unix(kwargs.get("path", DEFAULT_UNIX_PATH))
         else:
             raise ValueError(f"Unsupported transport: {self.transport}")
 
+    def endpoint_key(self, **kwargs) -> str:
+        """Identify the server a set of connection options points at"""
+        options = {**self.connect_kwargs, **kwargs}
+        if self.transport == "stdio":
+            command = options.get("command", ".venv/Scripts/python.exe")
+            args = options.get("args") or ["run_stdio_server.py"]
+            cwd = f" (in {options['cwd']})" if options.get("cwd") else ""
+            return f"stdio:{command} {' '.join(args)}{cwd}"
+        if self.transport == "inproc":
+            server = options.get("server")
+            return f"inproc:{id(server) if server is not None else 'default'}"
+        if self.transport == "unix":
+            return f"unix:{options.get('path', DEFAULT_UNIX_PATH)}"
+        return f"{self.transport}:{options.get('url', '')}"
+
+    def connection_factory(self, **kwargs):
+        """Zero-argument factory opening a fresh transport connection"""
+        options = {**self.connect_kwargs, **kwargs}
+
+        @asynccontextmanager
+        async def connect():
+            async with await self.open_connection(**options) as streams:
+                yield streams
+
+        return connect
+
+    async def pool(self, **kwargs) -> SessionPool:
+        """Get (creating and warming if needed) the session pool for a server"""
+        key = self.endpoint_key(**kwargs)
+        pool = self._pools.get(key)
+        if pool is None:
+            async def on_message(message):
+                if self.cache is not None:
+                    self.cache.handle_notification(key, message)
+
+            options = dict(
+                max_size=self.max_sessions,
+                idle_timeout=self.idle_timeout,
+                health_check_interval=self.health_check_interval,
+                message_handler=on_message,
+            )
+            if self.min_sessions is not None:
+                options["min_size"] = self.min_sessions
+            elif self.max_sessions < 2:
+                options["min_size"] = self.max_sessions
+            if self.max_uses is not None:
+                options["max_uses"] = self.max_uses
+            if self.transport == "stdio":
+                # Warm server processes, recycled and re-spawned in the background
+                stdio = {**self.connect_kwargs, **kwargs}
+                pool = StdioServerPool(
+                    command=stdio.get("command", ".venv/Scripts/python.exe"),
+                    args=stdio.get("args"),
+                    env=stdio.get("env"),
+                    cwd=stdio.get("cwd"),
+                    codec=self.codec,
+                    framing=self.stdio_framing,
+                    **options,
+                )
+            else:
+                pool = SessionPool(self.connection_factory(**kwargs), **options)
+            self._pools[key] = pool
+            await pool.start()
+        return pool
+
+    @asynccontextmanager
+    async def borrow(self, **kwargs):
+        """Borrow a warm, initialized session from the pool"""
+        pool = await self.pool(**kwargs)
+        async with pool.acquire() as session:
+            yield session
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs,
+    ):
+        """Call a tool on a pooled session
+
+        ``timeout`` (default: the client's) is a deadline in seconds covering
+        the wait for a session. The server is sent the remaining budget.
+        When it runs out, the call is cancelled on the server and a 408
+        McpError is raised. With a hedge policy, a slow call of an idempotent
+        tool is repeated on a second session and the first answer wins.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        async def attempt(_: int):
+            async with self.borrow(**kwargs) as session:
+                started = time.perf_counter()
+                result = await call_tool_with_deadline(session, name, arguments, remaining(deadline))
+                self.latencies.record(name, time.perf_counter() - started)
+                return result
+
+        if self.hedge is None or not (idempotent if idempotent is not None else self.is_idempotent(name, **kwargs)):
+            return await with_deadline(attempt(0), timeout, f"tool '{name}'")
+        delay = self.latencies.hedge_delay(name, self.hedge)
+        return await with_deadline(
+            hedged(attempt, delay, self.hedge.max_hedges, self.hedge_stats), timeout, f"tool '{name}'"
+        )
+
+    def is_idempotent(self, name: str, **kwargs) -> bool:
+        """Listed in ``idempotent_tools``, or annotated idempotent/read-only in the cached tool list"""
+        if name in self.idempotent_tools:
+            return True
+        tools = self.cache.get_tools(self.endpoint_key(**kwargs)) if self.cache is not None else None
+        for tool in tools.tools if tools is not None else ():
+            if tool.name == name:
+                annotations = tool.annotations
+                return bool(annotations and (annotations.idempotentHint or annotations.readOnlyHint))
+        return False
+
+    async def call_tools_batch(
+        self, calls: Iterable[ToolCall], timeout: Optional[float] = None, **kwargs
+    ) -> List[Any]:
+        """Send many tool calls on one pooled session at once
+
+        Up to max_in_flight requests are outstanding at a time. Results come
+        back in call order; a failed call yields its exception in place.
+        ``timeout`` (default: the client's) bounds the whole batch: calls not
+        done by then are cancelled on the server and yield a 408 McpError.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        async with self.borrow(**kwargs) as session:
+            return await call_tools_concurrently(session, calls, self.max_in_flight, deadline)
+
+    async def read_resource(self, uri: str, use_cache: bool = True, timeout: Optional[float] = None, **kwargs):
+        """Read a resource on a pooled session
+
+        A resource the server tags with an etag is read conditionally, so an
+        unchanged body is not sent again. With ``cache_resources`` a read
+        within ``cache_ttl`` is served from cache without asking the server.
+        ``timeout`` (default: the client's) is a deadline as for ``call_tool``.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        async def read(etag: Optional[str]):
+            async with self.borrow(**kwargs) as session:
+                return await read_resource_if_modified(session, uri, etag, remaining(deadline))
+
+        key = self.endpoint_key(**kwargs)
+        if use_cache and self.cache_resources and self.cache is not None:
+            cached = self.cache.get_resource(key, uri)
+            if cached is not None:
+                return cached
+        if self.cache is None:
+            return await with_deadline(read(None), timeout, f"resource '{uri}'")
+
+        # Revalidate an expired entry with its etag instead of refetching the body
+        validated = self.cache.get_validated(key, uri)
+        etag = (validated.meta or {}).get("etag") if validated is not None else None
+        result = await with_deadline(read(etag), timeout, f"resource '{uri}'")
+        meta = result.meta or {}
+        if meta.get("notModified") and validated is not None:
+            result = validated
+        elif meta.get("etag"):
+            self.cache.set_validated(key, uri, result)
+        if self.cache_resources:
+            self.cache.set_resource(key, uri, result)
+        return result
+
+    async def stream_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        max_buffered: int = 16,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Call a tool and iterate over its output as the server produces it
+
+        ``timeout`` (default: the client's) bounds the whole stream, including
+        time the consumer spends between chunks.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        async with self.borrow(**kwargs) as session:
+            meta = {"stream": True, **deadline_meta(remaining(deadline))}
+            params = types.CallToolRequestParams(name=name, arguments=arguments or {}, _meta=meta)
+            request = types.ClientRequest(types.CallToolRequest(params=params))
+            stream = stream_request(session, request, types.CallToolResult, max_buffered, deadline, f"tool '{name}'")
+            async for chunk in stream:
+                yield chunk
+
+    async def stream_resource(
+        self, uri: str, max_buffered: int = 16, timeout: Optional[float] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Read a resource and iterate over its text as the server produces it; ``timeout`` as for stream_tool"""
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        async with self.borrow(**kwargs) as session:
+            meta = {"stream": True, **deadline_meta(remaining(deadline))}
+            params = types.ReadResourceRequestParams(uri=uri, _meta=meta)
+            request = types.ClientRequest(types.ReadResourceRequest(params=params))
+            stream = stream_request(
+                session, request, types.ReadResourceResult, max_buffered, deadline, f"resource '{uri}'"
+            )
+            async for chunk in stream:
+                yield chunk
+
+    async def list_tools(self, use_cache: bool = True, **kwargs):
+        """List tools on a pooled session, served from cache when fresh"""
+        key = self.endpoint_key(**kwargs)
+        if use_cache and self.cache is not None:
+            cached = self.cache.get_tools(key)
+            if cached is not None:
+                return cached
+        # Ask a versioned catalog only for what changed since the last list
+        base = self.cache.get_catalog(key, ResponseCache.TOOLS) if self.cache is not None else None
+        async with self.borrow(**kwargs) as session:
+            result = await list_since(session, ResponseCache.TOOLS, base)
+        if self.cache is not None:
+            self.cache.set_tools(key, result)
+            if catalog_version(result):
+                self.cache.set_catalog(key, ResponseCache.TOOLS, result)
+        return result
+
+    async def list_resources(self, use_cache: bool = True, **kwargs):
+        """List resources on a pooled session, served from cache when fresh"""
+        key = self.endpoint_key(**kwargs)
+        if use_cache and self.cache is not None:
+            cached = self.cache.get_resources(key)
+            if cached is not None:
+                return cached
+        base = self.cache.get_catalog(key, ResponseCache.RESOURCES) if self.cache is not None else None
+        async with self.borrow(**kwargs) as session:
+            result = await list_since(session, ResponseCache.RESOURCES, base)
+        if self.cache is not None:
+            self.cache.set_resources(key, result)
+            if catalog_version(result):
+                self.cache.set_catalog(key, ResponseCache.RESOURCES, result)
+        return result
+
+    async def close(self):
+        """Close every pooled session and the HTTP client this client created"""
+        pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            await pool.close()
+        if self._owns_http_client:
+            client, self._http_client, self._owns_http_client = self._http_client, None, False
+            await client.aclose()
+
+    async def __aenter__(self):
+        await self.pool()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def run(self, **kwargs):
+        """Run the client with specified transport"""
+        try:
+            await self._run(**kwargs)
+        finally:
+            await self.close()
+
+    async def _run(self, **kwargs):
+        connection = await self.open_connection(**{**self.connect_kwargs, **kwargs})
+
         # Connect and interact
         async with connection as (read, write):
             async with ClientSession(read, write) as session:
@@ -75,15 +558,23 @@ class MCPClient:
                 for tool in tools.tools:
                     print(f"  - {tool.name}: {tool.description}")
 
-                # Call tools
-                result = await session.call_tool("add", arguments={"a": 10, "b": 5})
-                print(f"\n🔢 add(10, 5) = {result.content[0].text}")
-
-                result = await session.call_tool("multiply", arguments={"a": 10, "b": 5})
-                print(f"🔢 multiply(10, 5) = {result.content[0].text}")
-
-                result = await session.call_tool("greet", arguments={"name": "FastMCP"})
-                print(f"👋 greet('FastMCP') = {result.content[0].text}")
+                # Call tools (pipelined on the one session)
+                results = await call_tools_concurrently(
+                    session,
+                    [
+                        ("add", {"a": 10, "b": 5}),
+                        ("multiply", {"a": 10, "b": 5}),
+                        ("greet", {"name": "FastMCP"}),
+                    ],
+                    self.max_in_flight,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                added, multiplied, greeting = results
+                print(f"\n🔢 add(10, 5) = {added.content[0].text}")
+                print(f"🔢 multiply(10, 5) = {multiplied.content[0].text}")
+                print(f"👋 greet('FastMCP') = {greeting.content[0].text}")
 
                 # List resources
                 resources = await session.list_resources()
@@ -99,7 +590,7 @@ class MCPClient:
                 print(f"⚙️  config://version = {version.contents[0].text}")
 
 
-async def main(transport: Literal["stdio", "sse", "http"] = "stdio", **kwargs):
+async def main(transport: Transport = "stdio", **kwargs):
     """Main entry point for unified client"""
     client = MCPClient(transport=transport)
     await client.run(**kwargs)
@@ -111,8 +602,8 @@ if __name__ == "__main__":
     # Parse command line arguments
     transport = sys.argv[1] if len(sys.argv) > 1 else "stdio"
 
-    if transport not in ["stdio", "sse", "http"]:
-        print("Usage: python unified_client.py [stdio|sse|http]")
+    if transport not in TRANSPORTS:
+        print(f"Usage: python unified_client.py [{'|'.join(TRANSPORTS)}]")
         sys.exit(1)
 
     print(f"🚀 Starting unified MCP client with {transport.upper()} transport\n")
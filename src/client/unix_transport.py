@@ -0,0 +1,22 @@
+"""
+Unix domain socket client transport
+"""
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import anyio
+
+from ..common.codec import JSONCodec, get_codec
+from ..common.framing import HIGH_THROUGHPUT, StdioFraming, framed_byte_stream
+
+
+@asynccontextmanager
+async def unix_client(path: str, codec: Optional[JSONCodec] = None, framing: StdioFraming = HIGH_THROUGHPUT):
+    """Connect to a server started with ``run_unix_server.py``
+
+    The same JSON lines as stdio, without a child process per session:
+    every connection to the socket is a new session on one long-lived server.
+    """
+    stream = await anyio.connect_unix(path)
+    async with stream, framed_byte_stream(stream, codec or get_codec(), framing) as streams:
+        yield streams
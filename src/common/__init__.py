@@ -0,0 +1,6 @@
+"""Utilities shared by the MCP client and server packages"""
+from .codec import get_codec
+from .framing import HIGH_THROUGHPUT, StdioFraming
+from .ttl_cache import TTLCache
+
+__all__ = ["HIGH_THROUGHPUT", "StdioFraming", "TTLCache", "get_codec"]
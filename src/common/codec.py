@@ -0,0 +1,124 @@
+"""
+Pluggable JSON codecs: orjson or msgspec when installed, stdlib otherwise
+"""
+import functools
+import importlib.util
+import json
+import os
+from typing import Any, Dict, List, Optional, Type, Union
+
+from mcp.types import JSONRPCMessage
+
+# Codec used when none is named: "auto" picks the fastest one installed
+CODEC_ENV = "MCP_JSON_CODEC"
+
+
+class JSONCodec:
+    """Stdlib json for plain data
+
+    JSON-RPC messages go through pydantic-core's JSON support, which the mcp
+    transports use anyway and which is faster than ``json`` on models.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def encode_message(self, message: JSONRPCMessage) -> bytes:
+        return message.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+    def decode_message(self, data: Union[bytes, str]) -> JSONRPCMessage:
+        return JSONRPCMessage.model_validate_json(data)
+
+
+class _NativeCodec(JSONCodec):
+    """Codecs that parse to plain data faster than pydantic-core parses to models"""
+
+    def encode_message(self, message: JSONRPCMessage) -> bytes:
+        return self.dumps(message.model_dump(by_alias=True, mode="json", exclude_none=True))
+
+    def decode_message(self, data: Union[bytes, str]) -> JSONRPCMessage:
+        return JSONRPCMessage.model_validate(self.loads(data))
+
+
+class OrjsonCodec(_NativeCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        try:
+            return self._orjson.dumps(obj, default=str, option=self._orjson.OPT_SORT_KEYS if sort_keys else 0)
+        except TypeError:
+            # Integers beyond 64 bits, non-str keys: leave those to the stdlib
+            return super().dumps(obj, sort_keys)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except ValueError:
+            return super().loads(data)
+
+
+class MsgspecCodec(_NativeCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._errors = (TypeError, OverflowError, msgspec.EncodeError)
+        self._encoder = msgspec.json.Encoder(enc_hook=str)
+        self._sorted_encoder = msgspec.json.Encoder(enc_hook=str, order="sorted")
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        try:
+            return (self._sorted_encoder if sort_keys else self._encoder).encode(obj)
+        except self._errors:
+            return super().dumps(obj, sort_keys)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except ValueError:
+            return super().loads(data)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JSONCodec,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def available_codecs() -> List[str]:
+    """Installed codecs, fastest first"""
+    return [name for name in CODECS if name == "json" or importlib.util.find_spec(name) is not None]
+
+
+@functools.lru_cache(maxsize=None)
+def _codec(name: str) -> JSONCodec:
+    if name == "auto":
+        name = available_codecs()[0]
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}; choose from {', '.join(['auto', *CODECS])}")
+    if name not in available_codecs():
+        raise ImportError(f"JSON codec {name!r} is not installed (pip install {name})")
+    return CODECS[name]()
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Codec by name, else from MCP_JSON_CODEC, else the fastest installed
+
+    ``"auto"`` picks the fastest installed codec. Asking for a codec that is
+    not installed raises ImportError.
+    """
+    return _codec(name or os.environ.get(CODEC_ENV) or "auto")
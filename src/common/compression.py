@@ -0,0 +1,138 @@
+"""
+HTTP content codings (gzip, and br/zstd when installed) with streaming encoders
+"""
+import functools
+import importlib
+import importlib.util
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Sequence, Tuple
+
+# Preferred first: zstd and brotli compress JSON better than gzip for the same CPU
+PREFERENCE = ("zstd", "br", "gzip")
+# Fast levels: from 100 Mbit/s up, higher ones cost more CPU than their extra ratio saves
+DEFAULT_LEVELS: Dict[str, int] = {"zstd": 3, "br": 4, "gzip": 1}
+
+_MODULES: Dict[str, Tuple[str, ...]] = {"zstd": ("zstandard",), "br": ("brotli", "brotlicffi"), "gzip": ()}
+
+
+@functools.lru_cache(maxsize=None)
+def _module(encoding: str):
+    for name in _MODULES[encoding]:
+        if importlib.util.find_spec(name) is not None:
+            return importlib.import_module(name)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def available_encodings() -> Tuple[str, ...]:
+    """Content codings this process can produce and decode, preferred first
+
+    gzip is always there; ``br`` needs brotli (or brotlicffi) and ``zstd``
+    needs zstandard, which httpx also uses to decode them.
+    """
+    return tuple(e for e in PREFERENCE if e == "gzip" or _module(e) is not None)
+
+
+class Encoder(ABC):
+    """Streaming encoder: ``compress(chunk, flush=True)`` returns bytes a decoder can use at once"""
+
+    @abstractmethod
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """Compress a chunk; with ``flush`` also emit everything buffered so far"""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """End the stream; the encoder cannot be used afterwards"""
+
+
+class GzipEncoder(Encoder):
+    def __init__(self, level: int = DEFAULT_LEVELS["gzip"]):
+        self._z = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        out = self._z.compress(data)
+        return out + self._z.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self) -> bytes:
+        return self._z.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder(Encoder):
+    def __init__(self, level: int = DEFAULT_LEVELS["br"]):
+        self._c = _module("br").Compressor(quality=level)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        out = self._c.process(data)
+        return out + self._c.flush() if flush else out
+
+    def finish(self) -> bytes:
+        return self._c.finish()
+
+
+class ZstdEncoder(Encoder):
+    def __init__(self, level: int = DEFAULT_LEVELS["zstd"]):
+        zstandard = _module("zstd")
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._c = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        out = self._c.compress(data)
+        return out + self._c.flush(self._flush_block) if flush else out
+
+    def finish(self) -> bytes:
+        return self._c.flush()
+
+
+ENCODERS = {"gzip": GzipEncoder, "br": BrotliEncoder, "zstd": ZstdEncoder}
+
+
+def get_encoder(encoding: str, level: Optional[int] = None) -> Encoder:
+    """A fresh streaming encoder for one response"""
+    if encoding not in available_encodings():
+        raise ValueError(f"Content coding {encoding!r} is not available (have: {', '.join(available_encodings())})")
+    return ENCODERS[encoding](DEFAULT_LEVELS[encoding] if level is None else level)
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """One-shot compression of a whole body"""
+    encoder = get_encoder(encoding, level)
+    return encoder.compress(data) + encoder.finish()
+
+
+def accept_encoding(enabled: bool = True) -> str:
+    """Accept-Encoding header for a client that decodes everything available here"""
+    return ", ".join(available_encodings()) if enabled else "identity"
+
+
+def negotiate(header: Optional[str], offered: Sequence[str]) -> Optional[str]:
+    """Pick the coding from ``offered`` (server preference order) an Accept-Encoding allows
+
+    The client's highest q-value wins, the server's order breaks ties.
+    ``*`` stands for codings not listed and ``q=0`` rules one out. Returns
+    None when the body should be sent as is.
+    """
+    if not header:
+        return None
+    weights: Dict[str, float] = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in offered:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
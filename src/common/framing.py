@@ -0,0 +1,156 @@
+"""
+Newline-delimited JSON-RPC framing for the stdio and socket transports, optionally batched
+"""
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional
+
+import anyio
+import anyio.abc
+import anyio.lowlevel
+from anyio.streams.memory import MemoryObjectReceiveStream
+from mcp.shared.message import SessionMessage
+
+from .codec import JSONCodec
+
+
+@dataclass(frozen=True)
+class StdioFraming:
+    """How a stdio transport writes and reads JSON-RPC lines
+
+    With ``batch_window=None`` every message is written and flushed on its
+    own. Any other value turns on batching: messages already queued are
+    written together, up to ``max_batch_bytes``, and a positive window also
+    waits that many seconds for more. Reads then take up to ``read_size``
+    bytes at a time and split every frame out of them.
+    """
+
+    batch_window: Optional[float] = None
+    max_batch_bytes: int = 64 * 1024
+    read_size: int = 64 * 1024
+
+    @property
+    def batched(self) -> bool:
+        return self.batch_window is not None
+
+
+LINE_FRAMING = StdioFraming()
+# Coalesce what queued up during the previous write, without waiting for more
+HIGH_THROUGHPUT = StdioFraming(batch_window=0.0)
+
+
+async def encode_batches(
+    messages: MemoryObjectReceiveStream[SessionMessage], codec: JSONCodec, framing: StdioFraming
+) -> AsyncIterator[bytes]:
+    """Yield newline-terminated frames, several messages per write when batching"""
+    async for first in messages:
+        parts = [codec.encode_message(first.message), b"\n"]
+        if framing.batched:
+            size = len(parts[0]) + 1
+            deadline = anyio.current_time() + framing.batch_window
+            while size < framing.max_batch_bytes:
+                message = await _next_before(messages, deadline)
+                if message is None:
+                    break
+                data = codec.encode_message(message.message)
+                parts += (data, b"\n")
+                size += len(data) + 1
+        yield b"".join(parts)
+
+
+async def _next_before(
+    messages: MemoryObjectReceiveStream[SessionMessage], deadline: float
+) -> Optional[SessionMessage]:
+    """Next queued message, waiting until ``deadline`` at most; None if there is none"""
+    try:
+        return messages.receive_nowait()
+    except anyio.WouldBlock:
+        pass
+    except anyio.EndOfStream:
+        return None
+    remaining = deadline - anyio.current_time()
+    if remaining <= 0:
+        return None
+    with anyio.move_on_after(remaining):
+        try:
+            return await messages.receive()
+        except anyio.EndOfStream:
+            return None
+    return None
+
+
+class FrameSplitter:
+    """Splits newline-terminated frames out of chunks as they are read
+
+    Chunks are appended to one buffer and only bytes not scanned before are
+    searched for a newline, so a frame spanning many reads costs time linear
+    in its size rather than in its size times the number of reads.
+    """
+
+    __slots__ = ("_buffer", "_scanned")
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._scanned = 0
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Complete non-empty lines now in the buffer; the partial rest is kept"""
+        buffer = self._buffer
+        buffer += chunk
+        end = buffer.rfind(b"\n", self._scanned)
+        if end < 0:
+            self._scanned = len(buffer)
+            return []
+        lines = bytes(buffer[:end]).split(b"\n")
+        # Dropping a prefix of a bytearray moves its start, not the remaining bytes
+        del buffer[: end + 1]
+        self._scanned = 0
+        return [line for line in lines if line.strip()]
+
+
+@asynccontextmanager
+async def framed_byte_stream(stream: anyio.abc.ByteStream, codec: JSONCodec, framing: StdioFraming):
+    """Session read/write streams over a connected byte stream such as a Unix socket
+
+    Used the same way on both ends. Incoming bytes are always read in
+    ``framing.read_size`` chunks; ``framing`` only decides how writes batch.
+    """
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+
+    async def reader():
+        try:
+            async with read_stream_writer:
+                frames = FrameSplitter()
+                while True:
+                    try:
+                        chunk = await stream.receive(framing.read_size)
+                    except (anyio.EndOfStream, anyio.BrokenResourceError):
+                        break
+                    for line in frames.feed(chunk):
+                        try:
+                            message = codec.decode_message(line)
+                        except Exception as exc:
+                            await read_stream_writer.send(exc)
+                            continue
+                        await read_stream_writer.send(SessionMessage(message))
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async def writer():
+        try:
+            async with write_stream_reader:
+                async for data in encode_batches(write_stream_reader, codec, framing):
+                    await stream.send(data)
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            await anyio.lowlevel.checkpoint()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(reader)
+        tg.start_soon(writer)
+        try:
+            yield read_stream, write_stream
+        finally:
+            tg.cancel_scope.cancel()
+            for memory_stream in (read_stream, write_stream, read_stream_writer, write_stream_reader):
+                await memory_stream.aclose()
@@ -0,0 +1,189 @@
+"""
+Admission control: cap sessions, in-flight requests and outbound backlog
+"""
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set
+
+import anyio
+import mcp.types as types
+from fastmcp import FastMCP
+from mcp.shared.exceptions import McpError
+from mcp.shared.message import SessionMessage
+
+# JSON-RPC error code for shed load (implementation-defined server error range)
+SERVER_BUSY = -32003
+
+
+@dataclass
+class AdmissionLimits:
+    """Caps enforced by AdmissionControl; ``None`` disables a cap"""
+
+    max_sessions: Optional[int] = 1000
+    max_in_flight: Optional[int] = 1024
+    max_in_flight_per_session: Optional[int] = 64
+    max_send_buffer: Optional[int] = 64
+    retry_after: float = 1.0
+    refuse_timeout: float = 5.0
+
+
+class SessionState:
+    """Live counters for one connected session"""
+
+    __slots__ = ("in_flight", "pending_sends")
+
+    def __init__(self):
+        self.in_flight = 0
+        self.pending_sends = 0
+
+
+_current_session: ContextVar[Optional[SessionState]] = ContextVar("mcp_admission_session", default=None)
+
+
+class _CountingSendStream:
+    """Write stream wrapper counting messages waiting for the client to take them"""
+
+    def __init__(self, inner, state: SessionState):
+        self._inner = inner
+        self._state = state
+
+    async def send(self, item):
+        self._state.pending_sends += 1
+        try:
+            await self._inner.send(item)
+        finally:
+            self._state.pending_sends -= 1
+
+    async def aclose(self):
+        await self._inner.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return await self._inner.__aexit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+
+class AdmissionControl:
+    """Sheds load with fast "server busy" errors once the server is saturated
+
+    ``install`` wraps the low-level server's ``run`` (one call per session on
+    every transport) and its request handlers:
+
+    - sessions beyond ``max_sessions`` get a busy error for their first
+      request and are closed;
+    - requests are rejected while their session has ``max_in_flight_per_session``
+      requests running, the server has ``max_in_flight``, or
+      ``max_send_buffer`` replies are still waiting for a slow client.
+
+    Pings are always answered so client health checks keep working.
+    """
+
+    def __init__(self, limits: Optional[AdmissionLimits] = None):
+        self.limits = limits or AdmissionLimits()
+        self.in_flight = 0
+        self.rejected: Dict[str, int] = {"sessions": 0, "in_flight": 0, "server_in_flight": 0, "send_buffer": 0}
+        self._sessions: Set[SessionState] = set()
+
+    @property
+    def sessions(self) -> int:
+        return len(self._sessions)
+
+    def install(self, mcp: FastMCP):
+        """Enforce the limits on every session and request of a server"""
+        server = mcp._mcp_server
+        run = server.run
+
+        async def admitted_run(read_stream, write_stream, *args, **kwargs):
+            max_sessions = self.limits.max_sessions
+            if max_sessions is not None and self.sessions >= max_sessions:
+                self.rejected["sessions"] += 1
+                await self._refuse(read_stream, write_stream, f"too many sessions ({self.sessions})")
+                return
+            state = SessionState()
+            self._sessions.add(state)
+            token = _current_session.set(state)
+            try:
+                return await run(read_stream, _CountingSendStream(write_stream, state), *args, **kwargs)
+            finally:
+                _current_session.reset(token)
+                self._sessions.discard(state)
+
+        server.run = admitted_run
+
+        handlers = server.request_handlers
+        for request_type, handler in list(handlers.items()):
+            if request_type is not types.PingRequest:
+                handlers[request_type] = self._wrap(handler)
+        return self
+
+    def busy_error(self, reason: str) -> types.ErrorData:
+        return types.ErrorData(
+            code=SERVER_BUSY,
+            message=f"Server busy: {reason}, retry later",
+            data={"retryAfter": self.limits.retry_after},
+        )
+
+    def _check(self, state: Optional[SessionState]) -> Optional[tuple]:
+        """(reason key, message) when a new request must be shed"""
+        limits = self.limits
+        if state is not None:
+            if limits.max_send_buffer is not None and state.pending_sends >= limits.max_send_buffer:
+                return "send_buffer", f"{state.pending_sends} replies waiting to be read"
+            if limits.max_in_flight_per_session is not None and state.in_flight >= limits.max_in_flight_per_session:
+                return "in_flight", f"{state.in_flight} requests in flight on this session"
+        if limits.max_in_flight is not None and self.in_flight >= limits.max_in_flight:
+            return "server_in_flight", f"{self.in_flight} requests in flight"
+        return None
+
+    def _wrap(self, handler):
+        async def admitted(req):
+            if req is None:
+                # Internal call (call_tool refreshes the tool list this way)
+                return await handler(req)
+            state = _current_session.get()
+            refused = self._check(state)
+            if refused is not None:
+                self.rejected[refused[0]] += 1
+                raise McpError(self.busy_error(refused[1]))
+            self.in_flight += 1
+            if state is not None:
+                state.in_flight += 1
+            try:
+                return await handler(req)
+            finally:
+                self.in_flight -= 1
+                if state is not None:
+                    state.in_flight -= 1
+
+        return admitted
+
+    async def _refuse(self, read_stream, write_stream, reason: str):
+        """Answer the first request of an over-limit session with a busy error"""
+        error = self.busy_error(reason)
+        async with read_stream, write_stream:
+            with anyio.move_on_after(self.limits.refuse_timeout):
+                async for message in read_stream:
+                    if isinstance(message, Exception):
+                        continue
+                    root = message.message.root
+                    if isinstance(root, types.JSONRPCRequest):
+                        reply = types.JSONRPCError(jsonrpc="2.0", id=root.id, error=error)
+                        await write_stream.send(SessionMessage(types.JSONRPCMessage(reply)))
+                        return
+
+    def gauges(self) -> Dict[str, Any]:
+        """Current load and rejection counters, for ServerMetrics"""
+        backlogs = [state.pending_sends for state in self._sessions]
+        values = {
+            "admission_sessions": self.sessions,
+            "admission_in_flight": self.in_flight,
+            "admission_send_backlog": sum(backlogs),
+            "admission_send_backlog_max": max(backlogs, default=0),
+        }
+        for reason, count in self.rejected.items():
+            values[f"admission_rejected_{reason}_total"] = count
+        return values
@@ -1,36 +1,102 @@
 """
 Base MCP Server with all tools and resources
 """
+from pathlib import Path
+from typing import Optional, Union
+
 from fastmcp import FastMCP
 
+from .admission import AdmissionControl
+from .caching import ToolResultCache
+from .catalog import Catalog
+from .coalescing import SingleFlight
+from .deadlines import Deadlines
+from .lifespan import SharedResources, default_resources
+from .metrics import ServerMetrics
+from .registry import ToolSpec, default_schema_cache, register_lazy_tools
+from .resources import StaticResources
+from .scheduling import FairScheduler
+
+# Declared up front; implementations in .tools are imported on first call
+TOOLS = [
+    ToolSpec("add", ".tools:add", "Add two numbers together"),
+    ToolSpec("multiply", ".tools:multiply", "Multiply two numbers"),
+    ToolSpec("greet", ".tools:greet", "Greet someone by name"),
+    ToolSpec("count", ".tools:count", "Count from 1 to limit, one number per line (streamable)"),
+    ToolSpec("count_primes", ".tools:count_primes", "Count the primes below limit (CPU-bound, runs in a worker process)"),
+]
 
-def create_server(name: str = "Demo Server") -> FastMCP:
-    """Create and configure the MCP server"""
-    mcp = FastMCP(name)
 
-    @mcp.tool()
-    def add(a: int, b: int) -> int:
-        """Add two numbers together"""
-        return a + b
+def create_server(
+    name: str = "Demo Server",
+    tool_cache: Optional[ToolResultCache] = None,
+    metrics: Optional[ServerMetrics] = None,
+    metrics_path: Optional[str] = "/metrics",
+    admission: Optional[AdmissionControl] = None,
+    schema_cache: Union[Path, bool, None] = None,
+    single_flight: Optional[SingleFlight] = None,
+    scheduler: Optional[FairScheduler] = None,
+    resources: Optional[SharedResources] = None,
+    deadlines: Optional[Deadlines] = None,
+    catalog: Optional[Catalog] = None,
+) -> FastMCP:
+    """Create and configure the MCP server
 
-    @mcp.tool()
-    def multiply(a: int, b: int) -> int:
-        """Multiply two numbers"""
-        return a * b
+    Pass your own ``tool_cache`` to read its hit/miss counters via ``stats()``,
+    or your own ``metrics`` to read request metrics in-process. Metrics are
+    also served as the ``metrics://server`` resource and, on SSE/HTTP, as
+    Prometheus text on ``metrics_path`` (``None`` disables the endpoint).
+    ``admission`` sets the session/in-flight/send-buffer caps past which
+    requests are shed with "server busy" errors. Tool schemas are read from
+    ``schema_cache`` when it is current (default: ``MCP_SCHEMA_CACHE`` or
+    the per-user cache, looked up on each call; ``False`` rebuilds them
+    every start).
+    ``single_flight`` shares one execution between identical concurrent
+    calls of ``@coalesced`` tools and reads of the same ``@coalesced`` resource.
+    ``scheduler`` rate-limits tool calls per client and shares execution
+    slots fairly between clients. ``resources`` are opened when the server
+    starts, closed when it stops and injected into tools with ``shared()``
+    (default: a pooled ``http`` client). ``deadlines`` cancel tool calls
+    and resource reads that outlive the budget their client sent. Keep a reference to
+    ``catalog`` to add, update and remove tools and resources while the
+    server runs; clients refresh their lists by delta.
+    """
+    mcp = FastMCP(name, lifespan=(resources or default_resources()).lifespan)
+    tool_cache = tool_cache or ToolResultCache()
+    mcp.add_middleware(tool_cache)
+    # Inside the result cache, so concurrent misses for the same key run once
+    single_flight = single_flight or SingleFlight()
+    mcp.add_middleware(single_flight)
+    static = StaticResources(mcp)
 
-    @mcp.tool()
-    def greet(name: str) -> str:
-        """Greet someone by name"""
-        return f"Hello, {name}!"
+    if schema_cache is None:
+        schema_cache = default_schema_cache()
+    register_lazy_tools(mcp, TOOLS, package=__package__, schema_cache=schema_cache or None)
 
-    @mcp.resource("config://app")
+    @static.resource("config://app")
     def get_config() -> str:
         """Get application configuration"""
         return "App configuration data"
 
-    @mcp.resource("config://version")
+    @static.resource("config://version")
     def get_version() -> str:
         """Get server version"""
         return "1.0.0"
 
+    catalog = (catalog or Catalog()).install(mcp, caches=[tool_cache, single_flight], static=static)
+    # Inside admission control, so shed requests never queue for a slot
+    scheduler = (scheduler or FairScheduler()).install(mcp)
+    # Queueing for a slot counts against the caller's deadline
+    deadlines = (deadlines or Deadlines()).install(mcp)
+    admission = (admission or AdmissionControl()).install(mcp)
+
+    # Installed last so it wraps every handler, including static resources and shed requests
+    metrics = (metrics or ServerMetrics()).install(mcp, http_path=metrics_path)
+    metrics.register_gauges(admission.gauges)
+    metrics.register_gauges(single_flight.gauges)
+    metrics.register_gauges(scheduler.gauges)
+    metrics.register_gauges(deadlines.gauges)
+    metrics.register_gauges(catalog.gauges)
+    metrics.register_histograms(scheduler.histograms)
+
     return mcp
@@ -0,0 +1,105 @@
+"""
+Result memoization for pure tools
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from fastmcp.exceptions import NotFoundError
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from ..common.codec import get_codec
+from ..common.ttl_cache import TTLCache
+
+CACHE_ATTR = "__mcp_cache__"
+
+
+@dataclass(frozen=True)
+class ToolCacheConfig:
+    """Memoization settings attached to a tool function"""
+
+    maxsize: int = 128
+    ttl: Optional[float] = None
+
+
+def cached_tool(maxsize: int = 128, ttl: Optional[float] = None) -> Callable:
+    """Mark a tool as pure so repeated identical calls are answered from memory
+
+    Apply it below ``@mcp.tool()``::
+
+        @mcp.tool()
+        @cached_tool(maxsize=256)
+        def add(a: int, b: int) -> int: ...
+
+    ``ttl=None`` keeps entries until they are evicted as least recently used.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        setattr(fn, CACHE_ATTR, ToolCacheConfig(maxsize=maxsize, ttl=ttl))
+        return fn
+
+    return decorator
+
+
+def canonical_arguments(arguments: Optional[Dict[str, Any]]) -> str:
+    """Stable cache key for tool arguments regardless of key order"""
+    return get_codec().dumps(arguments or {}, sort_keys=True).decode()
+
+
+class ToolResultCache(Middleware):
+    """Serves @cached_tool calls from memory, skipping validation and execution
+
+    The stored value is the converted ToolResult (MCP content blocks and
+    structured content), so a hit only costs the final JSON-RPC encode.
+    """
+
+    def __init__(self):
+        self._configs: Dict[str, Optional[ToolCacheConfig]] = {}
+        self._caches: Dict[str, TTLCache] = {}
+
+    async def _config_for(self, name: str, context: MiddlewareContext) -> Optional[ToolCacheConfig]:
+        if name not in self._configs:
+            config = None
+            server = context.fastmcp_context.fastmcp if context.fastmcp_context else None
+            if server is not None:
+                try:
+                    tool = await server.get_tool(name)
+                    config = getattr(getattr(tool, "fn", None), CACHE_ATTR, None)
+                except NotFoundError:
+                    return None
+            self._configs[name] = config
+            if config is not None:
+                # ttl=None means no expiry; TTLCache still bounds by LRU size
+                self._caches[name] = TTLCache(
+                    maxsize=config.maxsize, ttl=config.ttl if config.ttl is not None else float("inf")
+                )
+        return self._configs[name]
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        name = context.message.name
+        config = await self._config_for(name, context)
+        if config is None:
+            return await call_next(context)
+
+        cache = self._caches[name]
+        key = canonical_arguments(context.message.arguments)
+        result = cache.get(key)
+        if result is None:
+            result = await call_next(context)
+            cache.set(key, result)
+        return result
+
+    def forget(self, name: Optional[str] = None):
+        """Drop cached results (and the cached lookup) for one tool or all tools"""
+        if name is None:
+            self._configs.clear()
+            self._caches.clear()
+        else:
+            self._configs.pop(name, None)
+            self._caches.pop(name, None)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters and current size per cached tool"""
+        return {
+            name: {"hits": cache.hits, "misses": cache.misses, "size": len(cache)}
+            for name, cache in self._caches.items()
+        }
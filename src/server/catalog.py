@@ -0,0 +1,395 @@
+"""
+Versioned tool/resource catalog: runtime changes, and list replies holding only what changed
+"""
+import asyncio
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import anyio
+import fastmcp
+import mcp.types as types
+from fastmcp import FastMCP
+from fastmcp.exceptions import NotFoundError
+from fastmcp.resources import Resource
+from fastmcp.server.dependencies import get_context
+from fastmcp.tools.tool import Tool
+
+# _meta keys used on tools/list and resources/list requests and results
+VERSION_KEY = "catalogVersion"
+SINCE_KEY = "catalogSince"
+DELTA_KEY = "delta"
+REMOVED_KEY = "removed"
+
+TOOLS = "tools"
+RESOURCES = "resources"
+
+# List result type, and the key identifying an entry, per kind
+_RESULTS = {TOOLS: types.ListToolsResult, RESOURCES: types.ListResourcesResult}
+_CHANGED = {TOOLS: types.ToolListChangedNotification, RESOURCES: types.ResourceListChangedNotification}
+_KEYS: Dict[str, Callable[[Any], str]] = {TOOLS: lambda tool: tool.name, RESOURCES: lambda resource: str(resource.uri)}
+
+# Private FastMCP/mcp attributes the catalog reads or replaces (checked by install)
+_INTERNALS: Dict[str, Any] = {
+    "_tool_manager._tools": dict,
+    "_resource_manager._resources": dict,
+    "_mcp_server._tool_cache": dict,
+    "_mcp_server.request_handlers": dict,
+    "_list_tools_mcp": Callable,
+    "_list_resources_mcp": Callable,
+}
+
+# Catalog of each server, for current_catalog() to look up
+_catalogs: "weakref.WeakKeyDictionary[FastMCP, Catalog]" = weakref.WeakKeyDictionary()
+
+
+class _Listing:
+    """Versioned snapshot of one list, remembering the version each entry last changed in
+
+    Entries are kept in change order, so a delta walks back only over the
+    entries changed since the client's version. Removals leave tombstones,
+    ``history`` at most; a client older than the oldest one dropped gets
+    the full list.
+    """
+
+    def __init__(self, kind: str, history: int):
+        self.kind = kind
+        self.history = history
+        self.version = 0
+        self.items: Dict[str, Any] = {}
+        self._digests: Dict[str, str] = {}
+        self._changed: "OrderedDict[str, int]" = OrderedDict()
+        self._removed: "OrderedDict[str, int]" = OrderedDict()
+        self._floor = 0
+
+    def update(self, items: List[Any]) -> bool:
+        """Take a fresh full list; returns True if it differs from the previous one"""
+        key = _KEYS[self.kind]
+        current = {key(item): item for item in items}
+        digests = {}
+        for name, item in current.items():
+            # Comparing with the previous entry is several times cheaper than serializing it
+            if name in self._digests and self.items.get(name) == item:
+                digests[name] = self._digests[name]
+            else:
+                digests[name] = item.model_dump_json(by_alias=True, exclude_none=True)
+        changed = [name for name, data in digests.items() if self._digests.get(name) != data]
+        removed = [name for name in self._digests if name not in current]
+        first = self.version == 0
+        self.items = current
+        self._digests = digests
+        if not first and not changed and not removed:
+            return False
+        self.version += 1
+        for name in changed:
+            self._changed[name] = self.version
+            self._changed.move_to_end(name)
+            self._removed.pop(name, None)
+        for name in removed:
+            self._changed.pop(name, None)
+            self._removed[name] = self.version
+        while len(self._removed) > self.history:
+            _, version = self._removed.popitem(last=False)
+            self._floor = max(self._floor, version)
+        return not first
+
+    def delta(self, since: int) -> Optional[Tuple[List[Any], List[str]]]:
+        """Entries changed and names removed after ``since``; None if that version is unknown"""
+        if since < max(self._floor, 1) or since > self.version:
+            return None
+        changed = []
+        for name, version in reversed(self._changed.items()):
+            if version <= since:
+                break
+            changed.append(self.items[name])
+        removed = []
+        for name, version in reversed(self._removed.items()):
+            if version <= since:
+                break
+            removed.append(name)
+        return changed[::-1], removed[::-1]
+
+
+class Catalog:
+    """Tools and resources that change at runtime, listed by delta
+
+    ``tools/list`` and ``resources/list`` replies carry
+    ``_meta.catalogVersion``. A client that sends it back as
+    ``_meta.catalogSince`` gets only the entries added or changed since
+    then, with ``_meta.delta`` set and removed names in ``_meta.removed``.
+    An unknown or expired version gets the full list. Changes made with
+    ``add_tool``/``update_tool``/``remove_tool`` (and the resource
+    equivalents) in the same event loop tick are announced together with
+    one list-changed notification to every session that listed them.
+    Changing a tool drops what ``caches`` (``ToolResultCache``,
+    ``SingleFlight``) remember about it; changing a resource drops its
+    pre-rendered ``static`` reply and the ``@coalesced`` lookup, and sends
+    resource-updated notifications.
+    """
+
+    def __init__(self, history: int = 1024):
+        self.history = history
+        # Versions from another process or an earlier run never match
+        self.epoch = uuid.uuid4().hex[:8]
+        self._listings = {kind: _Listing(kind, history) for kind in _RESULTS}
+        self._subscribers: Dict[str, "weakref.WeakSet"] = {kind: weakref.WeakSet() for kind in _RESULTS}
+        self._dirty: Set[str] = set()
+        self._announce: Set[str] = set()
+        self._updated: Set[str] = set()
+        self._caches: List[Any] = []
+        self._static = None
+        self._lock = anyio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self.mcp: Optional[FastMCP] = None
+        self.replies = {"full": 0, "delta": 0}
+        self.notifications = 0
+
+    def install(self, mcp: FastMCP, caches: Iterable[Any] = (), static=None):
+        """Serve a server's tool and resource lists from the catalog
+
+        ``caches`` have a ``forget(tool_name)`` method; ``static`` is the
+        server's StaticResources. Raises RuntimeError if this FastMCP
+        release lacks the private attributes the catalog relies on.
+        """
+        _check_internals(mcp)
+        self.mcp = mcp
+        self._caches = list(caches)
+        self._static = static
+        _catalogs[mcp] = self
+        handlers = mcp._mcp_server.request_handlers
+        for kind, request_type in ((TOOLS, types.ListToolsRequest), (RESOURCES, types.ListResourcesRequest)):
+            handler = handlers.get(request_type)
+            if handler is not None:
+                handlers[request_type] = self._wrap(kind, handler)
+        return self
+
+    def _server(self) -> FastMCP:
+        if self.mcp is None:
+            raise RuntimeError("Catalog is not installed on a server (pass it to create_server)")
+        return self.mcp
+
+    # Runtime registry
+
+    def add_tool(self, tool: Union[Tool, Callable], **kwargs) -> Tool:
+        """Add a tool to the running server, replacing one of the same name
+
+        ``tool`` is a FastMCP Tool or a function; ``kwargs`` go to
+        ``Tool.from_function`` (name, description, annotations...).
+        """
+        mcp = self._server()
+        if not isinstance(tool, Tool):
+            tool = Tool.from_function(tool, **kwargs)
+        # Replacing through the manager directly skips FastMCP's duplicate warning
+        mcp._tool_manager._tools.pop(tool.key, None)
+        mcp._tool_manager.add_tool(tool)
+        self._tool_changed(tool.key)
+        return tool
+
+    def update_tool(self, name: str, **changes) -> Tool:
+        """Change fields of a listed tool (description, annotations, enabled...)"""
+        tools = self._server()._tool_manager._tools
+        if name not in tools:
+            raise NotFoundError(f"Unknown tool: {name!r}")
+        tools[name] = tools[name].model_copy(update=changes)
+        self._tool_changed(name)
+        return tools[name]
+
+    def remove_tool(self, name: str) -> bool:
+        """Remove a tool; returns False if there was none"""
+        if self._server()._tool_manager._tools.pop(name, None) is None:
+            return False
+        self._tool_changed(name)
+        return True
+
+    def add_resource(self, resource: Union[Resource, Callable], uri: Optional[str] = None, **kwargs) -> Resource:
+        """Add a resource to the running server, replacing one with the same URI
+
+        ``resource`` is a FastMCP Resource or a function returning its
+        contents, registered at ``uri``.
+        """
+        mcp = self._server()
+        if not isinstance(resource, Resource):
+            if uri is None:
+                raise ValueError("A resource function needs a uri")
+            resource = Resource.from_function(resource, uri=uri, **kwargs)
+        replaced = mcp._resource_manager._resources.pop(resource.key, None) is not None
+        mcp._resource_manager.add_resource(resource)
+        self._resource_changed(resource.key, replaced)
+        return resource
+
+    def update_resource(self, uri: str, **changes) -> Resource:
+        """Change fields of a listed resource (name, description, mime_type...)"""
+        resources = self._server()._resource_manager._resources
+        if uri not in resources:
+            raise NotFoundError(f"Unknown resource: {uri!r}")
+        resources[uri] = resources[uri].model_copy(update=changes)
+        self._resource_changed(uri)
+        return resources[uri]
+
+    def remove_resource(self, uri: str) -> bool:
+        """Remove a resource; returns False if there was none"""
+        if self._server()._resource_manager._resources.pop(uri, None) is None:
+            return False
+        self._resource_changed(uri)
+        return True
+
+    def _tool_changed(self, name: str):
+        # Memoized results and the @cached_tool/@coalesced lookups belong to the old tool
+        for cache in self._caches:
+            cache.forget(name)
+        self.changed(TOOLS)
+
+    def _resource_changed(self, uri: str, existed: bool = True):
+        if self._static is not None:
+            self._static.discard(uri)
+        for cache in self._caches:
+            forget_resource = getattr(cache, "forget_resource", None)
+            if forget_resource is not None:
+                forget_resource(uri)
+        if existed:
+            # Clients drop what they cached of the old contents
+            self._updated.add(uri)
+        self.changed(RESOURCES)
+
+    def changed(self, kind: Optional[str] = None):
+        """Mark the tool (or resource, or both) list as changed
+
+        The registry methods call this. Call it after changing the server
+        some other way, such as ``mcp.add_tool`` outside a request.
+        """
+        self._dirty.update([kind] if kind else _RESULTS)
+        self._schedule()
+
+    def version(self, kind: str = TOOLS) -> str:
+        """Current version of the tool or resource list, as sent to clients"""
+        return f"{self.epoch}-{self._listings[kind].version}"
+
+    # Serving
+
+    def _schedule(self):
+        if self._flush_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not serving yet: the next list request picks the change up
+            return
+        self._flush_task = loop.create_task(self._flush())
+
+    async def _flush(self):
+        """Rebuild changed lists once per batch of changes and announce new versions"""
+        try:
+            while self._dirty or self._announce or self._updated:
+                async with self._lock:
+                    for kind in list(self._dirty):
+                        await self._refresh(kind)
+                kinds, self._announce = self._announce, set()
+                for kind in kinds:
+                    await self._notify(kind)
+                uris, self._updated = self._updated, set()
+                for uri in uris:
+                    params = types.ResourceUpdatedNotificationParams(uri=uri)
+                    await self._broadcast(RESOURCES, types.ResourceUpdatedNotification(params=params))
+        finally:
+            self._flush_task = None
+
+    async def _refresh(self, kind: str):
+        """Rebuild one list through FastMCP (and its middleware); call with the lock held"""
+        self._dirty.discard(kind)
+        mcp = self._server()
+        if kind == TOOLS:
+            items = await mcp._list_tools_mcp()
+            # What the low-level server's own list handler does, for input validation
+            mcp._mcp_server._tool_cache = {tool.name: tool for tool in items}
+        else:
+            items = await mcp._list_resources_mcp()
+        if self._listings[kind].update(items):
+            self._announce.add(kind)
+            self._schedule()
+
+    async def _notify(self, kind: str):
+        params = types.NotificationParams(_meta={VERSION_KEY: self.version(kind)})
+        await self._broadcast(kind, _CHANGED[kind](params=params))
+
+    async def _broadcast(self, kind: str, notification):
+        notification = types.ServerNotification(notification)
+        for session in list(self._subscribers[kind]):
+            try:
+                await session.send_notification(notification)
+                self.notifications += 1
+            except Exception:
+                # Closed session (or a stateless HTTP request that has ended)
+                self._subscribers[kind].discard(session)
+
+    def _since(self, req) -> Optional[int]:
+        meta = req.params.meta if req.params is not None else None
+        since = getattr(meta, SINCE_KEY, None) if meta is not None else None
+        if not isinstance(since, str):
+            return None
+        epoch, _, version = since.rpartition("-")
+        if epoch != self.epoch or not version.isdigit():
+            return None
+        return int(version)
+
+    def _wrap(self, kind: str, handler):
+        async def listed(req):
+            # Paginated requests, and mcp's own cache refresh (req=None), take the normal path
+            if req is None or (req.params is not None and req.params.cursor):
+                return await handler(req)
+            try:
+                self._subscribers[kind].add(self._server()._mcp_server.request_context.session)
+            except LookupError:
+                pass
+            since = self._since(req)
+            listing = self._listings[kind]
+            async with self._lock:
+                # A full list costs what FastMCP's handler always did, and catches untracked changes
+                if since is None or kind in self._dirty or listing.version == 0:
+                    await self._refresh(kind)
+                delta = listing.delta(since) if since is not None else None
+                version = self.version(kind)
+                if delta is None:
+                    self.replies["full"] += 1
+                    items, meta = list(listing.items.values()), {VERSION_KEY: version}
+                else:
+                    self.replies["delta"] += 1
+                    items, removed = delta
+                    meta = {VERSION_KEY: version, DELTA_KEY: True, REMOVED_KEY: removed}
+            return types.ServerResult(_RESULTS[kind](**{kind: items}, _meta=meta))
+
+        return listed
+
+    def gauges(self) -> Dict[str, int]:
+        """Catalog versions and reply counts for ServerMetrics"""
+        return {
+            "catalog_tools_version": self._listings[TOOLS].version,
+            "catalog_resources_version": self._listings[RESOURCES].version,
+            "catalog_full_replies_total": self.replies["full"],
+            "catalog_delta_replies_total": self.replies["delta"],
+            "catalog_notifications_total": self.notifications,
+        }
+
+
+def _check_internals(mcp: FastMCP):
+    """Fail at startup, rather than serve stale lists, when FastMCP's internals have moved"""
+    missing = []
+    for path, kind in _INTERNALS.items():
+        target = mcp
+        for attr in path.split("."):
+            target = getattr(target, attr, None)
+        if not (callable(target) if kind is Callable else isinstance(target, kind)):
+            missing.append(path)
+    if missing:
+        raise RuntimeError(
+            f"Catalog does not support fastmcp {fastmcp.__version__}: FastMCP has no {', '.join(missing)} "
+            "(written against fastmcp 2.14)"
+        )
+
+
+def current_catalog() -> Catalog:
+    """Catalog of the server handling the current request, for tools that change it"""
+    catalog = _catalogs.get(get_context().fastmcp)
+    if catalog is None:
+        raise RuntimeError("Server has no Catalog (create it with create_server)")
+    return catalog
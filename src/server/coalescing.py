@@ -0,0 +1,168 @@
+"""
+Single-flight: concurrent identical tool calls and resource reads share one execution
+"""
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from fastmcp.exceptions import NotFoundError
+from fastmcp.resources.template import match_uri_template
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from .caching import canonical_arguments
+from .streaming import STREAM_KEY
+
+COALESCE_ATTR = "__mcp_coalesce__"
+
+
+def coalesced(fn: Callable) -> Callable:
+    """Mark a tool or resource so concurrent identical requests run it once
+
+    Apply it below ``@mcp.tool()`` or ``@mcp.resource()``::
+
+        @mcp.tool()
+        @coalesced
+        def fetch_report(report_id: str) -> str: ...
+
+    Only use it where the result does not depend on who is asking.
+    """
+    if getattr(fn, "streamed", False):
+        raise TypeError(f"Streamed tool '{fn.__name__}' sends chunks to one caller and cannot be coalesced")
+    setattr(fn, COALESCE_ATTR, True)
+    return fn
+
+
+class FlightStats:
+    """Executions started and callers that joined one already running"""
+
+    __slots__ = ("executions", "coalesced")
+
+    def __init__(self):
+        self.executions = 0
+        self.coalesced = 0
+
+
+class SingleFlight(Middleware):
+    """Fans the result of one in-flight execution out to identical requests
+
+    Tools take part when marked ``@coalesced`` or listed in ``tools``, and
+    resource reads when the resource or template is marked ``@coalesced`` or
+    its URI or URI template is listed in ``resources``. Requests
+    asking for a streamed result always run on their own, and progress of a
+    shared execution is only reported to the caller that started it. The
+    shared execution keeps running if that caller goes away, so the other
+    waiters still get the result. Stats are kept for the ``max_stats`` most
+    recently used tools and URIs.
+    """
+
+    def __init__(self, tools: Iterable[str] = (), resources: Iterable[str] = (), max_stats: int = 1024):
+        self.tools = set(tools)
+        self.resources = set(resources)
+        self.max_stats = max_stats
+        self._enabled: Dict[str, bool] = {}
+        # URIs and URI templates of @coalesced resources, looked up on first read
+        self._marked: Optional[FrozenSet[str]] = None
+        self._flights: Dict[Tuple[str, str, str], asyncio.Task] = {}
+        self._stats: "OrderedDict[Tuple[str, str], FlightStats]" = OrderedDict()
+        self.executions = 0
+        self.coalesced = 0
+
+    async def _tool_enabled(self, name: str, context: MiddlewareContext) -> bool:
+        if name in self.tools:
+            return True
+        if name not in self._enabled:
+            server = context.fastmcp_context.fastmcp if context.fastmcp_context else None
+            if server is None:
+                return False
+            try:
+                tool = await server.get_tool(name)
+            except NotFoundError:
+                return False
+            self._enabled[name] = bool(getattr(getattr(tool, "fn", None), COALESCE_ATTR, False))
+        return self._enabled[name]
+
+    async def _resource_enabled(self, uri: str, context: MiddlewareContext) -> bool:
+        if self._marked is None:
+            server = context.fastmcp_context.fastmcp if context.fastmcp_context else None
+            if server is None:
+                return False
+            candidates = {**await server.get_resources(), **await server.get_resource_templates()}
+            self._marked = frozenset(
+                key for key, item in candidates.items() if getattr(getattr(item, "fn", None), COALESCE_ATTR, False)
+            )
+        patterns = self.resources | self._marked
+        if uri in patterns:
+            return True
+        return any("{" in pattern and match_uri_template(uri, pattern) is not None for pattern in patterns)
+
+    @staticmethod
+    def _wants_stream(context: MiddlewareContext) -> bool:
+        request_context = context.fastmcp_context.request_context if context.fastmcp_context else None
+        meta = request_context.meta if request_context else None
+        return meta is not None and bool(getattr(meta, STREAM_KEY, False))
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        name = context.message.name
+        if self._wants_stream(context) or not await self._tool_enabled(name, context):
+            return await call_next(context)
+        key = ("tool", name, canonical_arguments(context.message.arguments))
+        return await self._share(key, lambda: call_next(context))
+
+    async def on_read_resource(self, context: MiddlewareContext, call_next):
+        uri = str(context.message.uri)
+        if self._wants_stream(context) or not await self._resource_enabled(uri, context):
+            return await call_next(context)
+        key = ("resource", uri, "")
+        return await self._share(key, lambda: call_next(context))
+
+    async def _share(self, key: Tuple[str, str, str], run: Callable[[], Awaitable[Any]]):
+        stats = self._stats.get(key[:2])
+        if stats is None:
+            stats = self._stats[key[:2]] = FlightStats()
+            if len(self._stats) > self.max_stats:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(key[:2])
+        flight = self._flights.get(key)
+        if flight is None:
+            stats.executions += 1
+            self.executions += 1
+            flight = self._flights[key] = asyncio.ensure_future(run())
+            flight.add_done_callback(lambda done: self._land(key, done))
+        else:
+            stats.coalesced += 1
+            self.coalesced += 1
+        # shield: one waiter being cancelled must not cancel the shared execution
+        return await asyncio.shield(flight)
+
+    def _land(self, key: Tuple[str, str, str], flight: asyncio.Task):
+        self._flights.pop(key, None)
+        if not flight.cancelled():
+            # Mark the error retrieved even if every waiter was cancelled
+            flight.exception()
+
+    def forget(self, name: Optional[str] = None):
+        """Drop the cached ``@coalesced`` lookup for one tool or all tools"""
+        if name is None:
+            self._enabled.clear()
+        else:
+            self._enabled.pop(name, None)
+
+    def forget_resource(self, uri: Optional[str] = None):
+        """Look up which resources are ``@coalesced`` again on the next read"""
+        self._marked = None
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Executions and coalesced callers per tool / resource URI, most recently used last"""
+        return {
+            f"{kind}:{name}": {"executions": stats.executions, "coalesced": stats.coalesced}
+            for (kind, name), stats in self._stats.items()
+        }
+
+    def gauges(self) -> Dict[str, int]:
+        """Totals for ServerMetrics"""
+        return {
+            "singleflight_in_flight": len(self._flights),
+            "singleflight_executions_total": self.executions,
+            "singleflight_coalesced_total": self.coalesced,
+        }
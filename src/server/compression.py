@@ -0,0 +1,204 @@
+"""
+Negotiated response compression for the streamable-HTTP and SSE endpoints
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..common.compression import DEFAULT_LEVELS, available_encodings, get_encoder, negotiate
+
+# JSON replies, SSE streams and text; anything else (images, archives) goes out as is
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+@dataclass
+class CompressionPolicy:
+    """Which responses to compress and how
+
+    Bodies smaller than ``minimum_size`` are sent as is: below about a
+    kilobyte the coding overhead and CPU outweigh the bytes saved. A stream
+    still open and under the threshold after ``lookahead`` seconds is
+    compressed from then on, so a small first event is never held longer.
+    """
+
+    minimum_size: int = 1024
+    lookahead: float = 0.005
+    encodings: Tuple[str, ...] = field(default_factory=available_encodings)
+    levels: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_LEVELS))
+
+
+class CompressionStats:
+    """Bytes before and after compression, for ServerMetrics"""
+
+    __slots__ = ("compressed", "skipped", "bytes_in", "bytes_out")
+
+    def __init__(self):
+        self.compressed = 0
+        self.skipped = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def gauges(self) -> Dict[str, int]:
+        return {
+            "compression_responses_total": self.compressed,
+            "compression_skipped_total": self.skipped,
+            "compression_bytes_in_total": self.bytes_in,
+            "compression_bytes_out_total": self.bytes_out,
+        }
+
+
+def _compressible(start: Message) -> bool:
+    if start["status"] < 200 or start["status"] in (204, 304):
+        return False
+    headers = Headers(raw=start.get("headers", []))
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return any(content_type.startswith(t) for t in COMPRESSIBLE_TYPES)
+
+
+class _Responder:
+    """Compression state of one response
+
+    The response start is held until the body is known to be large enough,
+    ends, or ``lookahead`` runs out. Once compressing, every body chunk is
+    flushed, so SSE events reach the client as soon as they are sent and
+    later events compress against earlier ones.
+    """
+
+    def __init__(self, send: Send, encoding: str, policy: CompressionPolicy, stats: CompressionStats, tg):
+        self._send = send
+        self.encoding = encoding
+        self.policy = policy
+        self.stats = stats
+        self._tg = tg
+        self._lock = anyio.Lock()
+        self._start: Optional[Message] = None
+        self._buffer: List[bytes] = []
+        self._size = 0
+        self._encoder = None
+        self._timer: Optional[anyio.CancelScope] = None
+        # "pending" until decided, then "compress" or "passthrough"
+        self.mode = "passthrough"
+
+    async def send(self, message: Message):
+        kind = message["type"]
+        if kind == "http.response.start":
+            if _compressible(message):
+                self._start, self.mode = message, "pending"
+            else:
+                await self._send(message)
+            return
+        if kind != "http.response.body" or self.mode == "passthrough":
+            await self._send(message)
+            return
+        async with self._lock:
+            body, more = message.get("body", b""), message.get("more_body", False)
+            if self.mode == "compress":
+                await self._send_compressed(body, more)
+                return
+            self._buffer.append(body)
+            self._size += len(body)
+            if not more:
+                self._stop_timer()
+                if self._size < self.policy.minimum_size:
+                    await self._send_plain()
+                else:
+                    await self._begin(more=False)
+            elif self._size >= self.policy.minimum_size:
+                self._stop_timer()
+                await self._begin(more=True)
+            elif self._timer is None:
+                self._timer = anyio.CancelScope()
+                self._tg.start_soon(self._expire, self._timer)
+
+    async def _expire(self, scope: anyio.CancelScope):
+        with scope:
+            await anyio.sleep(self.policy.lookahead)
+            async with self._lock:
+                if self.mode == "pending":
+                    await self._begin(more=True)
+
+    def _stop_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+
+    async def _send_plain(self):
+        self.mode = "passthrough"
+        self.stats.skipped += 1
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": b"".join(self._buffer), "more_body": False})
+        self._buffer.clear()
+
+    async def _begin(self, more: bool):
+        """Switch to compressing; sends the held start and buffered body"""
+        self.mode = "compress"
+        self.stats.compressed += 1
+        self._encoder = get_encoder(self.encoding, self.policy.levels.get(self.encoding))
+        body = b"".join(self._buffer)
+        self._buffer.clear()
+        headers = MutableHeaders(raw=list(self._start.get("headers", [])))
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if more:
+            del headers["content-length"]
+            await self._send({**self._start, "headers": headers.raw})
+            await self._send_compressed(body, more=True)
+            return
+        data = self._encoder.compress(body) + self._encoder.finish()
+        headers["content-length"] = str(len(data))
+        self.stats.bytes_in += len(body)
+        self.stats.bytes_out += len(data)
+        await self._send({**self._start, "headers": headers.raw})
+        await self._send({"type": "http.response.body", "body": data, "more_body": False})
+
+    async def _send_compressed(self, body: bytes, more: bool):
+        data = self._encoder.compress(body, flush=more)
+        if not more:
+            data += self._encoder.finish()
+        self.stats.bytes_in += len(body)
+        self.stats.bytes_out += len(data)
+        await self._send({"type": "http.response.body", "body": data, "more_body": more})
+
+
+class CompressionMiddleware:
+    """Compresses large responses with the best coding the client accepts
+
+    Starlette's GZipMiddleware skips ``text/event-stream``, which carries
+    every streamable-HTTP reply and the whole SSE session, and buffers
+    what it does compress. This one negotiates zstd/br/gzip and streams.
+    """
+
+    def __init__(self, app: ASGIApp, policy: Optional[CompressionPolicy] = None, stats: Optional[CompressionStats] = None):
+        self.app = app
+        self.policy = policy or CompressionPolicy()
+        self.stats = stats or CompressionStats()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), self.policy.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        async with anyio.create_task_group() as tg:
+            responder = _Responder(send, encoding, self.policy, self.stats, tg)
+            try:
+                await self.app(scope, receive, responder.send)
+            finally:
+                responder._stop_timer()
+
+
+def compression_middleware(
+    policy: Optional[CompressionPolicy] = None, stats: Optional[CompressionStats] = None
+) -> List[Middleware]:
+    """Middleware list for ``http_app``/``run``; empty when ``policy`` has no encodings"""
+    policy = policy or CompressionPolicy()
+    if not policy.encodings:
+        return []
+    return [Middleware(CompressionMiddleware, policy=policy, stats=stats)]
@@ -0,0 +1,90 @@
+"""
+Per-call deadlines: stop working on tool calls and resource reads whose client has given up
+"""
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+import anyio
+import mcp.types as types
+from fastmcp import FastMCP
+from mcp.shared.exceptions import McpError
+
+# Request _meta key with the caller's remaining budget in milliseconds
+DEADLINE_META = "timeoutMs"
+# The code mcp's ClientSession raises when a request times out on the client
+DEADLINE_EXCEEDED = 408
+
+_deadline: ContextVar[Optional[float]] = ContextVar("mcp_request_deadline", default=None)
+
+
+def request_deadline() -> Optional[float]:
+    """``time.monotonic()`` by which the current tool call or read must finish, if the client set one"""
+    return _deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current tool call's or read's deadline"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+class Deadlines:
+    """Cancels tool calls and resource reads that outlive the budget sent in ``_meta.timeoutMs``
+
+    A relative budget avoids depending on synchronised clocks. The client
+    also sends ``notifications/cancelled`` when it gives up, but that can
+    arrive late or never. Time spent waiting for admission or a scheduler
+    slot counts, and ``max_timeout`` caps what a client may ask for.
+    """
+
+    def __init__(self, max_timeout: Optional[float] = None):
+        self.max_timeout = max_timeout
+        self.expired = 0
+
+    def install(self, mcp: FastMCP):
+        """Enforce deadlines on every tool call and resource read of a server"""
+        handlers = mcp._mcp_server.request_handlers
+        for request_type in (types.CallToolRequest, types.ReadResourceRequest):
+            handler = handlers.get(request_type)
+            if handler is not None:
+                handlers[request_type] = self._wrap(handler)
+        return self
+
+    def _timeout(self, req) -> Optional[float]:
+        meta = req.params.meta
+        budget = getattr(meta, DEADLINE_META, None) if meta is not None else None
+        if not isinstance(budget, (int, float)) or isinstance(budget, bool):
+            timeout = None
+        else:
+            timeout = budget / 1000
+        if self.max_timeout is not None:
+            timeout = self.max_timeout if timeout is None else min(timeout, self.max_timeout)
+        return timeout
+
+    def _wrap(self, handler):
+        async def bounded(req):
+            timeout = self._timeout(req) if req is not None else None
+            if timeout is None:
+                return await handler(req)
+            token = _deadline.set(time.monotonic() + timeout)
+            try:
+                with anyio.move_on_after(max(timeout, 0)):
+                    return await handler(req)
+            finally:
+                _deadline.reset(token)
+            # Only reached when the deadline cancelled the handler
+            self.expired += 1
+            raise McpError(
+                types.ErrorData(
+                    code=DEADLINE_EXCEEDED,
+                    message=f"Deadline exceeded: '{getattr(req.params, 'name', None) or req.params.uri}' "
+                    f"did not finish within {timeout:g}s",
+                )
+            )
+
+        return bounded
+
+    def gauges(self) -> Dict[str, int]:
+        """Expired call count for ServerMetrics"""
+        return {"deadline_expired_total": self.expired}
@@ -0,0 +1,156 @@
+"""
+Per-tool execution policies: run blocking tools on thread or process pools
+"""
+import asyncio
+import functools
+import importlib
+import inspect
+import multiprocessing
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Literal, Optional
+
+import anyio
+from fastmcp.exceptions import ToolError
+
+Policy = Literal["inline", "thread", "process"]
+POLICIES = ("inline", "thread", "process")
+
+
+class ToolExecutors:
+    """Lazily created thread and process pools shared by offloaded tools
+
+    Worker processes are spawned, not forked: a child forked while a
+    transport thread is blocked reading stdin deadlocks closing its copy.
+    """
+
+    def __init__(
+        self,
+        thread_workers: Optional[int] = None,
+        process_workers: Optional[int] = None,
+        start_method: str = "spawn",
+    ):
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self.start_method = start_method
+        self._pools: Dict[str, Executor] = {}
+
+    def get(self, policy: Policy) -> Executor:
+        """Executor backing a thread/process policy"""
+        pool = self._pools.get(policy)
+        if pool is None:
+            if policy == "thread":
+                pool = ThreadPoolExecutor(self.thread_workers, thread_name_prefix="mcp-tool")
+            elif policy == "process":
+                pool = ProcessPoolExecutor(
+                    self.process_workers, mp_context=multiprocessing.get_context(self.start_method)
+                )
+            else:
+                raise ValueError(f"No executor for policy: {policy}")
+            self._pools[policy] = pool
+        return pool
+
+    def shutdown(self, wait: bool = True):
+        """Stop every pool created so far; a later call starts new ones"""
+        pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.shutdown(wait=wait)
+
+    async def aclose(self):
+        """``shutdown`` without blocking the event loop, for SharedResources"""
+        await anyio.to_thread.run_sync(self.shutdown)
+
+
+default_executors = ToolExecutors()
+
+# Module attribute an offloaded process tool's undecorated function is kept under
+_PROCESS_ALIAS = "_offloaded_{}"
+
+
+def _run_in_process(module: str, name: str, args: tuple, kwargs: dict):
+    """Worker-side trampoline: import the tool's module and call the undecorated function
+
+    Pickling the function itself would resolve its qualname to the
+    decorated tool, so the worker looks it up under its alias instead.
+    """
+    fn = getattr(importlib.import_module(module), _PROCESS_ALIAS.format(name))
+    return fn(*args, **kwargs)
+
+
+class _PendingGate:
+    """Counts calls queued or running on an executor and rejects past a limit"""
+
+    def __init__(self, name: str, limit: Optional[int]):
+        self.name = name
+        self.limit = limit
+        self.pending = 0
+
+    def enter(self):
+        if self.limit is not None and self.pending >= self.limit:
+            raise ToolError(f"Tool '{self.name}' is busy ({self.pending} calls pending), retry later")
+        self.pending += 1
+
+    def leave(self, _future=None):
+        self.pending -= 1
+
+
+def offload(
+    policy: Policy = "thread",
+    timeout: Optional[float] = None,
+    max_pending: Optional[int] = None,
+    executors: Optional[ToolExecutors] = None,
+) -> Callable:
+    """Choose where a sync tool runs so it cannot stall the event loop
+
+    Apply it below ``@mcp.tool()``::
+
+        @mcp.tool()
+        @offload("thread", timeout=10, max_pending=32)
+        def fetch_report(report_id: str) -> str: ...
+
+    ``max_pending`` caps calls queued or running for this tool; extra calls
+    fail fast with a "busy" tool error. ``timeout`` returns an error to the
+    caller, but the executor cannot interrupt work that already started, so
+    it keeps counting against ``max_pending`` until it finishes. ``process``
+    tools must be module-level functions so worker processes can import them;
+    the undecorated function is kept on its module as ``_offloaded_<name>``.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown execution policy: {policy!r} (expected one of {POLICIES})")
+
+    def decorator(fn: Callable) -> Callable:
+        if policy == "inline":
+            return fn
+        if inspect.iscoroutinefunction(fn):
+            raise TypeError(f"Tool '{fn.__name__}' is async and already runs on the event loop")
+        if policy == "process":
+            if fn.__qualname__ != fn.__name__ or fn.__module__ not in sys.modules:
+                raise ValueError(f"Tool '{fn.__name__}' must be a module-level function to run in a process")
+            setattr(sys.modules[fn.__module__], _PROCESS_ALIAS.format(fn.__name__), fn)
+            call = functools.partial(_run_in_process, fn.__module__, fn.__name__)
+        else:
+            call = lambda args, kwargs: fn(*args, **kwargs)  # noqa: E731
+
+        gate = _PendingGate(fn.__name__, max_pending)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            gate.enter()
+            try:
+                pool = (executors or default_executors).get(policy)
+                future = asyncio.get_running_loop().run_in_executor(pool, call, args, kwargs)
+            except BaseException:
+                gate.leave()
+                raise
+            future.add_done_callback(gate.leave)
+            if timeout is None:
+                return await future
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                raise ToolError(f"Tool '{fn.__name__}' timed out after {timeout}s") from None
+
+        wrapper.execution_policy = policy
+        return wrapper
+
+    return decorator
@@ -0,0 +1,374 @@
+"""
+Multi-worker launcher for the HTTP/SSE servers
+"""
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+from typing import List, Optional
+
+from ..common.compression import PREFERENCE, available_encodings
+from .admission import AdmissionControl, AdmissionLimits
+from .base_server import create_server
+from .compression import CompressionPolicy, CompressionStats, compression_middleware
+from .metrics import ServerMetrics
+from .resumption import ReplayBuffer, resumable_http_app
+from .scheduling import FairScheduler, SchedulingPolicy
+
+# Workers that die faster than this after starting count towards the crash budget
+MIN_WORKER_UPTIME = 5.0
+MAX_FAST_CRASHES = 5
+
+
+class CrashLoopError(RuntimeError):
+    """Workers kept exiting right after starting, so the supervisor gave up"""
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Bind the listening socket shared by every worker"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(
+    sock: socket.socket,
+    name: str,
+    transport: str,
+    graceful_timeout: float,
+    limits: Optional[AdmissionLimits] = None,
+    policy: Optional[SchedulingPolicy] = None,
+    compression: Optional[CompressionPolicy] = None,
+):
+    """Worker entry point: build a server and serve on the inherited socket"""
+    import uvicorn
+
+    mcp = create_server(name, admission=AdmissionControl(limits), scheduler=FairScheduler(policy))
+    # Any worker may receive any request, so streamable-http runs stateless
+    app = mcp.http_app(
+        transport=transport, stateless_http=transport != "sse", middleware=compression_middleware(compression)
+    )
+    config = uvicorn.Config(
+        app,
+        lifespan="on",
+        log_level="warning",
+        timeout_graceful_shutdown=int(graceful_timeout),
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class Worker:
+    """A supervised worker process"""
+
+    def __init__(self, process: multiprocessing.Process):
+        self.process = process
+        self.started_at = time.monotonic()
+
+    @property
+    def uptime(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+class Supervisor:
+    """Pre-forks N workers on one socket, restarting crashed ones
+
+    SIGHUP rolls every worker (new one up, old one drained) and SIGTERM or
+    SIGINT drains them all and exits.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        workers: int,
+        name: str = "MCP Server",
+        transport: str = "http",
+        graceful_timeout: float = 10.0,
+        limits: Optional[AdmissionLimits] = None,
+        policy: Optional[SchedulingPolicy] = None,
+        compression: Optional[CompressionPolicy] = None,
+    ):
+        self.sock = sock
+        self.size = workers
+        self.name = name
+        self.transport = transport
+        self.graceful_timeout = graceful_timeout
+        self.limits = limits
+        self.policy = policy
+        self.compression = compression
+        self.workers: List[Worker] = []
+        self._context = multiprocessing.get_context("spawn")
+        self._stopping = False
+        self._reload = False
+        self._fast_crashes = 0
+
+    def spawn(self) -> Worker:
+        process = self._context.Process(
+            target=run_worker,
+            args=(
+                self.sock, self.name, self.transport, self.graceful_timeout, self.limits, self.policy, self.compression
+            ),
+            daemon=False,
+        )
+        process.start()
+        worker = Worker(process)
+        self.workers.append(worker)
+        return worker
+
+    def stop_worker(self, worker: Worker):
+        """Ask a worker to drain, killing it if it outlives graceful_timeout"""
+        worker.process.terminate()
+        worker.process.join(self.graceful_timeout + 1)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        if worker in self.workers:
+            self.workers.remove(worker)
+
+    def restart_all(self):
+        """Rolling restart: start a replacement before stopping each old worker"""
+        for old in list(self.workers):
+            self.spawn()
+            self.stop_worker(old)
+
+    def check_workers(self):
+        """Replace workers that exited, giving up if they keep crashing on start"""
+        for worker in list(self.workers):
+            if worker.process.is_alive():
+                continue
+            self.workers.remove(worker)
+            if worker.uptime < MIN_WORKER_UPTIME:
+                self._fast_crashes += 1
+                if self._fast_crashes >= MAX_FAST_CRASHES:
+                    raise CrashLoopError(
+                        f"Workers keep exiting on startup (last exit code {worker.process.exitcode})"
+                    )
+            else:
+                self._fast_crashes = 0
+            print(f"⚠️  Worker {worker.process.pid} exited ({worker.process.exitcode}), restarting")
+            self.spawn()
+
+    def _on_stop(self, signum, frame):
+        self._stopping = True
+
+    def _on_reload(self, signum, frame):
+        self._reload = True
+
+    def run(self):
+        """Start the workers and supervise them until asked to stop"""
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGTERM, self._on_stop)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self._on_reload)
+
+        for _ in range(self.size):
+            self.spawn()
+        print(f"👷 Started {self.size} workers (supervisor pid {os.getpid()})")
+
+        try:
+            while not self._stopping:
+                time.sleep(0.5)
+                if self._reload:
+                    self._reload = False
+                    print("🔄 Rolling restart of all workers")
+                    self.restart_all()
+                self.check_workers()
+        finally:
+            for worker in list(self.workers):
+                worker.process.terminate()
+            for worker in list(self.workers):
+                self.stop_worker(worker)
+            self.sock.close()
+
+
+def serve(
+    name: str = "MCP Server",
+    transport: str = "sse",
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    graceful_timeout: float = 10.0,
+    limits: Optional[AdmissionLimits] = None,
+    replay_buffer: int = 128,
+    retry_interval: int = 500,
+    policy: Optional[SchedulingPolicy] = None,
+    compression: Optional[CompressionPolicy] = None,
+):
+    """Run the server in one process, or pre-forked across `workers` processes
+
+    ``limits`` and the scheduling ``policy`` apply per process. A single
+    streamable-http process keeps the last ``replay_buffer`` events of every
+    reply stream so clients resume after a dropped connection (0 disables it).
+    Responses are compressed per ``compression`` (default: every available
+    coding above 1 KiB; ``CompressionPolicy(encodings=())`` turns it off).
+    """
+    if workers <= 1:
+        if transport in ("http", "streamable-http") and replay_buffer:
+            import uvicorn
+
+            metrics = ServerMetrics()
+            mcp = create_server(
+                name, metrics=metrics, admission=AdmissionControl(limits), scheduler=FairScheduler(policy)
+            )
+            buffer = ReplayBuffer(max_events_per_stream=replay_buffer)
+            stats = CompressionStats()
+            metrics.register_gauges(buffer.gauges)
+            metrics.register_gauges(stats.gauges)
+            app = resumable_http_app(
+                mcp, buffer, retry_interval=retry_interval, middleware=compression_middleware(compression, stats)
+            )
+            uvicorn.Server(
+                uvicorn.Config(app, host=host, port=port, lifespan="on", timeout_graceful_shutdown=int(graceful_timeout))
+            ).run()
+            return
+        mcp = create_server(name, admission=AdmissionControl(limits), scheduler=FairScheduler(policy))
+        mcp.run(transport=transport, host=host, port=port, middleware=compression_middleware(compression))
+        return
+
+    if transport == "sse":
+        # The SSE stream and its POSTed messages arrive on different
+        # connections, which the kernel may hand to different workers
+        raise ValueError(
+            "SSE sessions live in a single process; use transport='http' "
+            "(stateless streamable-http) with more than one worker"
+        )
+    Supervisor(bind_socket(host, port), workers, name, transport, graceful_timeout, limits, policy, compression).run()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser, transport: str = "sse"):
+    """Add the shared --host/--port/--transport/--workers options to a parser"""
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--transport", choices=["sse", "http", "streamable-http"], default=transport)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes sharing the listening socket (default: 1)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=float,
+        default=10.0,
+        help="Seconds a worker may spend draining on restart/shutdown",
+    )
+    defaults = AdmissionLimits()
+    parser.add_argument("--max-sessions", type=int, default=defaults.max_sessions,
+                        help="Concurrent sessions per process before new ones are refused")
+    parser.add_argument("--max-in-flight", type=int, default=defaults.max_in_flight,
+                        help="Requests handled at once per process before shedding")
+    parser.add_argument("--max-in-flight-per-session", type=int, default=defaults.max_in_flight_per_session,
+                        help="Requests handled at once per session before shedding")
+    parser.add_argument("--max-send-buffer", type=int, default=defaults.max_send_buffer,
+                        help="Replies queued for a slow client before its requests are shed")
+    parser.add_argument("--replay-buffer", type=int, default=128,
+                        help="Events kept per reply stream for clients resuming after a disconnect "
+                             "(single-process streamable-http; 0 disables)")
+    parser.add_argument("--retry-interval", type=int, default=500,
+                        help="Milliseconds a disconnected client waits before resuming")
+    scheduling = SchedulingPolicy()
+    parser.add_argument("--client-rate", type=float, default=0,
+                        help="Tool calls per second allowed per client (0: unlimited)")
+    parser.add_argument("--client-burst", type=int, default=scheduling.burst,
+                        help="Calls a client may make at once before --client-rate applies")
+    parser.add_argument("--max-concurrency", type=int, default=scheduling.max_concurrency or 0,
+                        help="Tool calls running at once per process, shared fairly between clients (0: unlimited)")
+    parser.add_argument("--tool-concurrency", action="append", default=[], metavar="TOOL=N",
+                        help="Cap concurrent calls of one tool (repeatable)")
+    parser.add_argument("--tool-rate", action="append", default=[], metavar="TOOL=RATE",
+                        help="Calls per second per client for one tool (repeatable)")
+    parser.add_argument("--max-queue-wait", type=float, default=scheduling.max_wait,
+                        help="Seconds a call may wait for a token or slot before 'server busy'")
+    compression = CompressionPolicy()
+    parser.add_argument("--compression", default="auto", metavar="CODINGS",
+                        help="Comma-separated response codings in order of preference "
+                             f"(from {', '.join(PREFERENCE)}), 'auto' for all installed, or 'off'")
+    parser.add_argument("--compress-min-size", type=int, default=compression.minimum_size,
+                        help="Smallest response body in bytes worth compressing")
+    return parser
+
+
+def limits_from_args(args: argparse.Namespace) -> AdmissionLimits:
+    """AdmissionLimits from the options added by add_server_arguments (0 disables a cap)"""
+    return AdmissionLimits(
+        max_sessions=args.max_sessions or None,
+        max_in_flight=args.max_in_flight or None,
+        max_in_flight_per_session=args.max_in_flight_per_session or None,
+        max_send_buffer=args.max_send_buffer or None,
+    )
+
+
+def _assignments(values: List[str], kind: type) -> dict:
+    """Parse repeated NAME=VALUE options"""
+    parsed = {}
+    for value in values:
+        name, _, number = value.partition("=")
+        if not name or not number:
+            raise ValueError(f"Expected NAME=VALUE, got {value!r}")
+        parsed[name] = kind(number)
+    return parsed
+
+
+def policy_from_args(args: argparse.Namespace) -> SchedulingPolicy:
+    """SchedulingPolicy from the options added by add_server_arguments (0 disables a cap)"""
+    return SchedulingPolicy(
+        rate=args.client_rate or None,
+        burst=args.client_burst,
+        tool_rates=_assignments(args.tool_rate, float),
+        max_concurrency=args.max_concurrency or None,
+        tool_concurrency=_assignments(args.tool_concurrency, int),
+        max_wait=args.max_queue_wait,
+    )
+
+
+def compression_from_args(args: argparse.Namespace) -> CompressionPolicy:
+    """CompressionPolicy from the options added by add_server_arguments"""
+    if args.compression == "auto":
+        encodings = available_encodings()
+    elif args.compression == "off":
+        encodings = ()
+    else:
+        encodings = tuple(e.strip() for e in args.compression.split(",") if e.strip())
+        missing = [e for e in encodings if e not in available_encodings()]
+        if missing:
+            raise ValueError(
+                f"Compression {', '.join(missing)} not available (installed: {', '.join(available_encodings())})"
+            )
+    return CompressionPolicy(minimum_size=args.compress_min_size, encodings=encodings)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = add_server_arguments(argparse.ArgumentParser(description="Run the MCP server"))
+    parser.add_argument("--name", default="MCP Server")
+    args = parser.parse_args(argv)
+    try:
+        serve(
+            args.name,
+            args.transport,
+            args.host,
+            args.port,
+            args.workers,
+            args.graceful_timeout,
+            limits=limits_from_args(args),
+            replay_buffer=args.replay_buffer,
+            retry_interval=args.retry_interval,
+            policy=policy_from_args(args),
+            compression=compression_from_args(args),
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+    except CrashLoopError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Server lifespan owning long-lived resources (HTTP clients, DB pools) shared by tools
+"""
+import inspect
+import weakref
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, Callable, Dict, Optional
+
+import anyio
+from fastmcp import FastMCP
+from fastmcp.dependencies import Depends
+from fastmcp.server.dependencies import get_context
+
+# Returns the resource, an awaitable of it, or an async context manager yielding it
+ResourceFactory = Callable[[], Any]
+
+# Resources of each running server, for shared() to look up
+_running: "weakref.WeakKeyDictionary[FastMCP, SharedResources]" = weakref.WeakKeyDictionary()
+
+
+class SharedResources:
+    """Named resources created once when the server starts and closed when it stops
+
+    Pass ``lifespan`` to FastMCP (``create_server`` does). Context managers
+    stay entered for the server's lifetime; other resources are closed with
+    their ``aclose()`` or ``close()``, in reverse order of creation. Tools
+    receive them through ``shared(name)`` parameters.
+    """
+
+    def __init__(self, factories: Optional[Dict[str, ResourceFactory]] = None):
+        self._factories: Dict[str, ResourceFactory] = dict(factories or {})
+        self._values: Dict[str, Any] = {}
+        self.running = False
+
+    def add(self, name: str, factory: ResourceFactory) -> "SharedResources":
+        """Register a resource factory, replacing any resource of the same name"""
+        if self.running:
+            raise RuntimeError("Shared resources are created at startup; add them before the server starts")
+        self._factories[name] = factory
+        return self
+
+    def provide(self, name: str) -> Callable[[ResourceFactory], ResourceFactory]:
+        """Decorator form of ``add``"""
+
+        def decorator(factory: ResourceFactory) -> ResourceFactory:
+            self.add(name, factory)
+            return factory
+
+        return decorator
+
+    @staticmethod
+    async def _open(stack: AsyncExitStack, factory: ResourceFactory) -> Any:
+        value = factory()
+        if inspect.isawaitable(value):
+            value = await value
+        if hasattr(value, "__aenter__"):
+            return await stack.enter_async_context(value)
+        close = getattr(value, "aclose", None) or getattr(value, "close", None)
+        if close is not None:
+            if inspect.iscoroutinefunction(close):
+                stack.push_async_callback(close)
+            else:
+                stack.callback(close)
+        return value
+
+    @asynccontextmanager
+    async def lifespan(self, server: FastMCP):
+        """FastMCP lifespan: open every resource, yield them by name, close them on shutdown"""
+        stack = AsyncExitStack()
+        try:
+            for name, factory in self._factories.items():
+                self._values[name] = await self._open(stack, factory)
+            _running[server] = self
+            self.running = True
+            yield dict(self._values)
+        finally:
+            self.running = False
+            self._values.clear()
+            _running.pop(server, None)
+            # The lifespan is often left through a cancellation, which would cut every close short
+            with anyio.CancelScope(shield=True):
+                await stack.aclose()
+
+    def get(self, name: str) -> Any:
+        """A resource of the running server"""
+        try:
+            return self._values[name]
+        except KeyError:
+            if not self.running:
+                raise RuntimeError(f"Shared resource {name!r} is only available while the server runs") from None
+            raise KeyError(f"No shared resource named {name!r}") from None
+
+
+def current_resources() -> SharedResources:
+    """Shared resources of the server handling the current request"""
+    resources = _running.get(get_context().fastmcp)
+    if resources is None:
+        raise RuntimeError("Server has no running SharedResources (create it with create_server)")
+    return resources
+
+
+def shared(name: str) -> Any:
+    """Parameter default injecting a shared resource into a tool
+
+    ``async def fetch(url: str, http: httpx.AsyncClient = shared("http"))``;
+    the parameter is left out of the tool's input schema.
+    """
+
+    async def resolve():
+        return current_resources().get(name)
+
+    return Depends(resolve)
+
+
+def default_resources(http_timeout: float = 30.0, max_connections: int = 100) -> SharedResources:
+    """Resources every server gets
+
+    ``http`` is one pooled keep-alive httpx.AsyncClient, and ``executors``
+    the pools of ``@offload`` tools, shut down when the server stops.
+    """
+
+    def http_client():
+        import httpx
+
+        return httpx.AsyncClient(
+            timeout=http_timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    def executors():
+        from .execution import default_executors
+
+        return default_executors
+
+    return SharedResources({"http": http_client, "executors": executors})
@@ -0,0 +1,260 @@
+"""
+Request metrics for the MCP server, exported as a resource and Prometheus text
+"""
+import functools
+import json
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import mcp.types as types
+from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from ..common.codec import get_codec
+
+# Latency buckets in seconds (upper bounds, Prometheus style)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS_URI = "metrics://server"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, cumulative count) pairs ending with +Inf"""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+
+class MethodStats:
+    """Counters for one (method, name) pair"""
+
+    __slots__ = ("calls", "errors", "in_flight", "latency", "request_bytes", "response_bytes")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.latency = Histogram(buckets)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _request_target(req: Any) -> Tuple[Optional[str], int]:
+    """Name label and approximate payload size of an incoming request"""
+    params = getattr(req, "params", None)
+    if isinstance(req, types.CallToolRequest):
+        arguments = params.arguments or {}
+        return params.name, len(get_codec().dumps(arguments))
+    if isinstance(req, types.ReadResourceRequest):
+        return str(params.uri), 0
+    return None, 0
+
+
+def _response_size(result: Any) -> Tuple[int, bool]:
+    """Approximate body size of a result and whether it reports an error"""
+    root = getattr(result, "root", result)
+    size = 0
+    for item in getattr(root, "content", None) or getattr(root, "contents", None) or ():
+        text = getattr(item, "text", None)
+        if text is None:
+            text = getattr(item, "blob", None) or getattr(item, "data", None) or ""
+        size += len(text)
+    return size, bool(getattr(root, "isError", False))
+
+
+class ServerMetrics:
+    """Per-method call counts, errors, latency, in-flight and payload sizes
+
+    ``install`` wraps the low-level request handlers, so every request is
+    measured once, including tool-cache hits and pre-rendered resources.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.started_at = time.time()
+        self._stats: Dict[Tuple[str, Optional[str]], MethodStats] = {}
+        self._gauges: List[Callable[[], Dict[str, float]]] = []
+        self._histograms: List[Callable[[], Dict[str, Tuple[str, Dict[str, Histogram]]]]] = []
+
+    def stats(self, method: str, name: Optional[str] = None) -> MethodStats:
+        key = (method, name)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = MethodStats(self.buckets)
+        return stats
+
+    def register_gauges(self, source: Callable[[], Dict[str, float]]):
+        """Export extra values read at scrape time; names ending in _total are counters"""
+        self._gauges.append(source)
+
+    def register_histograms(self, source: Callable[[], Dict[str, Tuple[str, Dict[str, Histogram]]]]):
+        """Export labelled histograms read at scrape time: {name: (label, {value: Histogram})}"""
+        self._histograms.append(source)
+
+    def histograms(self) -> Dict[str, Tuple[str, Dict[str, Histogram]]]:
+        values = {}
+        for source in self._histograms:
+            values.update(source())
+        return values
+
+    def gauges(self) -> Dict[str, float]:
+        values = {}
+        for source in self._gauges:
+            values.update(source())
+        return values
+
+    def install(self, mcp: FastMCP, http_path: Optional[str] = "/metrics"):
+        """Instrument every request handler and expose the metrics"""
+        handlers = mcp._mcp_server.request_handlers
+        for request_type, handler in list(handlers.items()):
+            handlers[request_type] = self._wrap(handler)
+
+        @mcp.resource(METRICS_URI, mime_type="application/json")
+        def server_metrics() -> str:
+            """Server request metrics"""
+            return json.dumps(self.snapshot())
+
+        if http_path:
+            @mcp.custom_route(http_path, methods=["GET"])
+            async def prometheus_metrics(request: Request) -> PlainTextResponse:
+                return PlainTextResponse(
+                    self.render_prometheus(), media_type="text/plain; version=0.0.4"
+                )
+
+        return self
+
+    def _wrap(self, handler):
+        @functools.wraps(handler)
+        async def measured(req):
+            if req is None:
+                # Internal call (call_tool refreshes the tool list this way), not a client request
+                return await handler(req)
+            name, request_bytes = _request_target(req)
+            stats = self.stats(req.method, name)
+            stats.calls += 1
+            stats.in_flight += 1
+            stats.request_bytes += request_bytes
+            started = time.perf_counter()
+            try:
+                result = await handler(req)
+            except BaseException:
+                stats.errors += 1
+                raise
+            else:
+                response_bytes, failed = _response_size(result)
+                stats.response_bytes += response_bytes
+                stats.errors += failed
+                return result
+            finally:
+                stats.latency.observe(time.perf_counter() - started)
+                stats.in_flight -= 1
+
+        return measured
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-friendly view of every counter"""
+        methods = []
+        for (method, name), stats in sorted(self._stats.items(), key=lambda item: (item[0][0], item[0][1] or "")):
+            latency = stats.latency
+            methods.append(
+                {
+                    "method": method,
+                    "name": name,
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "in_flight": stats.in_flight,
+                    "latency_seconds": {
+                        "sum": latency.sum,
+                        "count": latency.count,
+                        "buckets": dict(latency.cumulative()),
+                    },
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                }
+            )
+        return {
+            "uptime_seconds": time.time() - self.started_at,
+            "methods": methods,
+            "gauges": self.gauges(),
+            "histograms": {
+                name: {
+                    value: {"sum": h.sum, "count": h.count, "buckets": dict(h.cumulative())}
+                    for value, h in series.items()
+                }
+                for name, (label, series) in self.histograms().items()
+            },
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format"""
+        lines = [
+            "# HELP mcp_requests_total MCP requests handled",
+            "# TYPE mcp_requests_total counter",
+        ]
+        series = sorted(self._stats.items(), key=lambda item: (item[0][0], item[0][1] or ""))
+
+        def labels(method: str, name: Optional[str], extra: str = "") -> str:
+            parts = [f'method="{method}"']
+            if name is not None:
+                parts.append(f'name="{_escape(name)}"')
+            if extra:
+                parts.append(extra)
+            return "{" + ",".join(parts) + "}"
+
+        lines += [f"mcp_requests_total{labels(m, n)} {s.calls}" for (m, n), s in series]
+        lines += ["# HELP mcp_request_errors_total MCP requests that failed", "# TYPE mcp_request_errors_total counter"]
+        lines += [f"mcp_request_errors_total{labels(m, n)} {s.errors}" for (m, n), s in series]
+        lines += ["# HELP mcp_requests_in_flight MCP requests being handled", "# TYPE mcp_requests_in_flight gauge"]
+        lines += [f"mcp_requests_in_flight{labels(m, n)} {s.in_flight}" for (m, n), s in series]
+        lines += ["# HELP mcp_request_bytes_total Approximate request payload bytes", "# TYPE mcp_request_bytes_total counter"]
+        lines += [f"mcp_request_bytes_total{labels(m, n)} {s.request_bytes}" for (m, n), s in series]
+        lines += ["# HELP mcp_response_bytes_total Approximate response payload bytes", "# TYPE mcp_response_bytes_total counter"]
+        lines += [f"mcp_response_bytes_total{labels(m, n)} {s.response_bytes}" for (m, n), s in series]
+        lines += [
+            "# HELP mcp_request_duration_seconds MCP request handling time",
+            "# TYPE mcp_request_duration_seconds histogram",
+        ]
+        for (method, name), stats in series:
+            for le, count in stats.latency.cumulative():
+                bucket = labels(method, name, 'le="%s"' % le)
+                lines.append(f"mcp_request_duration_seconds_bucket{bucket} {count}")
+            lines.append(f"mcp_request_duration_seconds_sum{labels(method, name)} {stats.latency.sum}")
+            lines.append(f"mcp_request_duration_seconds_count{labels(method, name)} {stats.latency.count}")
+        for metric, (label, series) in sorted(self.histograms().items()):
+            lines.append(f"# TYPE mcp_{metric} histogram")
+            for value, histogram in sorted(series.items()):
+                selector = f'{label}="{_escape(value)}"'
+                for le, count in histogram.cumulative():
+                    lines.append(f'mcp_{metric}_bucket{{{selector},le="{le}"}} {count}')
+                lines.append(f"mcp_{metric}_sum{{{selector}}} {histogram.sum}")
+                lines.append(f"mcp_{metric}_count{{{selector}}} {histogram.count}")
+        for key, value in sorted(self.gauges().items()):
+            kind = "counter" if key.endswith("_total") else "gauge"
+            lines += [f"# TYPE mcp_{key} {kind}", f"mcp_{key} {value}"]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,209 @@
+"""
+Lazy tool registry: declare tools up front, import and build them on first use
+"""
+import functools
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import fastmcp
+import pydantic
+from fastmcp import FastMCP
+from fastmcp.tools.tool import FunctionTool, Tool, ToolResult
+
+# Under the home directory; set MCP_SCHEMA_CACHE to an empty string to turn the on-disk cache off
+DEFAULT_SCHEMA_CACHE = Path(".cache") / "mcp-fastmcp2" / "tool-schemas.json"
+
+# Modules in this package whose decorators rewrite tool signatures, and so the schemas built from them
+SCHEMA_MODULES = ("caching", "coalescing", "execution", "lifespan", "registry", "streaming")
+
+
+def default_schema_cache() -> Optional[Path]:
+    """Schema cache path from MCP_SCHEMA_CACHE, or the per-user default, as of now"""
+    path = os.environ.get("MCP_SCHEMA_CACHE")
+    if path is None:
+        return Path.home() / DEFAULT_SCHEMA_CACHE
+    return Path(path) if path else None
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Cheap declaration of a tool: its name and "module:function" target"""
+
+    name: str
+    target: str
+    description: Optional[str] = None
+
+
+def _split_target(target: str, package: Optional[str]) -> Tuple[str, str]:
+    module, _, attribute = target.partition(":")
+    if not attribute:
+        raise ValueError(f"Tool target must look like 'module:function', got {target!r}")
+    if module.startswith(".") and package:
+        module = importlib.util.resolve_name(module, package)
+    return module, attribute
+
+
+def resolve_target(target: str, package: Optional[str] = None) -> Callable:
+    """Import "module:function" (relative modules resolved against package)"""
+    module, attribute = _split_target(target, package)
+    return getattr(importlib.import_module(module), attribute)
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_fingerprint() -> str:
+    """Versions of what turns a function into a schema, besides its own module"""
+    here = Path(__file__).parent
+    parts = [fastmcp.__version__, pydantic.VERSION]
+    for name in SCHEMA_MODULES:
+        try:
+            stat = os.stat(here / f"{name}.py")
+        except OSError:
+            parts.append(f"{name}:missing")
+            continue
+        parts.append(f"{name}:{stat.st_mtime_ns}:{stat.st_size}")
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:16]
+
+
+def source_fingerprint(target: str, package: Optional[str] = None) -> Optional[str]:
+    """Identify the implementation's source file version without importing it
+
+    Also covers the fastmcp and pydantic versions and the decorator modules
+    in ``SCHEMA_MODULES``, so editing any of them rebuilds cached schemas.
+    """
+    module, _ = _split_target(target, package)
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin or not os.path.exists(spec.origin):
+        return None
+    stat = os.stat(spec.origin)
+    return f"{_schema_fingerprint()}:{spec.origin}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+# Built implementations, shared by every copy the tool manager makes of a LazyTool
+_implementations: Dict[Tuple[str, str], FunctionTool] = {}
+
+
+class LazyTool(Tool):
+    """Tool listed from cached metadata; its module is imported on first call"""
+
+    target: str
+    package: Optional[str] = None
+
+    def load(self) -> FunctionTool:
+        """Import the implementation and build the real tool (once)"""
+        key = (self.name, self.target)
+        implementation = _implementations.get(key)
+        if implementation is None:
+            implementation = FunctionTool.from_function(
+                resolve_target(self.target, self.package),
+                name=self.name,
+                description=self.description,
+            )
+            _implementations[key] = implementation
+        return implementation
+
+    @property
+    def fn(self) -> Callable:
+        return self.load().fn
+
+    @property
+    def loaded(self) -> bool:
+        return (self.name, self.target) in _implementations
+
+    async def run(self, arguments: Dict[str, Any]) -> ToolResult:
+        return await self.load().run(arguments)
+
+
+class SchemaCache:
+    """JSON file of tool metadata keyed by tool name and source fingerprint"""
+
+    def __init__(self, path: Optional[Path]):
+        self.path = Path(path) if path else None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        if self.path is not None:
+            try:
+                self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def get(self, spec: ToolSpec, fingerprint: Optional[str]) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(spec.name)
+        if entry and fingerprint and entry.get("fingerprint") == fingerprint and entry.get("target") == spec.target:
+            return entry
+        return None
+
+    def put(self, spec: ToolSpec, fingerprint: Optional[str], tool: Tool):
+        if fingerprint is None:
+            return
+        self.entries[spec.name] = {
+            "target": spec.target,
+            "fingerprint": fingerprint,
+            "description": tool.description,
+            "parameters": tool.parameters,
+            "output_schema": tool.output_schema,
+        }
+        self.dirty = True
+
+    def save(self):
+        """Write the cache if it changed; an unwritable location is not an error"""
+        if self.path is None or not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            temporary.write_text(json.dumps(self.entries, indent=1, sort_keys=True), encoding="utf-8")
+            os.replace(temporary, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+
+
+def register_lazy_tools(
+    mcp: FastMCP,
+    specs: Iterable[ToolSpec],
+    package: Optional[str] = None,
+    schema_cache: Optional[Path] = None,
+) -> Dict[str, LazyTool]:
+    """Register tools whose modules are imported only when first called
+
+    Schemas come from ``schema_cache`` while the implementation's source
+    file and the decorators it uses are unchanged; otherwise the tool is built once at startup and its
+    schema written back for the next process.
+    """
+    cache = SchemaCache(schema_cache)
+    tools = {}
+    for spec in specs:
+        fingerprint = source_fingerprint(spec.target, package)
+        entry = cache.get(spec, fingerprint)
+        if entry is None:
+            built = FunctionTool.from_function(
+                resolve_target(spec.target, package), name=spec.name, description=spec.description
+            )
+            _implementations[(spec.name, spec.target)] = built
+            cache.put(spec, fingerprint, built)
+            entry = {
+                "description": built.description,
+                "parameters": built.parameters,
+                "output_schema": built.output_schema,
+            }
+        tool = LazyTool(
+            name=spec.name,
+            description=spec.description or entry["description"],
+            parameters=entry["parameters"],
+            output_schema=entry["output_schema"],
+            target=spec.target,
+            package=package,
+        )
+        mcp.add_tool(tool)
+        tools[spec.name] = tool
+    cache.save()
+    return tools
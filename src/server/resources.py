@@ -0,0 +1,165 @@
+"""
+Pre-rendered static resources with ETag-style conditional reads
+"""
+import asyncio
+import base64
+import hashlib
+import weakref
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set, Union
+
+import mcp.types as types
+from fastmcp import FastMCP
+
+# _meta keys used on resources/read requests and results
+ETAG_KEY = "etag"
+IF_NONE_MATCH_KEY = "ifNoneMatch"
+NOT_MODIFIED_KEY = "notModified"
+
+
+def content_etag(content: Union[str, bytes]) -> str:
+    """Hash identifying one version of a resource body"""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+@dataclass
+class RenderedResource:
+    """A resource body serialized once, with its full and not-modified replies"""
+
+    fn: Callable
+    etag: str
+    result: types.ServerResult
+    not_modified: types.ServerResult
+
+
+class StaticResources:
+    """Registers resources whose contents are rendered once and served pre-built
+
+    Reads of a static resource skip the FastMCP resource pipeline entirely. The
+    reply carries ``_meta.etag``; a read whose ``_meta.ifNoneMatch`` equals the
+    current etag gets an empty ``notModified`` reply instead of the body.
+    Call ``refresh(uri)`` after the underlying data changes: sessions that
+    read a static resource get ``notifications/resources/updated`` for each
+    one whose contents changed.
+    """
+
+    def __init__(self, mcp: FastMCP):
+        self.mcp = mcp
+        self._rendered: Dict[str, RenderedResource] = {}
+        self._mime_types: Dict[str, str] = {}
+        self._readers: "weakref.WeakSet" = weakref.WeakSet()
+        self._updated: Set[str] = set()
+        self._notify_task: Optional[asyncio.Task] = None
+        handlers = mcp._mcp_server.request_handlers
+        self._fallback = handlers[types.ReadResourceRequest]
+        handlers[types.ReadResourceRequest] = self._handle_read
+        self.not_modified = 0
+        self.notifications = 0
+
+    def resource(self, uri: str, mime_type: str = "text/plain", **kwargs) -> Callable:
+        """Decorator registering a static resource and rendering it immediately"""
+
+        def decorator(fn: Callable) -> Callable:
+            self.mcp.resource(uri, mime_type=mime_type, **kwargs)(fn)
+            self._mime_types[uri] = mime_type
+            self._render(uri, fn)
+            return fn
+
+        return decorator
+
+    def _render(self, uri: str, fn: Callable) -> bool:
+        content = fn()
+        if not isinstance(content, (str, bytes)):
+            content = str(content)
+        etag = content_etag(content)
+        previous = self._rendered.get(uri)
+        if previous is not None and previous.etag == etag:
+            return False
+
+        mime_type = self._mime_types[uri]
+        if isinstance(content, str):
+            contents = types.TextResourceContents(uri=uri, text=content, mimeType=mime_type)
+        else:
+            contents = types.BlobResourceContents(
+                uri=uri, blob=base64.b64encode(content).decode(), mimeType=mime_type
+            )
+        self._rendered[uri] = RenderedResource(
+            fn=fn,
+            etag=etag,
+            result=types.ServerResult(
+                types.ReadResourceResult(contents=[contents], _meta={ETAG_KEY: etag})
+            ),
+            not_modified=types.ServerResult(
+                types.ReadResourceResult(contents=[], _meta={ETAG_KEY: etag, NOT_MODIFIED_KEY: True})
+            ),
+        )
+        return True
+
+    def refresh(self, uri: Optional[str] = None) -> bool:
+        """Re-render one (or every) static resource; returns True if anything changed
+
+        Changed resources are announced to the sessions that read static
+        resources once the caller yields to the event loop.
+        """
+        uris = [uri] if uri is not None else list(self._rendered)
+        changed = False
+        for key in uris:
+            if self._render(key, self._rendered[key].fn):
+                self._updated.add(key)
+                changed = True
+        if changed:
+            self._schedule()
+        return changed
+
+    def _schedule(self):
+        if self._notify_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not on the event loop: the next refresh there sends these too
+            return
+        self._notify_task = loop.create_task(self._notify())
+
+    async def _notify(self):
+        """Send resource-updated notifications for every refreshed URI"""
+        try:
+            while self._updated:
+                uris, self._updated = self._updated, set()
+                for uri in sorted(uris):
+                    params = types.ResourceUpdatedNotificationParams(uri=uri)
+                    notification = types.ServerNotification(types.ResourceUpdatedNotification(params=params))
+                    for session in list(self._readers):
+                        try:
+                            await session.send_notification(notification)
+                            self.notifications += 1
+                        except Exception:
+                            # Closed session (or a stateless HTTP request that has ended)
+                            self._readers.discard(session)
+        finally:
+            self._notify_task = None
+
+    def discard(self, uri: str) -> bool:
+        """Stop serving a resource pre-rendered; returns False if it was not static"""
+        self._mime_types.pop(uri, None)
+        return self._rendered.pop(uri, None) is not None
+
+    def etag(self, uri: str) -> Optional[str]:
+        """Current etag of a static resource"""
+        rendered = self._rendered.get(uri)
+        return rendered.etag if rendered else None
+
+    async def _handle_read(self, req: types.ReadResourceRequest) -> types.ServerResult:
+        rendered = self._rendered.get(str(req.params.uri))
+        if rendered is None:
+            return await self._fallback(req)
+        try:
+            self._readers.add(self.mcp._mcp_server.request_context.session)
+        except LookupError:
+            pass
+        meta = req.params.meta
+        if meta is not None and getattr(meta, IF_NONE_MATCH_KEY, None) == rendered.etag:
+            self.not_modified += 1
+            return rendered.not_modified
+        return rendered.result
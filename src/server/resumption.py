@@ -0,0 +1,178 @@
+"""
+Resumable streamable-HTTP sessions: a bounded per-session replay buffer keyed by event ID
+"""
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from fastmcp import FastMCP
+from mcp.server.streamable_http import (
+    MCP_SESSION_ID_HEADER,
+    EventCallback,
+    EventId,
+    EventMessage,
+    EventStore,
+    StreamId,
+)
+from mcp.types import JSONRPCMessage
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_SESSION_HEADER = MCP_SESSION_ID_HEADER.encode("latin-1")
+
+
+class _SessionRef:
+    """Session of the HTTP request being served; filled in from the reply if new"""
+
+    __slots__ = ("session_id",)
+
+    def __init__(self, session_id: Optional[str]):
+        self.session_id = session_id
+
+
+_current_session: ContextVar[Optional[_SessionRef]] = ContextVar("mcp_replay_session", default=None)
+
+
+class SessionScopeMiddleware:
+    """Tells the ReplayBuffer which session stores or replays an event
+
+    mcp's EventStore API only sees stream IDs (request IDs), which every
+    session reuses. The session's message router is started while its
+    initialize request is served, so it inherits that request's
+    ``_SessionRef``, completed once the reply carries the new session ID.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        session_id = dict(scope["headers"]).get(_SESSION_HEADER)
+        ref = _SessionRef(session_id.decode("latin-1") if session_id else None)
+        token = _current_session.set(ref)
+
+        async def send_with_session(message: Message):
+            if ref.session_id is None and message["type"] == "http.response.start":
+                assigned = dict(message.get("headers", [])).get(_SESSION_HEADER)
+                if assigned:
+                    ref.session_id = assigned.decode("latin-1")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_session)
+        finally:
+            _current_session.reset(token)
+
+
+def _session_id() -> Optional[str]:
+    ref = _current_session.get()
+    return ref.session_id if ref else None
+
+
+@dataclass
+class _Stream:
+    events: Deque[Tuple[EventId, Optional[JSONRPCMessage]]]
+    touched: float
+
+
+class ReplayBuffer(EventStore):
+    """In-memory EventStore keeping the last events of every session's streams
+
+    Each (session, stream) keeps at most ``max_events_per_stream`` events;
+    at most ``max_streams`` streams are kept, least recently written first
+    out, and streams idle for ``ttl`` seconds are dropped. Event IDs are
+    random and only replay to the session that received them.
+    """
+
+    def __init__(self, max_events_per_stream: int = 128, max_streams: int = 10000, ttl: float = 300.0):
+        self.max_events_per_stream = max_events_per_stream
+        self.max_streams = max_streams
+        self.ttl = ttl
+        self._streams: "OrderedDict[Tuple[str, StreamId], _Stream]" = OrderedDict()
+        self._events: Dict[EventId, Tuple[str, StreamId]] = {}
+        self.stored = 0
+        self.replayed = 0
+        self.misses = 0
+
+    async def store_event(self, stream_id: StreamId, message: Optional[JSONRPCMessage]) -> EventId:
+        event_id = uuid.uuid4().hex
+        session_id = _session_id()
+        if session_id is None:
+            # Before the session exists (its initialize request): nothing to resume into
+            return event_id
+        key = (session_id, stream_id)
+        now = time.monotonic()
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = self._streams[key] = _Stream(deque(), now)
+        else:
+            self._streams.move_to_end(key)
+            stream.touched = now
+        if len(stream.events) >= self.max_events_per_stream:
+            dropped, _ = stream.events.popleft()
+            self._events.pop(dropped, None)
+        stream.events.append((event_id, message))
+        self._events[event_id] = key
+        self.stored += 1
+        self._expire(now)
+        return event_id
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> Optional[StreamId]:
+        key = self._events.get(last_event_id)
+        stream = self._streams.get(key) if key else None
+        if stream is None or key[0] != _session_id():
+            self.misses += 1
+            return None
+        events = list(stream.events)
+        position = next(i for i, (event_id, _) in enumerate(events) if event_id == last_event_id)
+        for event_id, message in events[position + 1:]:
+            if message is not None:
+                await send_callback(EventMessage(message, event_id))
+                self.replayed += 1
+        return key[1]
+
+    def _expire(self, now: float):
+        while self._streams:
+            key, stream = next(iter(self._streams.items()))
+            if len(self._streams) <= self.max_streams and now - stream.touched < self.ttl:
+                break
+            del self._streams[key]
+            for event_id, _ in stream.events:
+                self._events.pop(event_id, None)
+
+    def gauges(self) -> Dict[str, int]:
+        """Buffer occupancy and replay counters for ServerMetrics"""
+        return {
+            "replay_streams": len(self._streams),
+            "replay_events": len(self._events),
+            "replay_stored_total": self.stored,
+            "replay_replayed_total": self.replayed,
+            "replay_misses_total": self.misses,
+        }
+
+
+def resumable_http_app(
+    mcp: FastMCP,
+    buffer: Optional[ReplayBuffer] = None,
+    retry_interval: Optional[int] = 500,
+    middleware: Optional[List[Middleware]] = None,
+):
+    """Stateful streamable-HTTP app whose sessions survive dropped connections
+
+    Every reply stream starts with a priming event ID. A client that loses
+    the connection reconnects with ``Last-Event-ID`` after ``retry_interval``
+    milliseconds and is sent the events it missed. Its session, and any
+    call still running, carry on without a new ``initialize``. Extra
+    ``middleware`` wraps the app outside the session bookkeeping.
+    """
+    return mcp.http_app(
+        transport="http",
+        event_store=buffer or ReplayBuffer(),
+        retry_interval=retry_interval,
+        middleware=[*(middleware or []), Middleware(SessionScopeMiddleware)],
+    )
@@ -0,0 +1,306 @@
+"""
+Fair tool scheduling: per-client token buckets, weighted fair queuing, per-tool concurrency
+"""
+import asyncio
+import heapq
+import itertools
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import mcp.types as types
+from fastmcp import FastMCP
+from mcp.server.session import ServerSession
+from mcp.shared.exceptions import McpError
+
+from .admission import SERVER_BUSY
+from .deadlines import request_deadline
+from .metrics import Histogram
+
+# Waits are much shorter than handler latencies, so finer buckets
+WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+@dataclass
+class SchedulingPolicy:
+    """Limits enforced by FairScheduler; ``None`` disables a limit
+
+    ``rate``/``burst`` bound each client's tool calls per second;
+    ``tool_rates`` adds a per-client bucket for individual tools. Running
+    calls are capped at ``max_concurrency`` overall and ``tool_concurrency``
+    per tool, and waiting calls are dispatched in weighted fair order, with
+    ``weights`` keyed by client name (``clientInfo.name``). A call that would
+    wait longer than ``max_wait`` seconds is refused as "server busy".
+    There is no overall cap by default; set ``max_concurrency`` to queue
+    calls past that many.
+    """
+
+    rate: Optional[float] = None
+    burst: int = 20
+    tool_rates: Dict[str, float] = field(default_factory=dict)
+    max_concurrency: Optional[int] = None
+    tool_concurrency: Dict[str, int] = field(default_factory=dict)
+    weights: Dict[str, float] = field(default_factory=dict)
+    max_wait: float = 2.0
+    retry_after: float = 1.0
+    max_clients: int = 1000
+
+    def __post_init__(self):
+        invalid = {name: weight for name, weight in self.weights.items() if not weight > 0}
+        if invalid:
+            raise ValueError(f"Client weights must be positive, got {invalid}")
+
+
+class TokenBucket:
+    """Refills ``rate`` tokens per second up to ``burst``; may go into debt"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token; seconds until it is actually available"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def refund(self):
+        self.tokens += 1
+
+
+class ClientState:
+    """Buckets, fair-queue position and wait statistics of one client"""
+
+    __slots__ = ("key", "weight", "buckets", "finish", "queued", "calls", "throttled", "wait", "last_seen")
+
+    def __init__(self, key: str, weight: float):
+        self.key = key
+        self.weight = weight
+        self.buckets: Dict[Optional[str], TokenBucket] = {}
+        self.finish = 0.0
+        self.queued = 0
+        self.calls = 0
+        self.throttled = 0
+        self.wait = Histogram(WAIT_BUCKETS)
+        self.last_seen = time.monotonic()
+
+
+@dataclass(order=True)
+class _Waiter:
+    start: float
+    seq: int
+    tool: str = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class FairScheduler:
+    """Decides when each tool call may run, so no client can starve the others
+
+    ``install`` wraps the low-level ``tools/call`` handler (inside admission
+    control). Calls first take a token from their client's bucket, sleeping
+    while it refills, then wait for a free slot. Slots go to waiting calls
+    in start-time fair queuing order, so each client gets a share
+    proportional to its weight however many calls it sends. Clients are one
+    per session unless ``client_key`` maps sessions to shared keys.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[SchedulingPolicy] = None,
+        client_key: Optional[Callable[[ServerSession], str]] = None,
+    ):
+        self.policy = policy or SchedulingPolicy()
+        self.client_key = client_key
+        self.running = 0
+        self.throttled = 0
+        self.running_by_tool: Dict[str, int] = {}
+        self._clients: "OrderedDict[str, ClientState]" = OrderedDict()
+        self._session_keys: "weakref.WeakKeyDictionary[ServerSession, str]" = weakref.WeakKeyDictionary()
+        self._session_numbers = itertools.count(1)
+        self._queue: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+
+    def install(self, mcp: FastMCP):
+        """Schedule every tool call of a server"""
+        server = mcp._mcp_server
+        handlers = server.request_handlers
+        handler = handlers.get(types.CallToolRequest)
+        if handler is not None:
+            handlers[types.CallToolRequest] = self._wrap(server, handler)
+        return self
+
+    def _wrap(self, server, handler):
+        async def scheduled(req):
+            if req is None:
+                return await handler(req)
+            client = self._client(server.request_context.session)
+            tool = req.params.name
+            started = time.monotonic()
+            deadline = started + self.policy.max_wait
+            # Refuse at once rather than sleep past the caller's own deadline
+            deadline = min(deadline, request_deadline() or deadline)
+            await self._take_tokens(client, tool, deadline)
+            await self._acquire(client, tool, deadline)
+            client.wait.observe(time.monotonic() - started)
+            client.calls += 1
+            try:
+                return await handler(req)
+            finally:
+                self._release(tool)
+
+        return scheduled
+
+    def _client(self, session: ServerSession) -> ClientState:
+        key = self._session_keys.get(session)
+        if key is None:
+            if self.client_key is not None:
+                key = self.client_key(session)
+            else:
+                key = f"{_client_name(session)}#{next(self._session_numbers)}"
+            self._session_keys[session] = key
+        client = self._clients.get(key)
+        if client is None:
+            weight = self.policy.weights.get(_client_name(session), 1.0)
+            client = self._clients[key] = ClientState(key, weight)
+            self._forget_idle()
+        else:
+            self._clients.move_to_end(key)
+        client.last_seen = time.monotonic()
+        return client
+
+    def _forget_idle(self):
+        """Bound per-client state; idle clients come back with full buckets anyway"""
+        excess = len(self._clients) - self.policy.max_clients
+        for key in list(self._clients):
+            if excess <= 0:
+                break
+            if self._clients[key].queued == 0:
+                del self._clients[key]
+                excess -= 1
+
+    def busy_error(self, reason: str) -> types.ErrorData:
+        return types.ErrorData(
+            code=SERVER_BUSY,
+            message=f"Server busy: {reason}, retry later",
+            data={"retryAfter": self.policy.retry_after},
+        )
+
+    def _refuse(self, client: ClientState, reason: str):
+        client.throttled += 1
+        self.throttled += 1
+        raise McpError(self.busy_error(reason))
+
+    async def _take_tokens(self, client: ClientState, tool: str, deadline: float):
+        policy = self.policy
+        rates = [(None, policy.rate), (tool, policy.tool_rates.get(tool))]
+        reserved: List[TokenBucket] = []
+        delay = 0.0
+        for name, rate in rates:
+            if not rate:
+                continue
+            bucket = client.buckets.get(name)
+            if bucket is None:
+                bucket = client.buckets[name] = TokenBucket(rate, policy.burst)
+            delay = max(delay, bucket.reserve())
+            reserved.append(bucket)
+        if delay and time.monotonic() + delay > deadline:
+            for bucket in reserved:
+                bucket.refund()
+            self._refuse(client, f"rate limit for '{client.key}' exceeded")
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _has_slot(self, tool: str) -> bool:
+        limit = self.policy.max_concurrency
+        if limit is not None and self.running >= limit:
+            return False
+        tool_limit = self.policy.tool_concurrency.get(tool)
+        return tool_limit is None or self.running_by_tool.get(tool, 0) < tool_limit
+
+    async def _acquire(self, client: ClientState, tool: str, deadline: float):
+        start = max(self._virtual_time, client.finish)
+        client.finish = start + 1.0 / client.weight
+        waiter = _Waiter(start, next(self._sequence), tool, asyncio.get_running_loop().create_future())
+        heapq.heappush(self._queue, waiter)
+        self._dispatch()
+        if waiter.future.done():
+            return
+        client.queued += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), deadline - time.monotonic())
+        except BaseException as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as we gave up: hand the slot on
+                self._release(tool)
+            else:
+                waiter.future.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                self._refuse(client, f"no free slot for '{tool}' within {self.policy.max_wait}s")
+            raise
+        finally:
+            client.queued -= 1
+
+    def _dispatch(self):
+        """Grant free slots to waiting calls, lowest start tag first"""
+        blocked = []
+        while self._queue:
+            limit = self.policy.max_concurrency
+            if limit is not None and self.running >= limit:
+                break
+            waiter = heapq.heappop(self._queue)
+            if waiter.future.done():
+                continue
+            if not self._has_slot(waiter.tool):
+                blocked.append(waiter)
+                continue
+            self._virtual_time = max(self._virtual_time, waiter.start)
+            self.running += 1
+            self.running_by_tool[waiter.tool] = self.running_by_tool.get(waiter.tool, 0) + 1
+            waiter.future.set_result(None)
+        for waiter in blocked:
+            heapq.heappush(self._queue, waiter)
+
+    def _release(self, tool: str):
+        self.running -= 1
+        self.running_by_tool[tool] -= 1
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Calls, throttled calls, queue length and wait times per client"""
+        return {
+            key: {
+                "weight": client.weight,
+                "calls": client.calls,
+                "throttled": client.throttled,
+                "queued": client.queued,
+                "wait_seconds": {"sum": client.wait.sum, "count": client.wait.count},
+            }
+            for key, client in self._clients.items()
+        }
+
+    def gauges(self) -> Dict[str, Any]:
+        """Totals for ServerMetrics"""
+        return {
+            "scheduler_running": self.running,
+            "scheduler_queued": sum(not waiter.future.done() for waiter in self._queue),
+            "scheduler_clients": len(self._clients),
+            "scheduler_throttled_total": self.throttled,
+        }
+
+    def histograms(self) -> Dict[str, Tuple[str, Dict[str, Histogram]]]:
+        """Per-client wait before a call starts, for ServerMetrics"""
+        return {"scheduler_wait_seconds": ("client", {key: c.wait for key, c in self._clients.items()})}
+
+
+def _client_name(session: ServerSession) -> str:
+    params = session.client_params
+    return params.clientInfo.name if params and params.clientInfo else "client"
@@ -0,0 +1,99 @@
+"""
+Stdio server transport framing JSON-RPC lines with a pluggable JSON codec
+"""
+import sys
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import anyio
+import anyio.lowlevel
+import anyio.to_thread
+from fastmcp import FastMCP
+from mcp.server.lowlevel import NotificationOptions
+from mcp.shared.message import SessionMessage
+
+from ..common.codec import JSONCodec, get_codec
+from ..common.framing import LINE_FRAMING, FrameSplitter, StdioFraming, encode_batches
+
+
+@asynccontextmanager
+async def stdio_server(
+    codec: Optional[JSONCodec] = None,
+    stdin=None,
+    stdout=None,
+    framing: StdioFraming = LINE_FRAMING,
+):
+    """Drop-in for ``mcp.server.stdio.stdio_server`` that encodes with ``codec``
+
+    Lines are read and written as bytes, so orjson/msgspec parse them without
+    a text decode in between. With batched ``framing`` stdin is read in large
+    chunks and each batch of replies costs one write and one flush.
+    """
+    codec = codec or get_codec()
+    stdin = stdin or sys.stdin.buffer
+    stdout = stdout or sys.stdout.buffer
+
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+
+    async def deliver(line: bytes):
+        try:
+            message = codec.decode_message(line)
+        except Exception as exc:
+            await read_stream_writer.send(exc)
+            return
+        await read_stream_writer.send(SessionMessage(message))
+
+    async def stdin_reader():
+        try:
+            async with read_stream_writer:
+                if not framing.batched:
+                    async for line in anyio.wrap_file(stdin):
+                        if line.strip():
+                            await deliver(line)
+                    return
+                frames = FrameSplitter()
+                while True:
+                    chunk = await anyio.to_thread.run_sync(stdin.read1, framing.read_size)
+                    if not chunk:
+                        break
+                    for line in frames.feed(chunk):
+                        await deliver(line)
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    def write(data: bytes):
+        stdout.write(data)
+        stdout.flush()
+
+    async def stdout_writer():
+        try:
+            async with write_stream_reader:
+                async for data in encode_batches(write_stream_reader, codec, framing):
+                    await anyio.to_thread.run_sync(write, data)
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(stdin_reader)
+        tg.start_soon(stdout_writer)
+        yield read_stream, write_stream
+
+
+async def run_stdio_async(
+    mcp: FastMCP, codec: Optional[JSONCodec] = None, framing: StdioFraming = LINE_FRAMING
+):
+    """``FastMCP.run_stdio_async`` (without the banner) over the codec transport"""
+    server = mcp._mcp_server
+    async with mcp._lifespan_manager():
+        async with stdio_server(codec, framing=framing) as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(notification_options=NotificationOptions(tools_changed=True)),
+            )
+
+
+def run_stdio(mcp: FastMCP, codec: Optional[JSONCodec] = None, framing: StdioFraming = LINE_FRAMING):
+    """Serve ``mcp`` on stdin/stdout until the client closes the pipe"""
+    anyio.run(run_stdio_async, mcp, codec, framing)
@@ -0,0 +1,70 @@
+"""
+Streamed tool and resource results, sent chunk by chunk as progress notifications
+"""
+import functools
+import inspect
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, Optional
+
+from fastmcp.server.context import Context
+from fastmcp.server.dependencies import get_context
+
+# Request _meta flag a client sets (with a progressToken) to receive chunks
+STREAM_KEY = "stream"
+
+
+def streaming_context() -> Optional[Context]:
+    """Context of the current request if its client asked for a stream"""
+    try:
+        context = get_context()
+    except RuntimeError:
+        return None
+    meta = context.request_context.meta if context.request_context else None
+    if meta is None or meta.progressToken is None or not getattr(meta, STREAM_KEY, False):
+        return None
+    return context
+
+
+def streamed(fn: Callable[..., AsyncIterator[str]]) -> Callable:
+    """Let an async generator of text chunks back a tool or resource
+
+    Apply it below ``@mcp.tool()`` or ``@mcp.resource(...)``::
+
+        @mcp.tool()
+        @streamed
+        async def export(table: str):
+            async for row in read_rows(table):
+                yield row + "\\n"
+
+    A client that sends ``_meta.stream`` with a progress token gets each
+    chunk as the ``message`` of a ``notifications/progress`` as soon as it is
+    produced, then an empty reply, so neither side holds the whole output.
+    Other clients get the joined chunks as a single reply.
+    """
+    if not inspect.isasyncgenfunction(fn):
+        raise TypeError(f"'{fn.__name__}' must be an async generator function to be streamed")
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs) -> str:
+        context = streaming_context()
+        async with aclosing(fn(*args, **kwargs)) as chunks:
+            if context is None:
+                return "".join([_text(chunk) async for chunk in chunks])
+            sent = 0
+            async for chunk in chunks:
+                sent += 1
+                # Sending waits for the transport, so a slow reader pauses the generator
+                await context.report_progress(sent, message=_text(chunk))
+        return ""
+
+    # No return annotation: the reply is free-form text, not structured output
+    wrapper.__signature__ = inspect.signature(fn).replace(return_annotation=inspect.Signature.empty)
+    wrapper.__annotations__ = {k: v for k, v in fn.__annotations__.items() if k != "return"}
+    wrapper.streamed = True
+    return wrapper
+
+
+def _text(chunk) -> str:
+    if not isinstance(chunk, str):
+        raise TypeError(f"Streamed chunks must be str, got {type(chunk).__name__}")
+    return chunk
@@ -0,0 +1,53 @@
+"""
+Demo tool implementations, imported on first call by the lazy registry
+"""
+from fastmcp.exceptions import ToolError
+
+from .caching import cached_tool
+from .coalescing import coalesced
+from .execution import offload
+from .streaming import streamed
+
+
+@cached_tool(maxsize=1024)
+@coalesced
+def add(a: int, b: int) -> int:
+    """Add two numbers together"""
+    return a + b
+
+
+@cached_tool(maxsize=1024)
+@coalesced
+def multiply(a: int, b: int) -> int:
+    """Multiply two numbers"""
+    return a * b
+
+
+@cached_tool(maxsize=1024)
+@coalesced
+def greet(name: str) -> str:
+    """Greet someone by name"""
+    return f"Hello, {name}!"
+
+
+@streamed
+async def count(limit: int):
+    """Count from 1 to limit, one number per line (streamable)"""
+    for number in range(1, limit + 1):
+        yield f"{number}\n"
+
+
+
+@offload("process", timeout=30, max_pending=8)
+def count_primes(limit: int) -> int:
+    """Count the primes below limit (CPU-bound, runs in a worker process)"""
+    if not 0 <= limit <= 10_000_000:
+        raise ToolError("limit must be between 0 and 10000000")
+    if limit < 3:
+        return 0
+    sieve = bytearray([1]) * limit
+    sieve[0] = sieve[1] = 0
+    for n in range(2, int(limit**0.5) + 1):
+        if sieve[n]:
+            sieve[n * n :: n] = bytes(len(range(n * n, limit, n)))
+    return sum(sieve)
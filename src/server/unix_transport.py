@@ -0,0 +1,63 @@
+"""
+Unix domain socket server transport for co-located clients
+"""
+import os
+import stat
+from typing import Optional
+
+import anyio
+import anyio.abc
+from fastmcp import FastMCP
+from mcp.server.lowlevel import NotificationOptions
+
+from ..common.codec import JSONCodec, get_codec
+from ..common.framing import HIGH_THROUGHPUT, StdioFraming, framed_byte_stream
+
+
+def _remove_stale_socket(path: str):
+    """Unlink a socket left behind by a previous run; refuse to replace other files"""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise ValueError(f"{path} exists and is not a socket")
+    os.unlink(path)
+
+
+async def run_unix_async(
+    mcp: FastMCP,
+    path: str,
+    codec: Optional[JSONCodec] = None,
+    framing: StdioFraming = HIGH_THROUGHPUT,
+    task_status: anyio.abc.TaskStatus = anyio.TASK_STATUS_IGNORED,
+):
+    """Serve ``mcp`` on a Unix socket, one MCP session per connection
+
+    Sidecars skip TCP and HTTP entirely: messages are the same JSON lines
+    as stdio, batched by default. The socket is only accessible to the
+    owning user.
+    """
+    codec = codec or get_codec()
+    server = mcp._mcp_server
+    options = server.create_initialization_options(notification_options=NotificationOptions(tools_changed=True))
+
+    async def serve_connection(stream: anyio.abc.ByteStream):
+        async with stream, framed_byte_stream(stream, codec, framing) as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, options)
+
+    _remove_stale_socket(path)
+    async with mcp._lifespan_manager():
+        listener = await anyio.create_unix_listener(path)
+        try:
+            os.chmod(path, 0o600)
+            task_status.started()
+            await listener.serve(serve_connection)
+        finally:
+            await listener.aclose()
+            _remove_stale_socket(path)
+
+
+def run_unix(mcp: FastMCP, path: str, codec: Optional[JSONCodec] = None, framing: StdioFraming = HIGH_THROUGHPUT):
+    """Serve ``mcp`` on a Unix socket until interrupted"""
+    anyio.run(run_unix_async, mcp, path, codec, framing)